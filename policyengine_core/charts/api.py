@@ -1,6 +1,8 @@
-import requests
+from __future__ import annotations
+
 import time
-import plotly.graph_objects as go
+from typing import TYPE_CHECKING
+
 from .formatting import (
     DARK_GRAY,
     MEDIUM_DARK_GRAY,
@@ -10,6 +12,9 @@ from .formatting import (
     format_fig,
 )
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 
 def get_api_chart_data(
     country_id: str,
@@ -20,6 +25,8 @@ def get_api_chart_data(
     baseline_policy_id: int = None,
     version: str = None,
 ) -> dict:
+    import requests
+
     if baseline_policy_id is None or version is None:
         response = requests.get(
             f"https://api.policyengine.org/{country_id}/metadata",
@@ -54,6 +61,8 @@ def intra_decile_chart(
     time_period: str,
     baseline_policy_id: int = None,
 ) -> go.Figure:
+    import plotly.graph_objects as go
+
     impact = get_api_chart_data(
         country_id=country_id,
         reform_policy_id=reform_policy_id,
@@ -177,6 +186,8 @@ def decile_chart(
     time_period: str,
     baseline_policy_id: int = None,
 ) -> go.Figure:
+    import plotly.graph_objects as go
+
     impact = get_api_chart_data(
         country_id=country_id,
         reform_policy_id=reform_policy_id,
@@ -1,10 +1,13 @@
-import pandas as pd
+from __future__ import annotations
+
 from .formatting import *
-import plotly.express as px
-from microdf import MicroSeries
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from microdf import MicroSeries
+
 
 def bar_chart(
     data: pd.Series,
@@ -30,6 +33,7 @@ def bar_chart(
     Returns:
         go.Figure: A plotly figure.
     """
+    import plotly.express as px
 
     hover_text_labels = [
         (hover_text_function(index, value) if hover_text_function is not None else None)
@@ -75,6 +79,9 @@ def cross_section_bar_chart(
     color_discrete_map: dict = None,
     **kwargs,
 ):
+    import pandas as pd
+    import plotly.express as px
+
     df = pd.DataFrame()
     slices = [-np.inf, *slices, np.inf] if add_infinities else slices
     for i, lower, upper in zip(range(len(slices)), slices[:-1], slices[1:]):
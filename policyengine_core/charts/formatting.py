@@ -1,5 +1,10 @@
-import plotly.graph_objects as go
-from IPython.display import HTML
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from IPython.display import HTML
 
 GREEN = "#29d40f"
 LIGHT_GREEN = "#C5E1A5"
@@ -73,6 +78,8 @@ def format_fig(fig: go.Figure) -> go.Figure:
 
 
 def display_fig(fig: go.Figure) -> HTML:
+    from IPython.display import HTML
+
     return HTML(format_fig(fig).to_html(full_html=False, include_plotlyjs="cdn"))
 
 
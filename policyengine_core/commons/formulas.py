@@ -3,7 +3,6 @@ from typing import Any, Callable, Dict, List, Sequence, Type, TypeVar, Union
 
 import numpy
 import numpy as np
-import pandas as pd
 from numpy import logical_not as not_
 from numpy import maximum as max_
 from numpy import minimum as min_
@@ -12,6 +11,7 @@ from numpy import select, where
 
 from warnings import warn
 
+from policyengine_core.enums import Enum
 from policyengine_core.parameters.parameter_node import ParameterNode
 from policyengine_core.periods.period_ import Period
 from policyengine_core.populations.population import Population
@@ -56,6 +56,27 @@ def apply_thresholds(
 
     """
 
+    assert len(thresholds) in (len(choices), len(choices) - 1), " ".join(
+        [
+            "'apply_thresholds' must be called with the same number of",
+            "thresholds than choices, or one more choice.",
+        ]
+    )
+
+    threshold_array = numpy.asarray(thresholds)
+    table = _get_choice_table(choices)
+    if (
+        table is not None
+        and threshold_array.ndim == 1
+        and threshold_array.dtype.kind in "biuf"
+        and _is_numeric(input)
+        and numpy.all(threshold_array[1:] >= threshold_array[:-1])
+    ):
+        # The first threshold at or above each input is found by binary
+        # search. Inputs above every threshold (and NaN inputs) get the last
+        # choice, or 0 if there is none.
+        return table[numpy.searchsorted(threshold_array, input, side="left")]
+
     condlist: Sequence[ArrayType[bool]]
     condlist = [input <= threshold for threshold in thresholds]
 
@@ -64,13 +85,6 @@ def apply_thresholds(
         # must be true to return it.
         condlist += [True]
 
-    assert len(condlist) == len(choices), " ".join(
-        [
-            "'apply_thresholds' must be called with the same number of",
-            "thresholds than choices, or one more choice.",
-        ]
-    )
-
     return numpy.select(condlist, choices)
 
 
@@ -139,11 +153,64 @@ def switch(
         "'switch' must be called with at least one value."
     )
 
+    codes = _get_switch_codes(conditions, value_by_condition.keys())
+    table = _get_choice_table(value_by_condition.values())
+    if codes is not None and table is not None:
+        # Look each condition up in a table of the values by condition, with
+        # 0 for conditions matching no key.
+        indices = numpy.full(codes.max() - codes.min() + 1, len(codes))
+        # Assigned in reverse so that the first matching key wins, as in
+        # numpy.select.
+        indices[codes[::-1] - codes.min()] = numpy.arange(len(codes))[::-1]
+        offsets = conditions.view(numpy.ndarray).astype(numpy.int64) - codes.min()
+        in_range = (offsets >= 0) & (offsets < len(indices))
+        positions = indices[numpy.where(in_range, offsets, 0)]
+        return table[numpy.where(in_range, positions, len(codes))]
+
     condlist = [conditions == condition for condition in value_by_condition.keys()]
 
     return numpy.select(condlist, value_by_condition.values())
 
 
+# Largest number of table entries per key for which switch() uses a lookup
+# table rather than numpy.select.
+_SWITCH_TABLE_DENSITY = 16
+
+
+def _is_numeric(array: Any) -> bool:
+    return isinstance(array, numpy.ndarray) and array.dtype.kind in "biuf"
+
+
+def _get_choice_table(choices) -> Union[ArrayType[Any], None]:
+    """Build the array of scalar numeric ``choices`` followed by numpy.select's default 0, or None if the choices are not all scalar and numeric."""
+    choices = [numpy.asarray(choice) for choice in choices]
+    if any(choice.ndim != 0 or choice.dtype.kind not in "biuf" for choice in choices):
+        return None
+    default = numpy.asarray(0)
+    return numpy.array(choices + [default], dtype=numpy.result_type(*choices, default))
+
+
+def _get_switch_codes(conditions: Any, keys) -> Union[ArrayType[int], None]:
+    """Get the integer code of each switch key, or None if the conditions cannot be looked up in a table."""
+    if not isinstance(conditions, numpy.ndarray) or conditions.dtype.kind not in "iu":
+        return None
+    possible_values = getattr(conditions, "possible_values", None)
+    codes = []
+    for key in keys:
+        if isinstance(key, Enum):
+            if possible_values is None or type(key) is not possible_values:
+                return None
+            codes.append(key.index)
+        elif isinstance(key, (int, numpy.integer)):
+            codes.append(int(key))
+        else:
+            return None
+    codes = numpy.array(codes)
+    if codes.max() - codes.min() >= _SWITCH_TABLE_DENSITY * len(codes):
+        return None
+    return codes
+
+
 def for_each_variable(
     entity: Population,
     period: Period,
@@ -334,6 +401,8 @@ def between(
     Returns:
         ArrayLike: The resulting array.
     """
+    import pandas as pd
+
     return pd.Series(values).between(lower, upper, inclusive=inclusive)
 
 
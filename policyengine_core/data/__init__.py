@@ -1 +1 @@
-from .dataset import Dataset
+from .dataset import Dataset, DatasetArray
@@ -1,13 +1,12 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Dict, Union, List
-import h5py
+from typing import TYPE_CHECKING, Dict, Union, List
+import json
 import numpy as np
-import pandas as pd
 import shutil
-import requests
 import os
 import tempfile
-from policyengine_core.tools.hugging_face import *
 from policyengine_core.tools.google_cloud import (
     parse_gs_url,
     download_gcs_file,
@@ -16,6 +15,12 @@ from policyengine_core.tools.google_cloud import (
 import sys
 from policyengine_core.tools.win_file_manager import WindowsAtomicFileManager
 
+if TYPE_CHECKING:
+    # Slow to import, so imported by the methods using them (as are requests
+    # and huggingface_hub).
+    import h5py
+    import pandas as pd
+
 
 def atomic_write(file: Path, content: bytes) -> None:
     """
@@ -48,6 +53,28 @@ def atomic_write(file: Path, content: bytes) -> None:
                 raise
 
 
+class DatasetArray:
+    """
+    Function reading an array of a dataset, once: calls return the array read by the first one.
+
+    Simulations built from HDF5 datasets give their inputs as such functions to :meth:`.Holder.set_lazy_input`, so that arrays are only read if needed, and once for all the clones of a simulation.
+    """
+
+    def __init__(self, dataset: "Dataset", key: str):
+        """
+        :param dataset: The dataset to read the array from.
+        :param key: The key of the array, as given to :meth:`Dataset.load`.
+        """
+        self.dataset = dataset
+        self.key = key
+        self._values = None
+
+    def __call__(self) -> np.ndarray:
+        if self._values is None:
+            self._values = self.dataset.load(self.key)
+        return self._values
+
+
 class Dataset:
     """The `Dataset` class is a base class for datasets used directly or indirectly for microsimulation models.
     A dataset defines a generation function to create it from other data, and this class provides common features
@@ -58,7 +85,7 @@ class Dataset:
     label: str = None
     """The label of the dataset. This is used for logging and is used as the key in the `datasets` dictionary."""
     data_format: str = None
-    """The format of the dataset. This can be either `Dataset.ARRAYS`, `Dataset.TIME_PERIOD_ARRAYS` or `Dataset.TABLES`. If `Dataset.ARRAYS`, the dataset is stored as a collection of arrays. If `Dataset.TIME_PERIOD_ARRAYS`, the dataset is stored as a collection of arrays, with one array per time period. If `Dataset.TABLES`, the dataset is stored as a collection of tables (DataFrames)."""
+    """The format of the dataset. This can be either `Dataset.ARRAYS`, `Dataset.TIME_PERIOD_ARRAYS`, `Dataset.ARRAY_DIRECTORY` or `Dataset.TABLES`. If `Dataset.ARRAYS`, the dataset is stored as a collection of arrays. If `Dataset.TIME_PERIOD_ARRAYS`, the dataset is stored as a collection of arrays, with one array per time period. If `Dataset.ARRAY_DIRECTORY`, the dataset is a directory of `.npy` files, one per variable and time period, listed by an `index.json` file, which are loaded as memory-mapped arrays. If `Dataset.TABLES`, the dataset is stored as a collection of tables (DataFrames)."""
     file_path: Path = None
     """The path to the dataset file. This is used to load the dataset from a file."""
     time_period: str = None
@@ -71,8 +98,14 @@ class Dataset:
     ARRAYS = "arrays"
     TIME_PERIOD_ARRAYS = "time_period_arrays"
     FLAT_FILE = "flat_file"
+    ARRAY_DIRECTORY = "array_directory"
+
+    INDEX_FILE_NAME = "index.json"
+    """The name of the file listing the arrays of `Dataset.ARRAY_DIRECTORY` datasets: it maps each variable to the path of its array for each time period, relative to the directory."""
 
     _table_cache: Dict[str, pd.DataFrame] = None
+    _index: Dict[str, Dict[str, str]] = None
+    # Index of `Dataset.ARRAY_DIRECTORY` datasets, read once.
 
     def __init__(self, require: bool = False):
         # Setup dataset
@@ -97,6 +130,7 @@ class Dataset:
             Dataset.ARRAYS,
             Dataset.TIME_PERIOD_ARRAYS,
             Dataset.FLAT_FILE,
+            Dataset.ARRAY_DIRECTORY,
         ], (
             f"You tried to instantiate a Dataset object, but your data_format attribute is invalid ({self.data_format})."
         )
@@ -111,9 +145,10 @@ class Dataset:
 
     def load(
         self, key: str = None, mode: str = "r"
-    ) -> Union[h5py.File, np.array, pd.DataFrame, pd.HDFStore]:
+    ) -> Union[h5py.File, np.array, pd.DataFrame, pd.HDFStore, dict]:
         """Loads the dataset for a given year, returning a H5 file reader. You can then access the
-        dataset like a dictionary (e.g.e Dataset.load(2022)["variable"]).
+        dataset like a dictionary (e.g.e Dataset.load(2022)["variable"]). Array directory datasets
+        are returned as dicts of memory-mapped arrays by variable and time period.
 
         Args:
             key (str, optional): The key to load. Defaults to None.
@@ -124,6 +159,8 @@ class Dataset:
         """
         file = self.file_path
         if self.data_format in (Dataset.ARRAYS, Dataset.TIME_PERIOD_ARRAYS):
+            import h5py
+
             if key is None:
                 # If no key provided, return the basic H5 reader.
                 return h5py.File(file, mode=mode)
@@ -133,6 +170,8 @@ class Dataset:
                     values = np.array(f[key])
                 return values
         elif self.data_format == Dataset.TABLES:
+            import pandas as pd
+
             if key is None:
                 # Non-openfisca datasets are assumed to be of the format (table name: [table], ...).
                 return pd.HDFStore(file)
@@ -144,7 +183,31 @@ class Dataset:
                     values = f[key]
                 self._table_cache[key] = values
                 return values
+        elif self.data_format == Dataset.ARRAY_DIRECTORY:
+            # Memory-mapped, so that values are only read from disk when
+            # used, and processes loading the same dataset share its pages.
+            # Read-only datasets are mapped copy-on-write, so that arrays
+            # can still be modified in memory, as those read from H5 files.
+            mmap_mode = "c" if mode == "r" else "r+"
+            index = self._load_index()
+            if key is None:
+                return {
+                    variable: {
+                        time_period: np.load(file / path, mmap_mode=mmap_mode)
+                        for time_period, path in paths.items()
+                    }
+                    for variable, paths in index.items()
+                }
+            variable, _, time_period = key.partition("/")
+            if not time_period:
+                return {
+                    time_period: np.load(file / path, mmap_mode=mmap_mode)
+                    for time_period, path in index[variable].items()
+                }
+            return np.load(file / index[variable][time_period], mmap_mode=mmap_mode)
         elif self.data_format == Dataset.FLAT_FILE:
+            import pandas as pd
+
             if key is None:
                 return pd.read_csv(file)
             else:
@@ -165,15 +228,30 @@ class Dataset:
         """
         file = self.file_path
         if self.data_format in (Dataset.ARRAYS, Dataset.TIME_PERIOD_ARRAYS):
+            import h5py
+
             with h5py.File(file, "a") as f:
                 # Overwrite if existing
                 if key in f:
                     del f[key]
                 f.create_dataset(key, data=values)
         elif self.data_format == Dataset.TABLES:
+            import pandas as pd
+
             with pd.HDFStore(file, "a") as f:
                 f.put(key, values)
             self._table_cache = {}
+        elif self.data_format == Dataset.ARRAY_DIRECTORY:
+            variable, _, time_period = key.partition("/")
+            if not time_period:
+                raise ValueError(
+                    f"Keys of array directory datasets must be of the form variable/time_period, not {key}."
+                )
+            index = self._load_index() if self.exists else {}
+            index.setdefault(variable, {})[time_period] = self._save_array(
+                variable, time_period, values
+            )
+            self._save_index(index)
         elif self.data_format == Dataset.FLAT_FILE:
             values.to_csv(file, index=False)
         else:
@@ -203,6 +281,8 @@ class Dataset:
             for table_name, dataframe in data.items():
                 self.save(table_name, dataframe)
         elif self.data_format == Dataset.TIME_PERIOD_ARRAYS:
+            import h5py
+
             with h5py.File(file, "w") as f:
                 for variable, values in data.items():
                     for time_period, value in values.items():
@@ -217,6 +297,8 @@ class Dataset:
                                 f"Could not save {key} to {file}. The value is {value}."
                             )
         elif self.data_format == Dataset.ARRAYS:
+            import h5py
+
             with h5py.File(file, "a" if file.exists() else "w") as f:
                 for variable, value in data.items():
                     # Overwrite if existing
@@ -228,9 +310,46 @@ class Dataset:
                         raise ValueError(
                             f"Could not save {variable} to {file}. The value is {value}."
                         )
+        elif self.data_format == Dataset.ARRAY_DIRECTORY:
+            self.remove()
+            index = {
+                variable: {
+                    time_period: self._save_array(variable, time_period, value)
+                    for time_period, value in values.items()
+                }
+                for variable, values in data.items()
+            }
+            self._save_index(index)
         elif self.data_format == Dataset.FLAT_FILE:
             data.to_csv(file, index=False)
 
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        if self._index is None:
+            with open(self.file_path / Dataset.INDEX_FILE_NAME) as f:
+                self._index = json.load(f)
+        return self._index
+
+    def _save_index(self, index: Dict[str, Dict[str, str]]) -> None:
+        # Written last, and atomically, so that readers never see arrays
+        # that are not written yet.
+        self.file_path.mkdir(parents=True, exist_ok=True)
+        atomic_write(
+            self.file_path / Dataset.INDEX_FILE_NAME, json.dumps(index).encode()
+        )
+        self._index = index
+
+    def _save_array(self, variable: str, time_period: str, values) -> str:
+        values = np.asarray(values)
+        if values.dtype == object:
+            # Object arrays cannot be memory-mapped.
+            values = values.astype(str)
+        # Colons of periods such as month:2022-01:3 are invalid in Windows
+        # file names.
+        path = f"{variable}/{str(time_period).replace(':', '_')}.npy"
+        (self.file_path / variable).mkdir(parents=True, exist_ok=True)
+        np.save(self.file_path / path, values, allow_pickle=False)
+        return path
+
     def load_dataset(
         self,
     ):
@@ -241,9 +360,13 @@ class Dataset:
         """
         file = self.file_path
         if self.data_format == Dataset.TABLES:
+            import pandas as pd
+
             with pd.HDFStore(file) as f:
                 data = {table_name: f[table_name] for table_name in f.keys()}
         elif self.data_format == Dataset.TIME_PERIOD_ARRAYS:
+            import h5py
+
             with h5py.File(file, "r") as f:
                 data = {}
                 for variable in f.keys():
@@ -252,8 +375,12 @@ class Dataset:
                         key = f"{variable}/{time_period}"
                         data[variable][time_period] = np.array(f[key])
         elif self.data_format == Dataset.ARRAYS:
+            import h5py
+
             with h5py.File(file, "r") as f:
                 data = {variable: np.array(f[variable]) for variable in f.keys()}
+        elif self.data_format == Dataset.ARRAY_DIRECTORY:
+            data = self.load()
         return data
 
     def generate(self):
@@ -283,12 +410,20 @@ class Dataset:
             List[str]: The variables in the dataset.
         """
         if self.data_format == Dataset.TABLES:
+            import pandas as pd
+
             with pd.HDFStore(self.file_path) as f:
                 return list(f.keys())
         elif self.data_format in (Dataset.ARRAYS, Dataset.TIME_PERIOD_ARRAYS):
+            import h5py
+
             with h5py.File(self.file_path, "r") as f:
                 return list(f.keys())
+        elif self.data_format == Dataset.ARRAY_DIRECTORY:
+            return list(self._load_index())
         elif self.data_format == Dataset.FLAT_FILE:
+            import pandas as pd
+
             return pd.read_csv(self.file_path, nrows=0).columns.tolist()
         else:
             raise ValueError(
@@ -332,6 +467,7 @@ class Dataset:
         Args:
             url (str): The url to download.
         """
+        import requests
 
         if url is None:
             url = self.url
@@ -371,6 +507,8 @@ class Dataset:
                     f"File {file_path} not found in release {release_tag} of {org}/{repo}."
                 )
         elif url.startswith("hf://"):
+            from policyengine_core.tools.hugging_face import parse_hf_url
+
             owner_name, model_name, file_name, hf_version = parse_hf_url(url)
             self.download_from_huggingface(
                 owner_name, model_name, file_name, hf_version or version
@@ -420,6 +558,8 @@ class Dataset:
             url = self.url
 
         if url.startswith("hf://"):
+            from policyengine_core.tools.hugging_face import parse_hf_url
+
             owner_name, model_name, file_name, _ = parse_hf_url(url)
             self.upload_to_huggingface(owner_name, model_name, file_name)
         elif url.startswith("gs://"):
@@ -437,14 +577,18 @@ class Dataset:
     def remove(self):
         """Removes the dataset from disk."""
         if self.exists:
-            self.file_path.unlink()
+            if self.file_path.is_dir():
+                shutil.rmtree(self.file_path)
+                self._index = None
+            else:
+                self.file_path.unlink()
 
     @staticmethod
     def from_file(file_path: str, time_period: str = None):
         """Creates a dataset from a file.
 
         Args:
-            file_path (str): The file path to create the dataset from.
+            file_path (str): The file path to create the dataset from: a H5 or CSV file, or the directory of an array directory dataset.
 
         Returns:
             Dataset: The dataset.
@@ -454,6 +598,8 @@ class Dataset:
         # If it's a h5 file, check the first key
 
         if file_path.suffix == ".h5":
+            import h5py
+
             with h5py.File(file_path, "r") as f:
                 first_key = list(f.keys())[0]
                 first_value = f[first_key]
@@ -464,6 +610,13 @@ class Dataset:
                     subkeys = list(first_value.keys())
                     if len(subkeys) > 0:
                         time_period = subkeys[0]
+        elif (file_path / Dataset.INDEX_FILE_NAME).exists():
+            data_format = Dataset.ARRAY_DIRECTORY
+            with open(file_path / Dataset.INDEX_FILE_NAME) as f:
+                index = json.load(f)
+            time_periods = list(next(iter(index.values()), {}))
+            if len(time_periods) > 0:
+                time_period = time_periods[0]
         else:
             data_format = Dataset.FLAT_FILE
         dataset = type(
@@ -509,6 +662,9 @@ class Dataset:
             owner_name (str): The owner name.
             model_name (str): The model name.
         """
+        from huggingface_hub import HfApi
+
+        from policyengine_core.tools.hugging_face import get_or_prompt_hf_token
 
         print(
             f"Uploading to HuggingFace {owner_name}/{model_name}/{file_name}",
@@ -539,6 +695,7 @@ class Dataset:
             owner_name (str): The owner name.
             model_name (str): The model name.
         """
+        from policyengine_core.tools.hugging_face import download_huggingface_dataset
 
         print(
             f"Downloading from HuggingFace {owner_name}/{model_name}/{file_name}",
@@ -7,6 +7,7 @@ from numpy.typing import ArrayLike
 from policyengine_core import periods
 from policyengine_core.enums import EnumArray
 from policyengine_core.periods import Period
+from policyengine_core.pickling import pickleable_class
 
 
 class OnDiskStorage:
@@ -46,6 +47,17 @@ class OnDiskStorage:
         clone._storage_dir_owner = getattr(self, "_storage_dir_owner", self)
         return clone
 
+    def __getstate__(self) -> dict:
+        # Unpickled copies read the same files, in this process or another one
+        # on the same machine, but never remove them: the original does.
+        state = self.__dict__.copy()
+        state["preserve_storage_dir"] = True
+        state.pop("_storage_dir_owner", None)
+        state["_enums"] = {
+            path: pickleable_class(enum) for path, enum in self._enums.items()
+        }
+        return state
+
     def _decode_file(self, file: str) -> ArrayLike:
         enum = self._enums.get(file)
         if enum is not None:
@@ -39,6 +39,49 @@ class Enum(enum.Enum):
         )
         return sorted_names_arr, sorted_indices
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_item_lookup_arrays(cls) -> Tuple[np.ndarray, np.ndarray]:
+        """Build cached arrays of the sorted ids of the items and their indices, to encode item arrays."""
+        items = list(cls)
+        ids = np.array([id(item) for item in items], dtype=np.uintp)
+        order = np.argsort(ids)
+        indices = np.array([item.index for item in items], dtype=ENUM_ARRAY_DTYPE)
+        return ids[order], indices[order]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_decoding_arrays(cls) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build cached index -> item and index -> name arrays, to decode EnumArrays with a single fancy index.
+
+        Both arrays have one more element than the enum, holding the value decoded for unknown indices.
+        """
+        items = list(cls)
+        decoded_items = np.empty(len(items) + 1, dtype=object)
+        decoded_names = np.array([item.name for item in items] + ["unknown"])
+        for item in items:
+            decoded_items[item.index] = item
+        decoded_items[len(items)] = 0
+        return decoded_items, decoded_names
+
+    @classmethod
+    def _encode_items(cls, array) -> np.ndarray:
+        """Get the indices of an array of Enum items, matching them by identity."""
+        items = np.asarray(array, dtype=object)
+        item_ids = np.fromiter(map(id, items.flat), dtype=np.uintp, count=items.size)
+        sorted_ids, sorted_indices = cls._get_item_lookup_arrays()
+        positions = np.clip(
+            np.searchsorted(sorted_ids, item_ids), 0, len(sorted_ids) - 1
+        )
+        matches = sorted_ids[positions] == item_ids
+        indices = sorted_indices[positions]
+        if not matches.all():
+            # Items of other enums keep their own index.
+            flat_items = items.ravel()
+            indices[~matches] = [item.index for item in flat_items[~matches]]
+        return indices.reshape(items.shape)
+
     @classmethod
     def encode(cls, array: Union[EnumArray, np.ndarray]) -> EnumArray:
         """
@@ -74,8 +117,7 @@ class Enum(enum.Enum):
         else:
             first_elem = None
         if first_elem is not None and isinstance(first_elem, Enum):
-            indices = np.array([item.index for item in array], dtype=ENUM_ARRAY_DTYPE)
-            return EnumArray(indices, cls)
+            return EnumArray(cls._encode_items(array), cls)
 
         # Convert fixed-width byte strings, as returned by h5py for string
         # datasets, to Unicode before matching enum names.
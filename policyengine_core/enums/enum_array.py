@@ -5,6 +5,8 @@ from typing import Any, NoReturn, Optional, Type
 
 import numpy
 
+from policyengine_core.pickling import pickleable_class
+
 if typing.TYPE_CHECKING:
     from policyengine_core.enums import Enum
 
@@ -77,10 +79,8 @@ class EnumArray(numpy.ndarray):
 
         Decoded value: enum item
         """
-        return numpy.select(
-            [self == item.index for item in self.possible_values],
-            list(self.possible_values),
-        )
+        decoded_items, _ = self.possible_values._get_decoding_arrays()
+        return decoded_items[self._lookup_indices(len(decoded_items) - 1)]
 
     def decode_to_str(self) -> numpy.str_:
         """
@@ -94,10 +94,26 @@ class EnumArray(numpy.ndarray):
         >>> enum_array.decode_to_str()[0]
         'free_lodger'  # String identifier
         """
-        return numpy.select(
-            [self == item.index for item in self.possible_values],
-            [str(item.name) for item in self.possible_values],
-            default="unknown",
+        _, decoded_names = self.possible_values._get_decoding_arrays()
+        return decoded_names[self._lookup_indices(len(decoded_names) - 1)]
+
+    def _lookup_indices(self, unknown_index: int) -> numpy.ndarray:
+        # Indices into the decoding arrays of the enum, whose last element is
+        # used for indices matching no item.
+        indices = self.view(numpy.ndarray)
+        known = (indices >= 0) & (indices < unknown_index)
+        if indices.dtype.kind not in "iu":
+            # Aggregated EnumArrays can hold non-integer values.
+            known &= indices == numpy.floor(indices)
+        return numpy.where(known, indices, unknown_index).astype(numpy.intp, copy=False)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # ndarray pickles drop `possible_values`. The encoded values are
+        # pickled as a plain array, so that protocol 5 can leave them out of
+        # band.
+        return EnumArray, (
+            self.view(numpy.ndarray),
+            pickleable_class(self.possible_values),
         )
 
     def __repr__(self) -> str:
@@ -1,9 +1,8 @@
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, List, Tuple
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
 
 import numpy
-import psutil
 from numpy.typing import ArrayLike
 
 from policyengine_core import commons, periods, tools
@@ -17,11 +16,21 @@ if TYPE_CHECKING:
     from policyengine_core.variables import Variable
 
 
+def _get_memory_occupation_pc() -> float:
+    import psutil
+
+    return psutil.virtual_memory().percent
+
+
 class Holder:
     """
     A holder keeps tracks of a variable values after they have been calculated, or set as an input.
     """
 
+    _lazy_inputs: Tuple[Tuple[Period, Callable[[], ArrayLike], str], ...] = ()
+    # Inputs set with set_lazy_input and not read yet: period, function
+    # returning the values, and branch.
+
     def __init__(self, variable: "Variable", population: "Population"):
         self.population = population
         self.variable = variable
@@ -94,6 +103,7 @@ class Holder:
         If ``period`` is not ``None``, only remove all values for any period included in period (e.g. if period is "2017", values for "2017-01", "2017-07", etc. would be removed)
         """
 
+        self.load_lazy_inputs()
         self._memory_storage.delete(period, branch_name)
         if self._disk_storage:
             self._disk_storage.delete(period, branch_name)
@@ -114,6 +124,7 @@ class Holder:
         """
         if self.variable.is_neutralized:
             return self.default_array()
+        self.load_lazy_inputs()
         value = self._get_array_from_storage(period, branch_name)
         if value is not None:
             return value
@@ -167,6 +178,7 @@ class Holder:
         >>>    }
         """
 
+        self.load_lazy_inputs()
         usage = dict(
             nb_cells_by_array=self.population.count,
             dtype=self.variable.dtype,
@@ -193,16 +205,22 @@ class Holder:
         """
         Get the list of periods the variable value is known for.
         """
-
+        self.load_lazy_inputs()
         return list(self._memory_storage.get_known_periods()) + list(
             (self._disk_storage.get_known_periods() if self._disk_storage else [])
         )
 
+    def has_values(self) -> bool:
+        """
+        Whether the variable value is known for any period, including inputs set with :meth:`set_lazy_input` and not read yet.
+        """
+        return bool(self._lazy_inputs) or len(self.get_known_periods()) > 0
+
     def get_known_branch_periods(self) -> List[Tuple[str, Period]]:
         """
         Get the list of periods the variable value is known for.
         """
-
+        self.load_lazy_inputs()
         return list(self._memory_storage.get_known_branch_periods()) + list(
             (
                 self._disk_storage.get_known_branch_periods()
@@ -273,6 +291,37 @@ class Holder:
             if simulation is not None:
                 simulation._user_input_contexts.pop()
 
+    def set_lazy_input(
+        self,
+        period: Period,
+        load: Callable[[], ArrayLike],
+        branch_name: str = "default",
+    ) -> None:
+        """
+        Set a variable's value for a given period to the array returned by ``load``, called the first time the holder's values are needed.
+
+        The value is then set as by :meth:`set_input`, so it only counts as a user input (see ``Simulation._user_input_keys``) from then on.
+
+        :param period: the period at which the value is set
+        :param load: function returning the input value, e.g. reading it from a dataset file
+        """
+        self._lazy_inputs = (
+            *self._lazy_inputs,
+            (periods.period(period), load, branch_name),
+        )
+
+    def load_lazy_inputs(self) -> None:
+        """
+        Set the values given to :meth:`set_lazy_input` that are not set yet.
+        """
+        lazy_inputs = self._lazy_inputs
+        if not lazy_inputs:
+            return
+        # Clones share the tuple, so it is replaced rather than emptied.
+        self._lazy_inputs = ()
+        for period, load, branch_name in lazy_inputs:
+            self.set_input(period, load(), branch_name)
+
     def _raise_if_input_contains_nan(self, value: ArrayLike) -> None:
         if self.variable.value_type not in (float, int):
             return
@@ -336,6 +385,7 @@ class Holder:
         branch_name: str = "default",
         validate_nan: bool = False,
     ) -> None:
+        self.load_lazy_inputs()
         simulation = getattr(self, "simulation", None)
         user_input_contexts = getattr(simulation, "_user_input_contexts", None)
         if user_input_contexts and branch_name == "default":
@@ -350,7 +400,7 @@ class Holder:
         should_store_on_disk = (
             self._on_disk_storable
             and self._memory_storage.get(period, branch_name) is None
-            and psutil.virtual_memory().percent  # If there is already a value in memory, replace it and don't put a new value in the disk storage
+            and _get_memory_occupation_pc()  # If there is already a value in memory, replace it and don't put a new value in the disk storage
             >= self.simulation.memory_config.max_memory_occupation_pc
         )
 
@@ -11,7 +11,7 @@ from .config import (
     date_constructor,
     dict_no_duplicate_constructor,
 )
-from .helpers import contains_nan, load_parameter_file
+from .helpers import contains_nan, load_parameter_directory, load_parameter_file
 from .operations import (
     homogenize_parameter_structures,
     interpolate_parameters,
@@ -21,7 +21,7 @@ from .operations import (
 )
 from .parameter import Parameter
 from .parameter_at_instant import ParameterAtInstant
-from .parameter_node import ParameterNode
+from .parameter_node import ParameterNode, ParameterUpdateBatch
 from .parameter_node_at_instant import ParameterNodeAtInstant
 from .parameter_scale import ParameterScale
 from .parameter_scale_bracket import ParameterScaleBracket
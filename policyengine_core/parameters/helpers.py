@@ -1,6 +1,10 @@
 import os
+import time
 import traceback
 import warnings
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 
 import numpy
 
@@ -33,6 +37,187 @@ def load_parameter_file(file_path, name=""):
     return _parse_child(name, data, file_path)
 
 
+def load_parameter_directory(
+    directory_path, name="", max_workers=None, use_processes=False
+):
+    """
+    Load a directory of YAML parameter files, parsing the files concurrently.
+
+    All the files are listed first and parsed in a thread pool (suited to slow storage) or, if ``use_processes`` is set, a process pool (suited to CPU-bound parsing). The tree is then assembled exactly as :class:`.ParameterNode` does from a directory. Errors parsing a file are raised when assembly reaches it, so if several files are invalid, the error raised is the one sequential loading would have raised.
+
+    :returns: An instance of :class:`.ParameterNode`.
+    """
+    file_paths = _list_parameter_files(directory_path)
+    parsed_files = _load_yaml_files(file_paths, max_workers, use_processes)
+    return parameters.ParameterNode(
+        name, directory_path=directory_path, parsed_files=parsed_files
+    )
+
+
+def _list_parameter_files(directory_path):
+    """List the YAML files read by ``ParameterNode(directory_path=...)``, in the order it reads them."""
+    excluded_names = parameters.parameter_node.EXCLUDED_PARAMETER_CHILD_NAMES
+    file_paths = []
+    for child_name in sorted(os.listdir(directory_path)):
+        child_path = os.path.join(directory_path, child_name)
+        if os.path.isfile(child_path):
+            child_name, ext = os.path.splitext(child_name)
+            if ext in config.FILE_EXTENSIONS and (
+                child_name == "index" or child_name not in excluded_names
+            ):
+                file_paths.append(child_path)
+        elif os.path.isdir(child_path):
+            file_paths.extend(_list_parameter_files(child_path))
+    return file_paths
+
+
+def _load_yaml_files(file_paths, max_workers=None, use_processes=False):
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    executor = executor_class(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(_load_yaml_file, file_path) for file_path in file_paths
+        ]
+        # Errors are kept as the files' contents, to be raised during
+        # assembly, after any raised by the files assembled before them.
+        parsed_files = {}
+        for file_path, future in zip(file_paths, futures):
+            try:
+                parsed_files[file_path] = future.result()
+            except Exception as error:
+                parsed_files[file_path] = error
+        return parsed_files
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _instants_to_dates(instants):
+    """Convert an array of instants to a ``datetime64[D]`` array.
+
+    Accepts ``datetime64`` arrays, integer years, ``YYYY-MM-DD`` strings, or
+    anything :func:`periods.instant` understands (dates, ``Instant`` objects...).
+    """
+    array = numpy.asarray(instants)
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[D]", copy=False)
+    if array.dtype.kind in "iu" and array.ndim == 1:
+        return (array - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+    if array.dtype.kind in "US":
+        return array.astype("datetime64[D]")
+    return numpy.array(
+        [str(periods.instant(instant)) for instant in instants],
+        dtype="datetime64[D]",
+    )
+
+
+def _values_to_array(values):
+    """Pack parameter values into an array, numeric where possible."""
+    if all(isinstance(value, (int, float)) for value in values):
+        return numpy.array(values)
+    array = numpy.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def _evict_instants(cache: dict, start: str = None, stop: str = None) -> None:
+    """Remove the entries of an at-instant cache from `start` (included) to `stop` (excluded)."""
+    if start is None and stop is None:
+        cache.clear()
+        return
+    for instant in list(cache):
+        instant_str = str(instant)
+        if (start is None or instant_str >= start) and (
+            stop is None or instant_str < stop
+        ):
+            del cache[instant]
+
+
+def _add_sharer(child, node) -> None:
+    """Record that ``node`` shares ``child`` with another tree, without owning it yet."""
+    sharers = child.__dict__.setdefault("_sharers", [])
+    if len(sharers) % 32 == 31:
+        sharers[:] = [sharer for sharer in sharers if sharer() is not None]
+    sharers.append(weakref.ref(node))
+
+
+def _remove_sharer(child, node) -> None:
+    sharers = child.__dict__.get("_sharers")
+    if sharers:
+        sharers[:] = [sharer for sharer in sharers if sharer() not in (None, node)]
+
+
+def _get_update_batch(item):
+    """Get the :class:`.ParameterUpdateBatch` open on ``item`` or one of its ancestors, if any."""
+    while item is not None:
+        batch = item.__dict__.get("_update_batch")
+        if batch is not None:
+            return batch
+        item = getattr(item, "parent", None)
+    return None
+
+
+def _freeze_at_instants(item) -> None:
+    """
+    Make the nodes at instant already built from the ancestors of ``item`` (a parameter, scale or node) keep its current state.
+
+    Nodes at instant resolve their children the first time they are accessed (see :class:`.ParameterNodeAtInstant`): the child leading to ``item`` is resolved in each of them before ``item`` is modified, from the root down (resolving a child builds the nodes at instant of the next level), as are all the children of the nodes at instant of ``item`` itself if it is a node.
+    """
+    path = [item]
+    while getattr(path[-1], "parent", None) is not None:
+        path.append(path[-1].parent)
+    for child, parent in reversed(list(zip(path, path[1:]))):
+        if isinstance(parent, parameters.ParameterNode):
+            nodes_at_instant = _get_nodes_at_instant(parent)
+            name = _get_child_name(parent, child) if nodes_at_instant else None
+            if name is not None:
+                for node_at_instant in nodes_at_instant:
+                    node_at_instant._resolve_child(name)
+    if isinstance(item, parameters.ParameterNode):
+        for node_at_instant in _get_nodes_at_instant(item):
+            node_at_instant._children
+
+
+def _get_nodes_at_instant(node) -> list:
+    # Without the tracing wrappers the cache may hold.
+    return [
+        node_at_instant.__dict__.get("parameter_node_at_instant", node_at_instant)
+        for node_at_instant in node.__dict__.get("_at_instant_cache", {}).values()
+    ]
+
+
+def _get_child_name(node, child) -> Optional[str]:
+    children = node.__dict__.get("_shared_children")
+    if children is None:
+        children = node.__dict__["children"]
+    name = child.name.rsplit(".", 1)[-1]
+    if children.get(name) is child:
+        return name
+    return next((name for name, other in children.items() if other is child), None)
+
+
+def _unshare(item) -> None:
+    """
+    Prepare ``item`` (a parameter, scale or node) to be modified in place.
+
+    Nodes at instant built from its ancestors keep its current values (see :func:`_freeze_at_instants`), and every tree still sharing ``item`` or one of its ancestors (see :meth:`.ParameterNode.clone`) gets its own copy of them first, from the root down, so that it keeps their current state.
+    """
+    _freeze_at_instants(item)
+    path = []
+    while item is not None:
+        path.append(item)
+        item = getattr(item, "parent", None)
+    for item in reversed(path):
+        for sharer in item.__dict__.pop("_sharers", ()):
+            node = sharer()
+            shared_children = (
+                {} if node is None else node.__dict__.get("_shared_children", {})
+            )
+            for name, child in list(shared_children.items()):
+                if child is item:
+                    node._get_own_child(name)
+
+
 def _compose_name(path, child_name=None, item_name=None):
     if not path:
         return child_name
@@ -42,7 +227,22 @@ def _compose_name(path, child_name=None, item_name=None):
         return "{}[{}]".format(path, item_name)
 
 
+_yaml_load_durations = None
+"""If a dict, :func:`_load_yaml_file` records in it how long parsing each file took, by path. Set while profiling the construction of a tax-benefit system (see :class:`.StartupProfile`). Files parsed in other processes are not recorded."""
+
+
 def _load_yaml_file(file_path):
+    durations = _yaml_load_durations
+    if durations is None:
+        return _parse_yaml_file(file_path)
+    start = time.perf_counter()
+    try:
+        return _parse_yaml_file(file_path)
+    finally:
+        durations[str(file_path)] = time.perf_counter() - start
+
+
+def _parse_yaml_file(file_path):
     with open(file_path, "r", encoding="utf-8") as f:
         try:
             return config.yaml.load(f, Loader=config.Loader)
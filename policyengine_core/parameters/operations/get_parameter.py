@@ -12,22 +12,4 @@ def get_parameter(root: ParameterNode, parameter: str) -> Parameter:
     Returns:
         Parameter: The parameter.
     """
-    node = root
-    for name in parameter.split("."):
-        try:
-            if "[" not in name:
-                node = node.children[name]
-            else:
-                try:
-                    name, index = name.split("[")
-                    index = int(index[:-1])
-                    node = node.children[name].brackets[index]
-                except:
-                    raise ValueError(
-                        "Invalid bracket syntax (should be e.g. tax.brackets[3].rate"
-                    )
-        except:
-            raise ValueError(
-                f"Could not find the parameter {parameter} (failed at {name})."
-            )
-    return node
+    return root.get_child(parameter)
@@ -122,9 +122,12 @@ def homogenize_parameter_node(
         )
     for child in node.children:
         if further_breakdown:
-            node.children[child] = homogenize_parameter_node(
+            homogenized_child = homogenize_parameter_node(
                 node.children[child], breakdown[1:], variables, default_value
             )
+            if homogenized_child is not node.children[child]:
+                node.children[child] = homogenized_child
+                node.clear_path_index()
     return node
 
 
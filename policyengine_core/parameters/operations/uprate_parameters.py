@@ -6,8 +6,10 @@ from dateutil import rrule
 from dateutil.relativedelta import relativedelta
 from dateutil.parser import parse
 from datetime import datetime
-from typing import Optional, Union
+from typing import Dict, Optional, Union
+import time
 
+from policyengine_core.parameters.helpers import _unshare
 from policyengine_core.parameters.operations.get_parameter import get_parameter
 from policyengine_core.parameters.parameter import Parameter
 from policyengine_core.parameters.parameter_at_instant import (
@@ -17,11 +19,15 @@ from policyengine_core.parameters.parameter_node import ParameterNode
 from policyengine_core.periods import instant
 
 
-def uprate_parameters(root: ParameterNode) -> ParameterNode:
+def uprate_parameters(
+    root: ParameterNode, durations: Optional[Dict[str, float]] = None
+) -> ParameterNode:
     """Uprates parameters according to their metadata.
 
     Args:
         root (ParameterNode): The root of the parameter tree.
+        durations (Dict[str, float], optional): If given, the seconds spent
+            uprating each uprated parameter are recorded in it, by path.
 
     Returns:
         ParameterNode: The same root, with uprating applied to descendants.
@@ -34,14 +40,125 @@ def uprate_parameters(root: ParameterNode) -> ParameterNode:
     ]
     parameter_paths = get_parameter_paths(root)
 
+    uprating_dependents = {}
+    uprated_parameter_paths = []
     for parameter in sort_parameters_by_uprating_dependencies(
         parameters,
         parameter_paths,
     ):
-        uprate_parameter(parameter, root, parameter_paths)
+        start = time.perf_counter()
+        uprating_parameter = uprate_parameter(parameter, root, parameter_paths)
+        parameter_path = parameter_paths.get(id(parameter))
+        uprating_parameter_path = parameter_paths.get(id(uprating_parameter))
+        if parameter_path is None:
+            continue
+        if durations is not None:
+            durations[parameter_path] = time.perf_counter() - start
+        uprated_parameter_paths.append(parameter_path)
+        if uprating_parameter_path is not None:
+            uprating_dependents.setdefault(uprating_parameter_path, []).append(
+                parameter_path
+            )
+
+    # Keep the dependency graph on the root (by path, so that it stays valid
+    # for clones of the tree) to re-uprate dependents when an index changes.
+    root.uprating_dependents = uprating_dependents
+    root.uprated_parameter_paths = uprated_parameter_paths
     return root
 
 
+def uprate_dependents(*parameters: Parameter, include_parameters: bool = False) -> None:
+    """Recomputes the uprated values of the parameters uprated by some parameters.
+
+    Only the parameters depending on them, directly or through other uprated
+    parameters, are uprated again, in their original uprating order. Values
+    set explicitly on those parameters are kept. This does nothing unless the
+    parameters belong to a tree processed by `uprate_parameters`.
+
+    Args:
+        *parameters (Parameter): Parameters of the same tree whose values have changed.
+        include_parameters (bool): Whether the given parameters are uprated again
+            too, if they are uprated.
+    """
+    if not parameters:
+        return
+    root = parameters[0]
+    while root.parent is not None:
+        root = root.parent
+    uprating_dependents = getattr(root, "uprating_dependents", None)
+    if not uprating_dependents:
+        return
+
+    parameter_paths = list(map(get_path_from_root, parameters))
+    paths_to_visit = [
+        parameter_path
+        for parameter_path in parameter_paths
+        if parameter_path in uprating_dependents
+    ]
+    dependent_paths = set(parameter_paths) if include_parameters else set()
+    while paths_to_visit:
+        for dependent_path in uprating_dependents.get(paths_to_visit.pop(), []):
+            if dependent_path not in dependent_paths:
+                dependent_paths.add(dependent_path)
+                paths_to_visit.append(dependent_path)
+
+    for dependent_path in root.uprated_parameter_paths:
+        if dependent_path not in dependent_paths:
+            continue
+        dependent = _find_parameter(root, dependent_path)
+        if dependent is None:
+            continue
+        _unshare(dependent)
+        previous_uprated_instants = [
+            value.instant_str for value in dependent.values_list if value.uprated
+        ]
+        dependent.values_list = [
+            value for value in dependent.values_list if not value.uprated
+        ]
+        uprate_parameter(dependent, root, {id(dependent): dependent_path})
+        uprated_instants = previous_uprated_instants + [
+            value.instant_str for value in dependent.values_list if value.uprated
+        ]
+        if uprated_instants:
+            dependent.parent.clear_parent_cache(min(uprated_instants))
+        dependent.mark_as_modified()
+
+
+def get_path_from_root(item) -> str:
+    """Gets the path of a parameter, scale or node from the root of its tree.
+
+    Unlike the parameter name, the path reflects where the item actually is,
+    e.g. under `baseline`. It is found by walking up the parents, so it does
+    not require indexing (or copying, for copy-on-write clones) the tree.
+
+    Args:
+        item: A parameter, scale or node.
+
+    Returns:
+        str: The path, in the format used by `get_parameter_paths`.
+    """
+    path = ""
+    while getattr(item, "parent", None) is not None:
+        parent = item.parent
+        brackets = parent.__dict__.get("brackets")
+        if brackets is not None and not isinstance(parent, ParameterNode):
+            index = next(i for i, bracket in enumerate(brackets) if bracket is item)
+            path = f"[{index}].{path}" if path else f"[{index}]"
+        else:
+            children = parent.__dict__.get("_shared_children") or parent.children
+            name = next(name for name, child in children.items() if child is item)
+            path = f"{name}.{path}" if path and path[0] != "[" else name + path
+        item = parent
+    return path
+
+
+def _find_parameter(root: ParameterNode, path: str) -> Optional[Parameter]:
+    try:
+        return get_parameter(root, path)
+    except ValueError:
+        return None
+
+
 def normalize_uprating_metadata(meta: Union[dict, str]) -> dict:
     if meta == "self":
         return dict(parameter="self")
@@ -263,7 +380,8 @@ def uprate_parameter(
     parameter: Parameter,
     root: ParameterNode,
     parameter_paths: Optional[dict[int, str]] = None,
-) -> None:
+) -> Parameter:
+    """Extends a parameter's values with uprated values, and returns the parameter used to uprate them."""
     if parameter_paths is None:
         parameter_paths = {}
     # Pull the uprating definition dict
@@ -334,6 +452,8 @@ def uprate_parameter(
         )
 
         # Append uprated data to parameter values list
+        for value in uprated_data:
+            value.uprated = True
         parameter.values_list.extend(uprated_data)
 
     else:
@@ -365,15 +485,16 @@ def uprate_parameter(
                 uprated_value = value_at_start * uprater_change
                 if has_rounding:
                     uprated_value = round_uprated_value(meta, uprated_value)
-                parameter.values_list.append(
-                    ParameterAtInstant(
-                        parameter.name,
-                        entry.instant_str,
-                        data=uprated_value,
-                    )
+                uprated_entry = ParameterAtInstant(
+                    parameter.name,
+                    entry.instant_str,
+                    data=uprated_value,
                 )
+                uprated_entry.uprated = True
+                parameter.values_list.append(uprated_entry)
     # Whether using cadence or not, sort the parameter values_list
     parameter.values_list.sort(key=lambda x: x.instant_str, reverse=True)
+    return uprating_parameter
 
 
 def round_uprated_value(meta: dict, uprated_value: float) -> float:
@@ -1,12 +1,23 @@
 import copy
 import os
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+from numpy.typing import ArrayLike
 
 from policyengine_core.errors import ParameterParsingError
 from .at_instant_like import AtInstantLike
 from .parameter_at_instant import ParameterAtInstant
 
-from .helpers import _validate_parameter, _compose_name
+from .helpers import (
+    _validate_parameter,
+    _compose_name,
+    _get_update_batch,
+    _instants_to_dates,
+    _unshare,
+    _values_to_array,
+)
 from .config import COMMON_KEYS
 from policyengine_core.commons.misc import empty_clone
 from policyengine_core.periods import INSTANT_PATTERN, period as get_period
@@ -120,9 +131,19 @@ class Parameter(AtInstantLike):
     def __eq__(self, other):
         return (self.name == other.name) and (self.values_list == other.values_list)
 
+    def __getstate__(self) -> dict:
+        # The parent, if pickled with this parameter, sets itself back.
+        state = self.__dict__.copy()
+        state.pop("_sharers", None)
+        state.pop("parent", None)
+        return state
+
     def clone(self):
         clone = empty_clone(self)
         clone.__dict__ = self.__dict__.copy()
+        clone.__dict__.pop("_value_index", None)
+        clone.__dict__.pop("_start_dates", None)
+        clone.__dict__.pop("_sharers", None)
 
         clone.metadata = copy.deepcopy(self.metadata)
         clone.values_list = [
@@ -156,6 +177,7 @@ class Parameter(AtInstantLike):
                 period = get_period(period)
             start = period.start
             stop = period.stop
+        _unshare(self)
         if start is None:
             start = "0000-01-01"
         start_str = str(start)
@@ -207,10 +229,25 @@ class Parameter(AtInstantLike):
 
         self.values_list = new_values
 
-        self.parent.clear_parent_cache()
+        # Only values from the start of the period (to its end, unless later
+        # values were removed) have changed.
+        if remove_after:
+            stop_str = None
+        batch = _get_update_batch(self)
+        if batch is not None:
+            batch.add(self, start_str, stop_str)
+            return self
+
+        self.parent.clear_parent_cache(start_str, stop_str)
 
         self.mark_as_modified()
 
+        from policyengine_core.parameters.operations.uprate_parameters import (
+            uprate_dependents,
+        )
+
+        uprate_dependents(self)
+
         return self
 
     def mark_as_modified(self):
@@ -220,11 +257,74 @@ class Parameter(AtInstantLike):
     def get_descendants(self):
         return iter(())
 
+    def _get_value_index(self) -> Tuple[List[str], List[int]]:
+        """Return the start instants of ``values_list`` in chronological order, with the position of each in ``values_list``.
+
+        The index is rebuilt whenever ``values_list`` is reassigned (as in ``update``) or changes length (as when uprating or interpolation extend it in place). It stores positions rather than values, so in-place edits of ``ParameterAtInstant.value`` are seen by the next lookup.
+        """
+        values_list = self.values_list
+        value_index = self.__dict__.get("_value_index")
+        if (
+            value_index is None
+            or value_index[0] is not values_list
+            or value_index[1] != len(values_list)
+        ):
+            # Among entries sharing a start instant, the one listed first in
+            # ``values_list`` wins, so it must sort last.
+            positions = sorted(
+                range(len(values_list)),
+                key=lambda position: (values_list[position].instant_str, -position),
+            )
+            starts = [values_list[position].instant_str for position in positions]
+            value_index = (values_list, len(values_list), starts, positions)
+            self._value_index = value_index
+        return value_index[2], value_index[3]
+
+    def _get_start_dates(self) -> numpy.ndarray:
+        starts, _ = self._get_value_index()
+        start_dates = self.__dict__.get("_start_dates")
+        if start_dates is None or start_dates[0] is not starts:
+            start_dates = (starts, numpy.array(starts, dtype="datetime64[D]"))
+            self._start_dates = start_dates
+        return start_dates[1]
+
+    def at_instants(self, instants: ArrayLike) -> numpy.ndarray:
+        """Get the value of the parameter at each of ``instants``.
+
+        All instants are looked up with a single ``searchsorted`` over the parameter's start dates.
+
+        Args:
+            instants: Dates, as a ``datetime64`` array, integer years, ``YYYY-MM-DD`` strings or anything :func:`periods.instant` accepts.
+
+        Returns:
+            numpy.ndarray: One value per instant. Where the parameter is undefined, numeric results hold ``nan`` and others ``None``.
+        """
+        dates = _instants_to_dates(instants)
+        _, positions = self._get_value_index()
+        if not positions:
+            return numpy.full(len(dates), numpy.nan)
+        indices = numpy.searchsorted(self._get_start_dates(), dates, side="right") - 1
+        undefined = indices < 0
+        values = [self.values_list[position].value for position in positions]
+        removed = [i for i, value in enumerate(values) if value is None]
+        if removed:
+            undefined |= numpy.isin(indices, removed)
+            values = [0 if value is None else value for value in values]
+        result = _values_to_array(values)[numpy.maximum(indices, 0)]
+        if undefined.any():
+            if result.dtype.kind in "biuf":
+                result = result.astype(float)
+                result[undefined] = numpy.nan
+            else:
+                result[undefined] = None
+        return result
+
     def _get_at_instant(self, instant):
-        for value_at_instant in self.values_list:
-            if value_at_instant.instant_str <= instant:
-                return value_at_instant.value
-        return None
+        starts, positions = self._get_value_index()
+        i = bisect_right(starts, instant)
+        if i == 0:
+            return None
+        return self.values_list[positions[i - 1]].value
 
     def relative_change(self, start_instant, end_instant):
         start_instant = str(start_instant)
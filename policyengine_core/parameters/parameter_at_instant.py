@@ -14,6 +14,9 @@ class ParameterAtInstant:
 
     _allowed_keys = set(["value", "metadata"])
 
+    uprated: bool = False
+    """Whether the value was computed by uprating, rather than read from the parameter data or set with `Parameter.update`."""
+
     def __init__(
         self,
         name: str,
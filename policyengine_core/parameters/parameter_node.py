@@ -1,8 +1,12 @@
 import copy
 import os
 import typing
+from contextlib import contextmanager
 from typing import Iterable, List, Type, Union
 
+import numpy
+from numpy.typing import ArrayLike
+
 from policyengine_core import commons, parameters, tools
 from policyengine_core.data_structures import Reference
 from policyengine_core.periods.instant_ import Instant
@@ -13,16 +17,74 @@ from .parameter import Parameter
 from .parameter_node_at_instant import ParameterNodeAtInstant
 from .config import COMMON_KEYS, FILE_EXTENSIONS
 from .helpers import (
-    load_parameter_file,
+    _add_sharer,
+    _get_update_batch,
+    _remove_sharer,
+    _unshare,
     _compose_name,
     _validate_parameter,
     _parse_child,
     _load_yaml_file,
+    _evict_instants,
+    _instants_to_dates,
 )
 
 EXCLUDED_PARAMETER_CHILD_NAMES = ["reference", "__pycache__"]
 
 
+class ParameterUpdateBatch:
+    """
+    Parameter updates made inside :meth:`ParameterNode.batch_update`, whose side effects are applied together by :meth:`commit`.
+    """
+
+    def __init__(self):
+        # Parameter id -> [parameter, first updated instant, end of the
+        # updated instants (None if unbounded)].
+        self.updated_intervals = {}
+
+    def add(self, parameter: Parameter, start: str, stop: str = None) -> None:
+        interval = self.updated_intervals.get(id(parameter))
+        if interval is None:
+            self.updated_intervals[id(parameter)] = [parameter, start, stop]
+        else:
+            _merge_interval(interval, start, stop)
+
+    def commit(self) -> None:
+        if not self.updated_intervals:
+            return
+        nodes = {}
+        for parameter, start, stop in self.updated_intervals.values():
+            parameter.modified = True
+            node = parameter.parent
+            while node is not None:
+                interval = nodes.get(id(node))
+                if interval is None:
+                    nodes[id(node)] = [node, start, stop]
+                else:
+                    _merge_interval(interval, start, stop)
+                node = getattr(node, "parent", None)
+        for node, start, stop in nodes.values():
+            node.modified = True
+            if isinstance(node, (ParameterNode, parameters.ParameterScale)):
+                node._evict_at_instant_cache(start, stop)
+
+        from policyengine_core.parameters.operations.uprate_parameters import (
+            uprate_dependents,
+        )
+
+        uprate_dependents(
+            *(parameter for parameter, _, _ in self.updated_intervals.values())
+        )
+        self.updated_intervals = {}
+
+
+def _merge_interval(interval: list, start: str, stop: str = None) -> None:
+    interval[1] = min(interval[1], start)
+    interval[2] = (
+        None if interval[2] is None or stop is None else max(interval[2], stop)
+    )
+
+
 class ParameterNode(AtInstantLike):
     """
     A node in the legislation `parameter tree <https://openfisca.org/doc/coding-the-legislation/legislation_parameters.html>`_.
@@ -35,12 +97,19 @@ class ParameterNode(AtInstantLike):
     parent: "ParameterNode" = None
     """The parent of the node, or None if the node is the root of the tree."""
 
+    uprating_dependents: typing.Optional[typing.Dict[str, List[str]]] = None
+    """On the root of an uprated tree, the paths of the parameters directly uprated by each parameter, by path. Updating a parameter listed here recomputes the uprated values of its dependents."""
+
+    uprated_parameter_paths: typing.Optional[List[str]] = None
+    """On the root of an uprated tree, the paths of all uprated parameters, in the order they were uprated."""
+
     def __init__(
         self,
         name: str = "",
         directory_path: str = None,
         data: dict = None,
         file_path: str = None,
+        parsed_files: dict = None,
     ):
         """
         Instantiate a ParameterNode either from a dict, (using `data`), or from a directory containing YAML files (using `directory_path`).
@@ -49,6 +118,7 @@ class ParameterNode(AtInstantLike):
         :param str directory_path: Directory containing YAML files describing the node.
         :param dict data: Object representing the parameter node. It usually has been extracted from a YAML file.
         :param str file_path: YAML file from which the `data` has been extracted from.
+        :param dict parsed_files: Contents of already parsed YAML files under `directory_path`, by path, used instead of reading those files again (see :func:`.load_parameter_directory`).
 
 
         Instantiate a ParameterNode from a dict:
@@ -89,6 +159,15 @@ class ParameterNode(AtInstantLike):
 
         if directory_path:
             self.file_path = directory_path
+
+            def load_yaml_file(child_path):
+                if parsed_files is None or child_path not in parsed_files:
+                    return _load_yaml_file(child_path)
+                data = parsed_files[child_path]
+                if isinstance(data, Exception):
+                    raise data
+                return data
+
             for child_name in sorted(os.listdir(directory_path)):
                 child_path = os.path.join(directory_path, child_name)
                 if os.path.isfile(child_path):
@@ -111,21 +190,27 @@ class ParameterNode(AtInstantLike):
                         continue
 
                     if child_name == "index":
-                        data = _load_yaml_file(child_path) or {}
+                        data = load_yaml_file(child_path) or {}
                         _validate_parameter(self, data, allowed_keys=COMMON_KEYS)
                         self.description = data.get("description")
                         self.documentation = data.get("documentation")
                         self.metadata.update(data.get("metadata", {}))
                     elif child_name not in EXCLUDED_PARAMETER_CHILD_NAMES:
                         child_name_expanded = _compose_name(name, child_name)
-                        child = load_parameter_file(child_path, child_name_expanded)
+                        child = _parse_child(
+                            child_name_expanded,
+                            load_yaml_file(child_path),
+                            child_path,
+                        )
                         self.add_child(child_name, child)
 
                 elif os.path.isdir(child_path):
                     child_name = os.path.basename(child_path)
                     child_name_expanded = _compose_name(name, child_name)
                     child = ParameterNode(
-                        child_name_expanded, directory_path=child_path
+                        child_name_expanded,
+                        directory_path=child_path,
+                        parsed_files=parsed_files,
                     )
                     self.add_child(child_name, child)
 
@@ -169,6 +254,7 @@ class ParameterNode(AtInstantLike):
         """
         if name in self.children:
             raise ValueError("{} has already a child named {}".format(self.name, name))
+        _unshare(self)
         if not (
             isinstance(child, ParameterNode)
             or isinstance(child, Parameter)
@@ -187,7 +273,7 @@ class ParameterNode(AtInstantLike):
         result = os.linesep.join(
             [
                 os.linesep.join(["{}:", "{}"]).format(name, tools.indent(repr(value)))
-                for name, value in sorted(self.children.items())
+                for name, value in sorted(self._get_children_to_read().items())
             ]
         )
         return result
@@ -200,19 +286,114 @@ class ParameterNode(AtInstantLike):
             yield child
             yield from child.get_descendants()
 
-    def clone(self) -> "ParameterNode":
+    def clone(self, copy_on_write: bool = True) -> "ParameterNode":
+        """
+        Copy the node and its descendants.
+
+        By default, the copy shares its children with this node. Reading values from the copy (through :meth:`get_at_instant` or :meth:`at_instants`) uses the shared children as they are. Getting a child from the copy (as an attribute, through :meth:`get_child` or ``children``) gives the copy its own copy of it, whose own children are shared in the same way. A shared object modified in place through either tree is first copied for the trees still sharing it, so the copy behaves as a full copy, while cloning only costs the number of children, and a reform modifying a few parameters only copies the objects on their paths.
+
+        :param bool copy_on_write: If False, copy the whole tree straight away, e.g. when it is about to be modified in ways that bypass :meth:`.Parameter.update`.
+        """
+        shared_children = self.__dict__.get("_shared_children")
+        if shared_children is None:
+            shared_children = self.children
+
         clone = commons.empty_clone(self)
         clone.__dict__ = self.__dict__.copy()
+        for key in (
+            "_sharers",
+            "_update_batch",
+            "_path_index",
+            "children",
+            *shared_children,
+        ):
+            clone.__dict__.pop(key, None)
 
         clone.metadata = copy.deepcopy(self.metadata)
-        clone.children = {key: child.clone() for key, child in self.children.items()}
-        for child_key, child in clone.children.items():
-            setattr(clone, child_key, child)
-            child.parent = clone
+        clone._shared_children = dict(shared_children)
+        for child in shared_children.values():
+            _add_sharer(child, clone)
         clone._at_instant_cache = {}
 
+        if not copy_on_write:
+            for _ in clone.get_descendants():
+                pass
+
         return clone
 
+    def _get_own_child(self, name: str):
+        """Get a child of a node copied with :meth:`clone`, copying it first if it is still shared."""
+        shared_children = self.__dict__["_shared_children"]
+        child = shared_children[name]
+        if child.parent is not self:
+            _remove_sharer(child, self)
+            child = child.clone()
+            child.parent = self
+            shared_children[name] = child
+            self.__dict__[name] = child
+        return child
+
+    def _get_children_to_read(self) -> dict:
+        """Get the children of the node by name, without copying the ones shared with other trees: they may only be read."""
+        shared_children = self.__dict__.get("_shared_children")
+        if shared_children is None:
+            return self.children
+        return shared_children
+
+    def _get_direct_child(self, name: str):
+        """Get the child called `name`, or None, copying only that child if the node shares its children."""
+        shared_children = self.__dict__.get("_shared_children")
+        if shared_children is None:
+            return self.children.get(name)
+        if name not in shared_children:
+            return None
+        return self._get_own_child(name)
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes not set on the node, i.e. for the
+        # children of a copy that still shares them.
+        shared_children = self.__dict__.get("_shared_children")
+        if shared_children is None or name.startswith("__"):
+            raise AttributeError(name)
+        if name == "children":
+            children = {
+                child_name: self._get_own_child(child_name)
+                for child_name in shared_children
+            }
+            del self.__dict__["_shared_children"]
+            self.children = children
+            return children
+        if name in shared_children:
+            return self._get_own_child(name)
+        raise AttributeError(name)
+
+    def __getstate__(self) -> dict:
+        # Children are pickled as they are, shared or not, and without their
+        # parent, which __setstate__ restores along with the sharing.
+        state = self.__dict__.copy()
+        for key in ("_sharers", "_path_index", "parent"):
+            state.pop(key, None)
+        state["_at_instant_cache"] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        shared_children = state.get("_shared_children")
+        if shared_children is None:
+            for child in self.children.values():
+                child.parent = self
+            return
+        for name, child in shared_children.items():
+            if name in state:
+                # Owned, as set by _get_own_child.
+                child.parent = self
+            else:
+                # Owned by the node it is shared with, if that node was
+                # unpickled too, or else by this one.
+                _add_sharer(child, self)
+                if getattr(child, "parent", None) is None:
+                    child.parent = self
+
     def _get_at_instant(self, instant: Instant) -> ParameterNodeAtInstant:
         if instant in self._at_instant_cache:
             return self._at_instant_cache[instant]
@@ -226,13 +407,84 @@ class ParameterNode(AtInstantLike):
         self._at_instant_cache[instant] = at_instant
         return at_instant
 
+    def at_instants(self, instants: ArrayLike) -> numpy.recarray:
+        """
+        Get the values of the node's descendants at each of ``instants``.
+
+        :param instants: Dates, in any form accepted by :meth:`.Parameter.at_instants`.
+        :returns: A record array with one row per instant and one field per child, nested like the node (e.g. ``result.taxes.rate``).
+        """
+        dates = _instants_to_dates(instants)
+        child_arrays = {
+            name: child.at_instants(dates)
+            for name, child in self._get_children_to_read().items()
+        }
+        result = numpy.empty(
+            len(dates),
+            dtype=[
+                (name, array.dtype, array.shape[1:])
+                for name, array in child_arrays.items()
+            ],
+        )
+        for name, array in child_arrays.items():
+            result[name] = array
+        return result.view(numpy.recarray)
+
     def attach_to_parent(self, parent: "ParameterNode"):
         self.parent = parent
 
-    def clear_parent_cache(self):
-        self._at_instant_cache.clear()
+    def clear_parent_cache(self, start: str = None, stop: str = None):
+        """
+        Evict the values cached by this node and its ancestors at instants from `start` (included) to `stop` (excluded).
+
+        Only the path up to the root is affected: other children keep their caches, so the nodes rebuilt for these instants reuse them. Without bounds, the whole cache of each ancestor is cleared.
+
+        :param str start: First affected instant, in the format `YYYY-MM-DD`. Unbounded if None.
+        :param str stop: First unaffected instant, in the format `YYYY-MM-DD`. Unbounded if None.
+        """
+        self._evict_at_instant_cache(start, stop)
         if self.parent is not None:
-            self.parent.clear_parent_cache()
+            self.parent.clear_parent_cache(start, stop)
+
+    def _evict_at_instant_cache(self, start: str = None, stop: str = None):
+        _evict_instants(self._at_instant_cache, start, stop)
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Group the updates of the parameters under this node.
+
+        Inside the block, :meth:`.Parameter.update` only changes the values of the parameter. When the block exits, the cached values of each ancestor are evicted once, for all the updated intervals, ancestors are marked as modified once, and the dependents of updated uprating indices are uprated once. Values read from the tree inside the block may not reflect the updates yet.
+
+        >>> with parameters.batch_update():
+        ...     parameters.taxes.rate.update(period="year:2024:1", value=0.2)
+        ...     parameters.benefits.amount.update(start="2024-01-01", value=600)
+        """
+        if _get_update_batch(self) is not None:
+            # Already inside a batch, which will commit these updates.
+            yield
+            return
+        batch = ParameterUpdateBatch()
+        self._update_batch = batch
+        try:
+            yield
+        finally:
+            del self.__dict__["_update_batch"]
+            batch.commit()
+
+    def apply_updates(self, updates: Iterable[typing.Tuple[str, dict]]):
+        """
+        Apply many parameter updates in a single :meth:`batch_update`.
+
+        :param updates: Pairs of a parameter path relative to this node, as accepted by :meth:`get_child`, and the keyword arguments of :meth:`.Parameter.update`. They are applied in order.
+        """
+        parameters_by_path = {}
+        with self.batch_update():
+            for path, update_kwargs in updates:
+                parameter = parameters_by_path.get(path)
+                if parameter is None:
+                    parameter = parameters_by_path[path] = self.get_child(path)
+                parameter.update(**update_kwargs)
 
     def mark_as_modified(self):
         self.modified = True
@@ -240,16 +492,40 @@ class ParameterNode(AtInstantLike):
             self.parent.mark_as_modified()
 
     def get_child(self, path: str) -> "ParameterNode":
+        """
+        Get a descendant by its path from this node, e.g. ``"taxes.scale[2].rate"``.
+
+        Found descendants are indexed by path, so looking the same path up again is a dictionary lookup. Adding children keeps the index valid; code replacing children in place must call :meth:`clear_path_index`.
+        """
+        path_index = self.__dict__.get("_path_index")
+        if path_index is None:
+            path_index = self._path_index = {}
+        node = path_index.get(path)
+        if node is None:
+            node = self._find_child(path)
+            path_index[path] = node
+        return node
+
+    def clear_path_index(self):
+        """Forget the descendants indexed by :meth:`get_child` on this node and its ancestors."""
+        node = self
+        while node is not None:
+            node.__dict__.pop("_path_index", None)
+            node = getattr(node, "parent", None)
+
+    def _find_child(self, path: str):
         node = self
         for name in path.split("."):
             try:
                 if "[" not in name:
-                    node = node.children[name]
+                    node = node._get_direct_child(name)
+                    if node is None:
+                        raise KeyError(name)
                 else:
                     try:
                         name, index = name.split("[")
                         index = int(index[:-1])
-                        node = node.children[name].brackets[index]
+                        node = node._get_direct_child(name).brackets[index]
                     except:
                         raise ValueError(
                             "Invalid bracket syntax (should be e.g. tax.brackets[3].rate"
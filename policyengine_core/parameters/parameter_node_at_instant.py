@@ -19,6 +19,8 @@ from policyengine_core.parameters.vectorial_parameter_node_at_instant import (
 class ParameterNodeAtInstant:
     """
     Parameter node of the legislation, at a given instant.
+
+    Children are resolved against the original :any:`ParameterNode` the first time they are accessed, and memoised, so asking for one leaf does not materialise the whole subtree. The node is still a snapshot: before a parameter is updated, the nodes at instant built from its ancestors resolve the children leading to it.
     """
 
     def __init__(self, name: str, node: "ParameterNode", instant_str: str):
@@ -31,20 +33,65 @@ class ParameterNodeAtInstant:
         # The "technical" attributes are hidden, so that the node children can be easily browsed with auto-completion without pollution
         self._name = name
         self._instant_str = instant_str
-        self._children = {}
+        self._node = node
+        # Child name -> child at instant, or None if the child is not defined at this instant.
+        self._resolved_children = {}
+        self._all_children = None
+
+    @property
+    def _children(self) -> dict:
+        if self._all_children is None:
+            node_children = (
+                self._node._get_children_to_read() if self._node is not None else {}
+            )
+            names = list(node_children) + [
+                name for name in self._resolved_children if name not in node_children
+            ]
+            all_children = {}
+            for child_name in names:
+                child_at_instant = self._resolve_child(child_name)
+                if child_at_instant is not None:
+                    all_children[child_name] = child_at_instant
+            self._all_children = all_children
+        return self._all_children
+
+    def _resolve_child(self, child_name: str):
+        try:
+            return self._resolved_children[child_name]
+        except KeyError:
+            pass
+        if self._node is None:
+            return None
+        child = self._node._get_children_to_read().get(child_name)
+        if child is None:
+            return None
+        child_at_instant = child._get_at_instant(self._instant_str)
+        self._resolved_children[child_name] = child_at_instant
+        if child_at_instant is not None:
+            setattr(self, child_name, child_at_instant)
+        return child_at_instant
 
-        for child_name, child in node.children.items():
-            child_at_instant = child._get_at_instant(instant_str)
-            if child_at_instant is not None:
-                self.add_child(child_name, child_at_instant)
+    def __getstate__(self) -> dict:
+        # Pickled as a snapshot, without the original node and its tree.
+        self._children
+        state = self.__dict__.copy()
+        state["_node"] = None
+        return state
 
     def add_child(self, child_name: str, child_at_instant: "ParameterNodeAtInstant"):
-        self._children[child_name] = child_at_instant
+        self._resolved_children[child_name] = child_at_instant
+        self._all_children = None
         setattr(self, child_name, child_at_instant)
 
     def __getattr__(self, key: str):
-        if key == "_name":
+        # Only reached when ``key`` has not been resolved yet. Technical
+        # attributes may be missing while the object is being copied or
+        # unpickled, in which case there is nothing to resolve against.
+        if key.startswith("__") or "_node" not in self.__dict__:
             raise AttributeError(key)
+        child_at_instant = self._resolve_child(key)
+        if child_at_instant is not None:
+            return child_at_instant
         param_name = helpers._compose_name(self._name, item_name=key)
         raise ParameterNotFoundError(param_name, self._instant_str)
 
@@ -68,7 +115,10 @@ class ParameterNodeAtInstant:
                 )
                 self._vectorial_node = vectorial
             return vectorial[key]
-        return self._children[key]
+        child_at_instant = self._resolve_child(key)
+        if child_at_instant is None:
+            raise KeyError(key)
+        return child_at_instant
 
     def __iter__(self) -> Iterable:
         return iter(self._children)
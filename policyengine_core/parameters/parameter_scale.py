@@ -3,6 +3,9 @@ import os
 import typing
 from typing import Any, Iterable
 
+import numpy
+from numpy.typing import ArrayLike
+
 from policyengine_core import commons, parameters, tools
 from policyengine_core.errors import ParameterParsingError
 from policyengine_core.parameters import AtInstantLike, config, helpers
@@ -55,8 +58,22 @@ class ParameterScale(AtInstantLike):
             )
             brackets.append(bracket)
         self.brackets: typing.List[parameters.ParameterScaleBracket] = brackets
+        for bracket in brackets:
+            bracket.parent = self
         self.propagate_uprating()
         self.propagate_units()
+        self.scale_type: str = self._resolve_scale_type()
+        self._at_instant_cache: typing.Dict[str, TaxScaleLike] = {}
+
+    def _resolve_scale_type(self) -> str:
+        if self.metadata.get("type") == "single_amount":
+            return "single_amount"
+        bracket_keys = set().union(*(bracket.children for bracket in self.brackets))
+        if "amount" in bracket_keys:
+            return "marginal_amount"
+        if "average_rate" in bracket_keys:
+            return "linear_average_rate"
+        return "marginal_rate"
 
     def __getitem__(self, key: str) -> Any:
         if isinstance(key, int) and key < len(self.brackets):
@@ -102,22 +119,40 @@ class ParameterScale(AtInstantLike):
             yield bracket
             yield from bracket.get_descendants()
 
-    def clear_parent_cache(self):
-        # ParameterScale itself caches nothing, but it sits between a
-        # Parameter (inside a ParameterScaleBracket) and the surrounding
-        # ParameterNode, so Parameter.update()'s recursive cache-clear has
-        # to pass through it. Propagate upward.
+    def clear_parent_cache(self, start: str = None, stop: str = None):
+        # The scale sits between a Parameter (inside a ParameterScaleBracket)
+        # and the surrounding ParameterNode, so Parameter.update()'s
+        # recursive cache-clear evicts its tax scales and propagates upward.
+        self._evict_at_instant_cache(start, stop)
         if getattr(self, "parent", None) is not None:
-            self.parent.clear_parent_cache()
+            self.parent.clear_parent_cache(start, stop)
+
+    def _evict_at_instant_cache(self, start: str = None, stop: str = None):
+        helpers._evict_instants(self._at_instant_cache, start, stop)
 
     def mark_as_modified(self):
         self.modified = True
         if getattr(self, "parent", None) is not None:
             self.parent.mark_as_modified()
 
+    def __getstate__(self) -> dict:
+        # As for nodes, the parent sets itself back when unpickled.
+        state = self.__dict__.copy()
+        state.pop("_sharers", None)
+        state.pop("parent", None)
+        state["_at_instant_cache"] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        for bracket in self.brackets:
+            bracket.parent = self
+
     def clone(self) -> "ParameterScale":
         clone = commons.empty_clone(self)
         clone.__dict__ = self.__dict__.copy()
+        clone.__dict__.pop("_sharers", None)
+        clone._at_instant_cache = {}
 
         clone.brackets = [bracket.clone() for bracket in self.brackets]
         for bracket in clone.brackets:
@@ -126,51 +161,84 @@ class ParameterScale(AtInstantLike):
 
         return clone
 
-    def _get_at_instant(self, instant: Instant) -> TaxScaleLike:
-        brackets = [bracket.get_at_instant(instant) for bracket in self.brackets]
+    def at_instants(self, instants: ArrayLike) -> numpy.recarray:
+        """
+        Get the scale's thresholds and rates (or amounts) at each of ``instants``.
 
-        if self.metadata.get("type") == "single_amount":
-            scale = SingleAmountTaxScale()
-            for bracket in brackets:
-                if "amount" in bracket._children and "threshold" in bracket._children:
-                    amount = bracket.amount
-                    threshold = bracket.threshold
-                    scale.add_bracket(threshold, amount)
-            return scale
-        elif any("amount" in bracket._children for bracket in brackets):
-            scale = MarginalAmountTaxScale()
-            for bracket in brackets:
-                if "amount" in bracket._children and "threshold" in bracket._children:
-                    amount = bracket.amount
-                    threshold = bracket.threshold
-                    scale.add_bracket(threshold, amount)
-            return scale
-        elif any("average_rate" in bracket._children for bracket in brackets):
-            scale = LinearAverageRateTaxScale()
-
-            for bracket in brackets:
-                if "base" in bracket._children:
-                    base = bracket.base
-                else:
-                    base = 1.0
-                if (
-                    "average_rate" in bracket._children
-                    and "threshold" in bracket._children
-                ):
-                    average_rate = bracket.average_rate
-                    threshold = bracket.threshold
-                    scale.add_bracket(threshold, average_rate * base)
-            return scale
+        :param instants: Dates, in any form accepted by :meth:`.Parameter.at_instants`.
+        :returns: A record array with one row per instant, whose ``thresholds`` field and ``rates``, ``average_rates`` or ``amounts`` field (depending on the scale type) are ``(len(instants), len(brackets))`` matrices. Brackets undefined at an instant hold ``nan``.
+        """
+        dates = helpers._instants_to_dates(instants)
+        if self.scale_type in ("single_amount", "marginal_amount"):
+            value_key, field = "amount", "amounts"
+        elif self.scale_type == "linear_average_rate":
+            value_key, field = "average_rate", "average_rates"
         else:
-            scale = MarginalRateTaxScale()
-
-            for bracket in brackets:
-                if "base" in bracket._children:
-                    base = bracket.base
-                else:
-                    base = 1.0
-                if "rate" in bracket._children and "threshold" in bracket._children:
-                    rate = bracket.rate
-                    threshold = bracket.threshold
-                    scale.add_bracket(threshold, rate * base)
-            return scale
+            value_key, field = "rate", "rates"
+
+        shape = (len(dates), len(self.brackets))
+        thresholds = numpy.full(shape, numpy.nan)
+        values = numpy.full(shape, numpy.nan)
+        for i, bracket in enumerate(self.brackets):
+            if "threshold" not in bracket.children or value_key not in bracket.children:
+                continue
+            thresholds[:, i] = bracket.children["threshold"].at_instants(dates)
+            values[:, i] = bracket.children[value_key].at_instants(dates)
+            if value_key != "amount" and "base" in bracket.children:
+                base = bracket.children["base"].at_instants(dates)
+                values[:, i] *= numpy.where(numpy.isnan(base), 1.0, base)
+
+        result = numpy.empty(
+            len(dates),
+            dtype=[
+                ("thresholds", float, (len(self.brackets),)),
+                (field, float, (len(self.brackets),)),
+            ],
+        )
+        result["thresholds"] = thresholds
+        result[field] = values
+        return result.view(numpy.recarray)
+
+    def _get_at_instant(self, instant: Instant) -> TaxScaleLike:
+        # Tax scales are cached per instant until an update of one of the
+        # brackets evicts them (see clear_parent_cache).
+        try:
+            return self._at_instant_cache[instant]
+        except KeyError:
+            pass
+        scale = self._build_tax_scale(instant)
+        self._at_instant_cache[instant] = scale
+        return scale
+
+    def _build_tax_scale(self, instant: Instant) -> TaxScaleLike:
+        scale_class, value_key, apply_base = _SCALE_TYPES[self.scale_type]
+        scale = scale_class()
+        for bracket in self.brackets:
+            threshold = self._get_bracket_value(bracket, "threshold", instant)
+            value = self._get_bracket_value(bracket, value_key, instant)
+            if threshold is None or value is None:
+                continue
+            if apply_base:
+                base = self._get_bracket_value(bracket, "base", instant)
+                value = value * (1.0 if base is None else base)
+            scale.add_bracket(threshold, value)
+        return scale
+
+    @staticmethod
+    def _get_bracket_value(
+        bracket: "parameters.ParameterScaleBracket", key: str, instant: Instant
+    ) -> Any:
+        child = bracket._get_direct_child(key)
+        if child is None:
+            return None
+        return child._get_at_instant(instant)
+
+
+# Scale type -> (tax scale class, bracket value key, whether the value is
+# multiplied by the bracket base).
+_SCALE_TYPES = {
+    "single_amount": (SingleAmountTaxScale, "amount", False),
+    "marginal_amount": (MarginalAmountTaxScale, "amount", False),
+    "linear_average_rate": (LinearAverageRateTaxScale, "average_rate", True),
+    "marginal_rate": (MarginalRateTaxScale, "rate", True),
+}
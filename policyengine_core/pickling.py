@@ -0,0 +1,106 @@
+"""Pickling of simulations and tax-benefit systems, to hand them to other processes.
+
+Simulations hold their values in NumPy arrays. Pickled with protocol 5 by
+:func:`dumps`, the arrays are not copied into the pickle but returned as
+out-of-band buffers, which :func:`loads` reads back from.
+
+Tax-benefit systems import each of their variable files under a module name
+unique to the system (see :meth:`.TaxBenefitSystem._import_variable_classes`),
+which other processes cannot import. Variables defined by these files are
+pickled by name, and other classes defined there (such as enums) by file and
+name: both are unpickled from the *reference system* of the system's class in
+the unpickling process, which is the first system of that class built there,
+or else a new one.
+"""
+
+from __future__ import annotations
+
+import pickle
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+
+_variable_modules: Dict[str, Tuple[type, str]] = {}
+# System class, and file relative to the system's variables directory, of
+# each imported variable module, by module name.
+
+_reference_systems = weakref.WeakValueDictionary()
+_built_reference_systems: Dict[type, TaxBenefitSystem] = {}
+_lock = threading.RLock()
+
+
+def register_variable_module(module_name: str, system_class: type, file: str) -> None:
+    """Record that the module `module_name` was imported from the variable file `file` of a system of class `system_class`."""
+    _variable_modules[module_name] = (system_class, file)
+
+
+def register_reference_system(tax_benefit_system: TaxBenefitSystem) -> None:
+    """Make `tax_benefit_system` the reference system of its class, unless the class already has one."""
+    with _lock:
+        _reference_systems.setdefault(type(tax_benefit_system), tax_benefit_system)
+
+
+def get_reference_system(system_class: type) -> TaxBenefitSystem:
+    """Get the reference system of `system_class`, building it if needed."""
+    with _lock:
+        system = _reference_systems.get(system_class)
+        if system is None:
+            # Kept alive, as nothing else refers to systems built here.
+            system = _built_reference_systems[system_class] = system_class()
+            _reference_systems[system_class] = system
+        return system
+
+
+def get_variable_module_reference(cls: type) -> Optional[Tuple[type, str]]:
+    """Get the system class and variable file defining `cls`, or None if `cls` is not defined by a variable file."""
+    return _variable_modules.get(getattr(cls, "__module__", None))
+
+
+def restore_class(system_class: type, file: str, qualname: str) -> type:
+    """Get the class `qualname` defined by the variable file `file` of the reference system of `system_class`."""
+    module = get_reference_system(system_class).get_variable_module(file)
+    value = module
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+class _ClassReference:
+    # Unpickled as the class it refers to.
+
+    def __init__(self, system_class: type, file: str, qualname: str) -> None:
+        self.reference = (system_class, file, qualname)
+
+    def __reduce__(self):
+        return restore_class, self.reference
+
+
+def pickleable_class(cls: type) -> Any:
+    """
+    Get an object pickled as `cls`: `cls` itself, or a reference to it if it is defined by a variable file.
+
+    :param cls: A class, or None.
+    """
+    reference = get_variable_module_reference(cls)
+    if reference is None:
+        return cls
+    return _ClassReference(*reference, cls.__qualname__)
+
+
+def dumps(obj: Any) -> Tuple[bytes, List[pickle.PickleBuffer]]:
+    """
+    Pickle `obj` with protocol 5, leaving the data of its arrays out of band.
+
+    :returns: The pickle, and the buffers holding the data of the arrays, which refer to the arrays' memory rather than copying it. Both are needed to unpickle `obj` with :func:`loads`.
+    """
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return data, buffers
+
+
+def loads(data: bytes, buffers: List[Any] = ()) -> Any:
+    """Unpickle an object pickled by :func:`dumps`."""
+    return pickle.loads(data, buffers=buffers)
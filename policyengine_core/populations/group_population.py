@@ -22,6 +22,7 @@ class GroupPopulation(Population):
         self._members_role: ArrayLike = None
         self._members_position: ArrayLike = None
         self._ordered_members_map = None
+        self._members_index = None
 
     def __call__(
         self,
@@ -55,6 +56,7 @@ class GroupPopulation(Population):
         result._members_role = self._members_role
         result._members_position = self._members_position
         result._ordered_members_map = self._ordered_members_map
+        result._members_index = self._members_index
         return result
 
     @property
@@ -83,6 +85,7 @@ class GroupPopulation(Population):
     @members_entity_id.setter
     def members_entity_id(self, members_entity_id: ArrayLike) -> None:
         self._members_entity_id = members_entity_id
+        self._members_index = None
 
     @property
     def members_role(self) -> ArrayLike:
@@ -106,6 +109,21 @@ class GroupPopulation(Population):
             self._ordered_members_map = numpy.argsort(self.members_entity_id)
         return self._ordered_members_map
 
+    def get_member_indices(self, entity_index: int) -> ArrayLike:
+        """
+        Return the rows of the persons belonging to the entity instance at ``entity_index``, in person order.
+
+        Members are located with a binary search over a cached, stably sorted copy of ``members_entity_id``, so each lookup is O(log n) instead of a scan of every person.
+        """
+        if self._members_index is None:
+            members_entity_id = numpy.asarray(self.members_entity_id)
+            order = numpy.argsort(members_entity_id, kind="stable")
+            self._members_index = (order, members_entity_id[order])
+        order, sorted_entity_id = self._members_index
+        start = numpy.searchsorted(sorted_entity_id, entity_index, side="left")
+        stop = numpy.searchsorted(sorted_entity_id, entity_index, side="right")
+        return order[start:stop]
+
     def get_role(self, role_name: str) -> Role:
         return next(
             (role for role in self.entity.flattened_roles if role.key == role_name),
@@ -23,6 +23,16 @@ class Population:
         self.count = 0
         self.ids = []
 
+    @property
+    def ids(self) -> ArrayLike:
+        return self._ids
+
+    @ids.setter
+    def ids(self, ids: ArrayLike) -> None:
+        self._ids = ids
+        # Lazily rebuilt by ``get_index`` the next time an id is looked up.
+        self._id_index = None
+
     def clone(self, simulation: "Simulation") -> "Population":
         result = Population(self.entity)
         result.simulation = simulation
@@ -32,10 +42,11 @@ class Population:
         }
         result.count = self.count
         result.ids = self.ids
+        result._id_index = self._id_index
         return result
 
     def has_any_input(self, variable_name: str) -> bool:
-        return len(self.get_holder(variable_name).get_known_periods()) > 0
+        return self.get_holder(variable_name).has_values()
 
     def empty_array(self) -> numpy.ndarray:
         return numpy.zeros(self.count)
@@ -50,6 +61,10 @@ class Population:
         return numpy.full(self.count, value, dtype)
 
     def __getattr__(self, attribute: str) -> Any:
+        # Special attributes, which unpickling looks up before setting the
+        # others, are never projections.
+        if attribute.startswith("__"):
+            raise AttributeError(attribute)
         projector = projectors.get_projector_from_shortcut(self, attribute)
         if not projector:
             raise AttributeError(
@@ -60,7 +75,23 @@ class Population:
         return projector
 
     def get_index(self, id: str) -> int:
-        return self.ids.index(id)
+        """
+        Return the row of the entity instance whose id is ``id``.
+
+        The id -> row mapping is built on first use and cached until ``ids`` is reassigned, so repeated lookups are O(1) rather than a scan of ``ids``. When ids are duplicated, the first row wins, as with ``list.index``.
+        """
+        if self._id_index is None:
+            ids = self.ids.tolist() if isinstance(self.ids, numpy.ndarray) else self.ids
+            id_index = {}
+            for row, entity_id in enumerate(ids):
+                id_index.setdefault(entity_id, row)
+            self._id_index = id_index
+        try:
+            return self._id_index[id]
+        except KeyError:
+            raise ValueError(
+                "{!r} is not an id of the entity {}.".format(id, self.entity.key)
+            )
 
     # Calculations
 
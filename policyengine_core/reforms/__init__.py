@@ -1 +1,2 @@
 from .reform import Reform, set_parameter
+from .reformed_system_cache import ReformedSystemCache, reformed_system_cache
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import copy
-from typing import Callable, Union, TYPE_CHECKING
+import hashlib
+import json
+from typing import Callable, List, Optional, Type, Union, TYPE_CHECKING
 
 from policyengine_core.parameters import ParameterNode, Parameter
 from policyengine_core.taxbenefitsystems import TaxBenefitSystem
@@ -14,8 +15,6 @@ from policyengine_core.periods import (
     Period,
 )
 
-import requests
-
 
 class classproperty(object):
     def __init__(self, f):
@@ -88,6 +87,45 @@ def _update_start_instant(update_kwargs: dict):
     return instant_("0001-01-01")
 
 
+def _canonical_update(update_kwargs: dict) -> list:
+    """Update kwargs -> ``[start, stop, value]``, the same for period keys
+    of different formats covering the same interval."""
+    if "period" in update_kwargs:
+        start = update_kwargs["period"].start
+        stop = update_kwargs["period"].stop
+    else:
+        start = update_kwargs.get("start")
+        stop = update_kwargs.get("stop")
+    return [
+        None if start is None else str(start),
+        None if stop is None else str(stop),
+        update_kwargs["value"],
+    ]
+
+
+def get_parameter_values_hash(parameter_values: dict) -> str:
+    """Hash the updates a :meth:`Reform.from_dict` dict makes.
+
+    Dicts making the same updates hash the same, whatever the order of their
+    paths and the format of their period keys (e.g. ``"2026"`` and
+    ``"2026-01-01"``, or ``"year:2026:1"`` and ``"2026-01-01.2026-12-31"``).
+    """
+    canonical_values = []
+    for path in sorted(parameter_values):
+        period_values = parameter_values[path]
+        if not isinstance(period_values, dict):
+            period_values = {_SCALAR_REFORM_PERIOD: period_values}
+        updates = [
+            _period_key_update_kwargs(period_key, value)
+            for period_key, value in period_values.items()
+        ]
+        updates.sort(key=_update_start_instant)
+        canonical_values.append([path, [_canonical_update(u) for u in updates]])
+    return hashlib.sha256(
+        json.dumps(canonical_values, default=str).encode("utf-8")
+    ).hexdigest()
+
+
 def _api_period_range(start: str, stop: str) -> str:
     """Clamp an API policy's ``[start, stop]`` to the supported window and
     return an explicit ``"start.stop"`` key, so :meth:`Reform.from_dict`
@@ -143,6 +181,9 @@ class Reform(TaxBenefitSystem):
     parameter_values: dict = None
     """The parameter values of the reform. This is used to inform any calls to the PolicyEngine API."""
 
+    parametric: bool = False
+    """Whether the reform only updates the values of the parameters in `parameter_values`, as reforms created by `from_dict` do."""
+
     simulation: "Simulation" = None
 
     def __init__(self, baseline: TaxBenefitSystem):
@@ -197,7 +238,7 @@ class Reform(TaxBenefitSystem):
             modifier_function: A function that takes a :obj:`.ParameterNode` and should return an object of the same type.
         """
         baseline_parameters = self.baseline.parameters
-        baseline_parameters_copy = copy.deepcopy(baseline_parameters)
+        baseline_parameters_copy = baseline_parameters.clone()
         reform_parameters = modifier_function(baseline_parameters_copy)
         if not isinstance(reform_parameters, ParameterNode):
             return ValueError(
@@ -253,27 +294,32 @@ class Reform(TaxBenefitSystem):
         """
 
         class reform(Reform):
+            parametric = True
+
             def apply(self):
-                for path, period_values in parameter_values.items():
-                    parameter = self.parameters.get_child(path)
-                    if not isinstance(period_values, dict):
-                        # Scalar shorthand: apply across the default window.
-                        parameter.update(
-                            period=_SCALAR_REFORM_PERIOD, value=period_values
-                        )
-                        continue
-                    # Translate every entry to update kwargs FIRST, so a
-                    # malformed key raises before any parameter is mutated (no
-                    # partial reform). Then apply in ascending start-instant
-                    # order; the stable sort keeps same-start entries in their
-                    # given order (last wins on overlap).
-                    updates = [
-                        _period_key_update_kwargs(period_key, value)
-                        for period_key, value in period_values.items()
-                    ]
-                    updates.sort(key=_update_start_instant)
-                    for update_kwargs in updates:
-                        parameter.update(**update_kwargs)
+                # Cache invalidation and re-uprating run once, after all the
+                # updates.
+                with self.parameters.batch_update():
+                    for path, period_values in parameter_values.items():
+                        parameter = self.parameters.get_child(path)
+                        if not isinstance(period_values, dict):
+                            # Scalar shorthand: apply across the default window.
+                            parameter.update(
+                                period=_SCALAR_REFORM_PERIOD, value=period_values
+                            )
+                            continue
+                        # Translate every entry to update kwargs FIRST, so a
+                        # malformed key raises before any parameter is mutated (no
+                        # partial reform). Then apply in ascending start-instant
+                        # order; the stable sort keeps same-start entries in their
+                        # given order (last wins on overlap).
+                        updates = [
+                            _period_key_update_kwargs(period_key, value)
+                            for period_key, value in period_values.items()
+                        ]
+                        updates.sort(key=_update_start_instant)
+                        for update_kwargs in updates:
+                            parameter.update(**update_kwargs)
 
         reform.country_id = country_id
         reform.parameter_values = parameter_values
@@ -295,6 +341,8 @@ class Reform(TaxBenefitSystem):
             A reform.
         """
 
+        import requests
+
         data = requests.get(
             f"https://api.policyengine.org/{country_id}/policy/{api_id}",
             # Timeout so a stalled API can't hang the caller forever
@@ -322,6 +370,13 @@ class Reform(TaxBenefitSystem):
             data.get("result", {}).get("label", None),
         )
 
+    @classproperty
+    def content_hash(self) -> Optional[str]:
+        """Hash of the parameter updates of a reform created by `from_dict` (see :func:`get_parameter_values_hash`), or None for other reforms."""
+        if not self.parametric or self.parameter_values is None:
+            return None
+        return get_parameter_values_hash(self.parameter_values)
+
     @classproperty
     def api_id(self):
         if self.country_id is None:
@@ -342,6 +397,8 @@ class Reform(TaxBenefitSystem):
                 sanitised_period_values[f"{period.start}.{period.stop}"] = value
             sanitised_parameter_values[path] = sanitised_period_values
 
+        import requests
+
         response = requests.post(
             f"https://api.policyengine.org/{self.country_id}/policy",
             json={
@@ -374,24 +431,7 @@ def set_parameter(
         path = path.name
 
     def modifier(parameters: ParameterNode):
-        node = parameters
-        for name in path.split("."):
-            try:
-                if "[" not in name:
-                    node = node.children[name]
-                else:
-                    try:
-                        name, index = name.split("[")
-                        index = int(index[:-1])
-                        node = node.children[name].brackets[index]
-                    except:
-                        raise ValueError(
-                            "Invalid bracket syntax (should be e.g. tax.brackets[3].rate"
-                        )
-            except:
-                raise ValueError(
-                    f"Could not find the parameter {path} (failed at {name})."
-                )
+        node = parameters.get_child(path)
         node.update(period=period, value=value, start=start, stop=stop)
         return parameters
 
@@ -403,3 +443,70 @@ def set_parameter(
             self.modify_parameters(modifier)
 
     return reform
+
+
+def get_updated_parameter_paths(reform) -> Optional[List[str]]:
+    """Paths of the parameters updated by a reform, a reform dict or a tuple of them.
+
+    Returns None if the reform may do more than update parameter values.
+    """
+    if isinstance(reform, tuple):
+        paths = []
+        for subreform in reform:
+            subreform_paths = get_updated_parameter_paths(subreform)
+            if subreform_paths is None:
+                return None
+            paths += subreform_paths
+        return paths
+    if isinstance(reform, dict):
+        return list(reform)
+    if (
+        isinstance(reform, type)
+        and issubclass(reform, Reform)
+        and reform.parametric
+        and reform.parameter_values is not None
+    ):
+        return list(reform.parameter_values)
+    return None
+
+
+def get_reform_hash(reform) -> Optional[str]:
+    """Hash of a reform, a reform dict or a tuple of them, the same for reforms making the same parameter updates.
+
+    Returns None unless the reform only updates parameter values (see :func:`get_updated_parameter_paths`).
+    """
+    if isinstance(reform, tuple):
+        reform_hashes = [get_reform_hash(subreform) for subreform in reform]
+        if None in reform_hashes:
+            return None
+        return hashlib.sha256(":".join(reform_hashes).encode("utf-8")).hexdigest()
+    if isinstance(reform, dict):
+        return get_parameter_values_hash(reform)
+    if isinstance(reform, type) and issubclass(reform, Reform):
+        return reform.content_hash
+    return None
+
+
+class _ParametricReformReference:
+    # Unpickled as a reform created by Reform.from_dict with the same
+    # arguments, as the classes it creates cannot be pickled.
+
+    def __init__(self, reform: Type[Reform]) -> None:
+        self.arguments = (reform.parameter_values, reform.country_id, reform.name)
+
+    def __reduce__(self):
+        return Reform.from_dict, self.arguments
+
+
+def get_pickleable_reform(reform):
+    """Get an object pickled as a reform, a reform dict or a tuple of them (reforms created by :meth:`Reform.from_dict` are pickled as their arguments)."""
+    if isinstance(reform, tuple):
+        return tuple(get_pickleable_reform(subreform) for subreform in reform)
+    if (
+        isinstance(reform, type)
+        and issubclass(reform, Reform)
+        and reform.parametric
+        and reform.parameter_values is not None
+    ):
+        return _ParametricReformReference(reform)
+    return reform
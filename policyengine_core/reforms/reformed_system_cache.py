@@ -0,0 +1,73 @@
+"""Process-wide cache of reformed tax-benefit systems.
+
+Services simulating the same policies over and over would otherwise derive a
+new reformed system (see :meth:`.TaxBenefitSystem.derive_reformed_system`) for
+every simulation. Systems are cached by baseline system and reform hash (see
+:func:`.get_reform_hash`), so equivalent reform dicts share a system, and each
+caller gets a clone of it (see :meth:`.TaxBenefitSystem.clone`), which it can
+modify without affecting the cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from .reform import get_reform_hash
+
+if TYPE_CHECKING:
+    from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+
+
+class ReformedSystemCache:
+    """
+    Least recently used cache of reformed tax-benefit systems.
+
+    Cached systems are derived once for every caller asking for the same reform of the same baseline, which should not be modified. Callers get clones of them, so that simulations setting themselves on their system, or applying further reforms to it, do not affect each other or the cache.
+    """
+
+    def __init__(self, max_size: int = 32) -> None:
+        self.max_size = max_size
+        """Number of systems kept, across all baselines."""
+        self._systems: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, baseline: TaxBenefitSystem, reform) -> Optional[TaxBenefitSystem]:
+        """
+        Get `baseline` with `reform` applied, deriving it if it is not cached.
+
+        :param baseline: The system to apply the reform to.
+        :param reform: A reform, reform dict or tuple of them.
+        :returns: A clone of the reformed system, or None if it cannot be derived from `baseline` (see :meth:`.TaxBenefitSystem.can_derive_reformed_system`).
+        """
+        reform_hash = get_reform_hash(reform)
+        if reform_hash is None or not baseline.can_derive_reformed_system(reform):
+            return None
+        # Ids are reused after garbage collection, so entries also hold a
+        # weak reference to check their baseline is still the same object.
+        key = (id(baseline), reform_hash)
+        with self._lock:
+            entry = self._systems.get(key)
+            if entry is not None and entry[0]() is baseline:
+                self._systems.move_to_end(key)
+                return entry[1].clone()
+        system = baseline.derive_reformed_system(reform)
+        with self._lock:
+            self._systems[key] = (weakref.ref(baseline), system)
+            self._systems.move_to_end(key)
+            while len(self._systems) > self.max_size:
+                self._systems.popitem(last=False)
+        return system.clone()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._systems.clear()
+
+    def __len__(self) -> int:
+        return len(self._systems)
+
+
+reformed_system_cache = ReformedSystemCache()
+"""The cache used by simulations given a reform."""
@@ -105,12 +105,26 @@ def get_parser():
 
         return parser
 
+    def build_profile_startup_parser(parser):
+        parser.add_argument(
+            "country_package",
+            help="country package whose tax-benefit system to build",
+        )
+
+        return parser
+
     parser_test = subparsers.add_parser("test", help="Run OpenFisca YAML tests")
     parser_test = build_test_parser(parser_test)
 
     parser_data = subparsers.add_parser("data", help="Manage OpenFisca data")
     parser_data = build_data_parser(parser_data)
 
+    parser_profile_startup = subparsers.add_parser(
+        "profile-startup",
+        help="Time each phase of building a tax-benefit system, as JSON",
+    )
+    parser_profile_startup = build_profile_startup_parser(parser_profile_startup)
+
     return parser
 
 
@@ -129,6 +143,11 @@ def main():
 
         return sys.exit(main(parser))
 
+    if args.command == "profile-startup":
+        from policyengine_core.scripts.profile_startup import main
+
+        return sys.exit(main(parser))
+
 
 if __name__ == "__main__":
     sys.exit(main())
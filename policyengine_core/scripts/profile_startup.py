@@ -0,0 +1,15 @@
+import importlib
+import json
+from argparse import ArgumentParser
+
+
+def main(parser: ArgumentParser):
+    args, _ = parser.parse_known_args()
+
+    country_package = importlib.import_module(args.country_package)
+    tax_benefit_system_class = country_package.CountryTaxBenefitSystem
+    tax_benefit_system_class.profile_startup = True
+    tax_benefit_system = tax_benefit_system_class()
+
+    print(json.dumps(tax_benefit_system.startup_profile.to_dict(), indent=2))
+    return 0
@@ -10,3 +10,4 @@ from .microsimulation import Microsimulation
 from .simulation import Simulation
 from .simulation_builder import SimulationBuilder
 from .individual_sim import IndividualSim
+from .worker_pool import CalculationJob, WorkerPool
@@ -1,6 +1,7 @@
-from typing import Dict, Type
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Type
 
-from microdf import MicroDataFrame, MicroSeries
 import numpy as np
 from policyengine_core.data.dataset import Dataset
 from policyengine_core.periods import Period
@@ -9,6 +10,10 @@ from policyengine_core.periods.config import MONTH, YEAR
 from policyengine_core.simulations.simulation import Simulation
 from policyengine_core.types import ArrayLike
 
+if TYPE_CHECKING:
+    # Imported by the methods returning them, as microdf imports pandas.
+    from microdf import MicroDataFrame, MicroSeries
+
 
 class Microsimulation(Simulation):
     """A `Simulation` whose entities use weights to represent larger populations."""
@@ -79,6 +84,8 @@ class Microsimulation(Simulation):
         if not use_weights:
             return values
         weights = self.get_weights(variable_name, period, map_to)
+        from microdf import MicroSeries
+
         return MicroSeries(np.array(values), weights=weights)
 
     def calculate_add(
@@ -92,6 +99,8 @@ class Microsimulation(Simulation):
         if not use_weights:
             return values
         weights = self.get_weights(variable_name, period)
+        from microdf import MicroSeries
+
         return MicroSeries(np.array(values), weights=weights)
 
     def calculate_divide(
@@ -105,6 +114,8 @@ class Microsimulation(Simulation):
         if not use_weights:
             return values
         weights = self.get_weights(variable_name, period)
+        from microdf import MicroSeries
+
         return MicroSeries(np.array(values), weights=weights)
 
     def calculate_dataframe(
@@ -122,4 +133,6 @@ class Microsimulation(Simulation):
         if not use_weights:
             return values
         weights = self.get_weights(variable_names[0], period, map_to)
+        from microdf import MicroDataFrame
+
         return MicroDataFrame(values, weights=weights)
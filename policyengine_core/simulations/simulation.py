@@ -1,16 +1,16 @@
 import hashlib
 import tempfile
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union
 
 import numpy as np
-import pandas as pd
 from numpy.typing import ArrayLike
 import logging
+import sys
 from pathlib import Path
 
 from policyengine_core import commons, periods
-from policyengine_core.data.dataset import Dataset
+from policyengine_core.data.dataset import Dataset, DatasetArray
 from policyengine_core.entities.entity import Entity
 from policyengine_core.enums import Enum, EnumArray
 from policyengine_core.errors import CycleError, SpiralError
@@ -24,7 +24,6 @@ from policyengine_core.tracers import (
     TracingParameterNodeAtInstant,
 )
 import random
-from policyengine_core.tools.hugging_face import *
 from policyengine_core.tools.google_cloud import (
     parse_gs_url,
     download_gcs_file,
@@ -33,6 +32,19 @@ from policyengine_core.tools.google_cloud import (
 import json
 
 
+def _is_dataframe(value: Any) -> bool:
+    # pandas is slow to import, and values can only be data frames if it is
+    # imported already.
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, pandas.DataFrame)
+
+
+def _is_h5_file(value: Any) -> bool:
+    # As for pandas above.
+    h5py = sys.modules.get("h5py")
+    return h5py is not None and isinstance(value, h5py.File)
+
+
 def _stable_hash_to_seed(value: str) -> int:
     """Deterministically hash a string to an int suitable for numpy.random.seed.
 
@@ -45,13 +57,16 @@ def _stable_hash_to_seed(value: str) -> int:
 
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from policyengine_core.taxbenefitsystems import TaxBenefitSystem
 
 from policyengine_core.experimental import MemoryConfig
 from policyengine_core.populations import Population, GroupPopulation
 from policyengine_core.tracers import SimpleTracer
 from policyengine_core.variables import Variable, QuantityType
-from policyengine_core.reforms.reform import Reform
+from policyengine_core.reforms.reform import Reform, get_pickleable_reform
+from policyengine_core.reforms.reformed_system_cache import reformed_system_cache
 from policyengine_core.parameters import get_parameter
 from policyengine_core.simulations.simulation_macro_cache import (
     SimulationMacroCache,
@@ -126,10 +141,19 @@ class Simulation:
         self.default_calculation_period = (
             default_calculation_period or self.default_calculation_period
         )
+        # Whether the reform is already applied to the system.
+        reformed = False
         if tax_benefit_system is None:
-            if self.default_tax_benefit_system_instance is not None and reform is None:
-                tax_benefit_system = self.default_tax_benefit_system_instance
-            else:
+            baseline = self.default_tax_benefit_system_instance
+            if baseline is not None and reform is None:
+                tax_benefit_system = baseline
+            elif (
+                baseline is not None
+                and type(baseline) is self.default_tax_benefit_system
+            ):
+                tax_benefit_system = reformed_system_cache.get(baseline, reform)
+                reformed = tax_benefit_system is not None
+            if tax_benefit_system is None:
                 tax_benefit_system = self.default_tax_benefit_system(reform=reform)
             self.tax_benefit_system = tax_benefit_system
 
@@ -186,6 +210,11 @@ class Simulation:
         if dataset is not None:
             if isinstance(dataset, str):
                 if "hf://" in dataset:
+                    from policyengine_core.tools.hugging_face import (
+                        download_huggingface_dataset,
+                        parse_hf_url,
+                    )
+
                     owner, repo, filename, version = parse_hf_url(dataset)
                     dataset = download_huggingface_dataset(
                         repo=f"{owner}/{repo}",
@@ -206,7 +235,7 @@ class Simulation:
                     dataset = Dataset.from_file(dataset, self.default_input_period)
             if isinstance(dataset, type):
                 self.dataset: Dataset = dataset(require=True)
-            elif isinstance(dataset, pd.DataFrame):
+            elif _is_dataframe(dataset):
                 self.dataset = Dataset.from_dataframe(
                     dataset, self.default_input_period
                 )
@@ -216,18 +245,14 @@ class Simulation:
 
         self.tax_benefit_system.simulation = self
 
-        if self.reform is not None:
+        if self.reform is not None and not reformed:
             self.tax_benefit_system.apply_reform_set(self.reform)
 
         # Backwards compatibility methods
         self.calc = self.calculate
         self.df = self.calculate_dataframe
 
-        self.input_variables = [
-            variable.name
-            for variable in self.tax_benefit_system.variables.values()
-            if len(self.get_holder(variable.name).get_known_periods()) > 0
-        ]
+        self.input_variables = self.get_input_variable_names()
 
         self.situation_input = situation
         if self.situation_input is not None:
@@ -383,7 +408,12 @@ class Simulation:
         builder.populations = self.populations
 
         try:
-            data = self.dataset.load()
+            if self.dataset.data_format == Dataset.ARRAY_DIRECTORY:
+                # Only the arrays needed to build the entities are mapped
+                # here, the others once calculations need them.
+                data = self.dataset._load_index()
+            else:
+                data = self.dataset.load()
         except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"The dataset file {self.dataset.name} could not be found. "
@@ -405,6 +435,8 @@ class Simulation:
                         return data[col]
             elif self.dataset.data_format == Dataset.TIME_PERIOD_ARRAYS:
                 return data[name][list(data[name].keys())[0]]
+            elif self.dataset.data_format == Dataset.ARRAY_DIRECTORY:
+                return self.dataset.load(f"{name}/{next(iter(data[name]))}")
             return data[name]
 
         if self.dataset.data_format != Dataset.FLAT_FILE:
@@ -468,15 +500,38 @@ class Simulation:
             data = data_copy
 
         if self.dataset.data_format != Dataset.FLAT_FILE:
+            # Arrays of HDF5 files and array directories are only read once
+            # a calculation needs them (see Holder.set_lazy_input).
+            lazy = (
+                _is_h5_file(data) or self.dataset.data_format == Dataset.ARRAY_DIRECTORY
+            )
             for variable in data:
                 if variable in self.tax_benefit_system.variables:
-                    if self.dataset.data_format == Dataset.TIME_PERIOD_ARRAYS:
+                    if self.dataset.data_format in (
+                        Dataset.TIME_PERIOD_ARRAYS,
+                        Dataset.ARRAY_DIRECTORY,
+                    ):
                         for time_period in data[variable]:
-                            self.set_input(
-                                variable,
-                                time_period,
-                                data[variable][time_period],
-                            )
+                            if lazy:
+                                self.set_lazy_input(
+                                    variable,
+                                    time_period,
+                                    DatasetArray(
+                                        self.dataset, f"{variable}/{time_period}"
+                                    ),
+                                )
+                            else:
+                                self.set_input(
+                                    variable,
+                                    time_period,
+                                    data[variable][time_period],
+                                )
+                    elif lazy:
+                        self.set_lazy_input(
+                            variable,
+                            self.dataset.time_period,
+                            DatasetArray(self.dataset, variable),
+                        )
                     else:
                         self.set_input(
                             variable, self.dataset.time_period, data[variable]
@@ -484,6 +539,8 @@ class Simulation:
                 else:
                     # Silently skip.
                     pass
+            if _is_h5_file(data):
+                data.close()
         else:
             for variable in data:
                 if "__" in variable:
@@ -676,7 +733,7 @@ class Simulation:
         variable_names: List[str],
         period: Period = None,
         map_to: str = None,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """Calculate ``variable_names`` for ``period``.
 
         Args:
@@ -695,6 +752,8 @@ class Simulation:
         for variable_name in variable_names:
             if variable_name not in self.tax_benefit_system.variables:
                 raise ValueError(f"Variable {variable_name} does not exist.")
+        import pandas as pd
+
         df = pd.DataFrame()
         entities = [
             self.tax_benefit_system.get_variable(variable_name).entity.key
@@ -870,15 +929,15 @@ class Simulation:
                     array = holder.default_array()
 
             if variable.defined_for is not None:
-                array = np.where(mask, array, variable.default_value)
                 if variable.value_type == Enum:
-                    array = np.array(
-                        [
-                            item.index if isinstance(item, Enum) else item
-                            for item in array
-                        ]
+                    if not (isinstance(array, np.ndarray) and array.dtype.kind in "iu"):
+                        array = variable.possible_values.encode(array)
+                    array = EnumArray(
+                        np.where(mask, array, variable.default_value.index),
+                        variable.possible_values,
                     )
-                    array = EnumArray(array, variable.possible_values)
+                else:
+                    array = np.where(mask, array, variable.default_value)
 
             array = self._cast_formula_result(array, variable)
             holder.put_in_cache(array, period, self.branch_name)
@@ -1352,12 +1411,55 @@ class Simulation:
         if _fast_cache is not None:
             _fast_cache.pop((variable_name, period), None)
 
-    def get_variable_population(self, variable_name: str) -> Population:
+    def set_lazy_input(
+        self,
+        variable_name: str,
+        period: Period,
+        load: Callable[[], ArrayLike],
+    ) -> None:
+        """
+        Set a variable's value for a given period to the array returned by ``load``, called the first time the variable's values are needed.
+
+        :param variable_name: the variable to be set
+        :param period: the period for which the value is set
+        :param load: function returning the input value, e.g. a :class:`.DatasetArray`
+        """
+        period = periods.period(period)
+        if self.start_instant is None or self.start_instant > period.start:
+            self.start_instant = period.start
         variable = self.tax_benefit_system.get_variable(
             variable_name, check_existence=True
         )
+        if (variable.end is not None) and (period.start.date > variable.end):
+            return
+        self.get_holder(variable_name).set_lazy_input(period, load, self.branch_name)
+        _fast_cache = getattr(self, "_fast_cache", None)
+        if _fast_cache is not None:
+            _fast_cache.pop((variable_name, period), None)
+
+    def get_variable_population(self, variable_name: str) -> Population:
+        # The entity of a variable is known without loading it (see
+        # TaxBenefitSystem.get_variable_metadata).
+        get_variable = getattr(
+            self.tax_benefit_system,
+            "get_variable_metadata",
+            self.tax_benefit_system.get_variable,
+        )
+        variable = get_variable(variable_name, check_existence=True)
         return self.populations[variable.entity.key]
 
+    def get_input_variable_names(self) -> List[str]:
+        """Get the names of the variables with known values, in the order of the tax-benefit system."""
+        # Variables not loaded yet (see TaxBenefitSystem.variable_manifest_path)
+        # cannot have values, and are skipped without loading them.
+        variables = self.tax_benefit_system.variables
+        is_loaded = getattr(variables, "is_loaded", lambda variable_name: True)
+        return [
+            variable_name
+            for variable_name in variables
+            if is_loaded(variable_name) and self.get_holder(variable_name).has_values()
+        ]
+
     def get_population(self, plural: str = None) -> Population:
         return next(
             (
@@ -1421,6 +1523,13 @@ class Simulation:
 
         return new
 
+    def __getstate__(self) -> dict:
+        # See policyengine_core.pickling for pickling simulations to hand them
+        # to other processes.
+        state = self.__dict__.copy()
+        state["reform"] = get_pickleable_reform(state.get("reform"))
+        return state
+
     def get_branch(
         self, name: str = "branch", clone_system: bool = False
     ) -> "Simulation":
@@ -1502,68 +1611,90 @@ class Simulation:
         Returns:
             dict: A dictionary containing the person's values.
         """
-        situation = {}
-        people_indices = []
-        people_indices_by_entity = {}
+        return self.extract_people([index], exclude_entities=exclude_entities)[0]
 
-        for population in self.populations.values():
-            entity = population.entity
-            if not population.entity.is_person and entity.key not in exclude_entities:
+    def extract_people(
+        self,
+        indices: ArrayLike,
+        exclude_entities: tuple = ("state",),
+    ) -> List[dict]:
+        """
+        Extract several people from the simulation. Returns one situation JSON per person, each with their inputs (including their containing entities).
+
+        Input arrays are read once and shared by every extracted situation, and co-members are found through each population's member index rather than a scan of all persons.
+
+        Args:
+            indices (ArrayLike): The indices of the people to extract.
+
+        Returns:
+            List[dict]: One situation dictionary per index, in the order given.
+        """
+        person = self.persons.entity
+        group_populations = [
+            population
+            for population in self.populations.values()
+            if not population.entity.is_person
+            and population.entity.key not in exclude_entities
+        ]
+
+        input_values_by_entity = {}
+        for variable in self.input_variables:
+            known_periods = self.get_holder(variable).get_known_periods()
+            if len(known_periods) > 0:
+                entity_key = self.tax_benefit_system.get_variable(variable).entity.key
+                first_known_period = known_periods[0]
+                input_values_by_entity.setdefault(entity_key, []).append(
+                    (
+                        variable,
+                        str(first_known_period),
+                        self.calculate(variable, first_known_period),
+                    )
+                )
+
+        situations = []
+        for index in indices:
+            situation = {}
+            people_indices = set()
+            people_indices_by_entity = {}
+
+            for population in group_populations:
+                entity = population.entity
+                group_index = population.members_entity_id[index]
                 situation[entity.plural] = {
                     entity.key: {
                         "members": [],
                     },
                 }
-                group_index = population.members_entity_id[index]
-                other_people_indices = [
-                    index
-                    for index in range(len(population.members_entity_id))
-                    if population.members_entity_id[index] == group_index
-                ]
-
-                people_indices.extend(other_people_indices)
-                people_indices = list(set(people_indices))
-                people_indices_by_entity[entity.key] = other_people_indices
-                for variable in self.input_variables:
-                    if (
-                        self.tax_benefit_system.get_variable(variable).entity.key
-                        == entity.key
-                    ):
-                        known_periods = self.get_holder(variable).get_known_periods()
-                        if len(known_periods) > 0:
-                            first_known_period = known_periods[0]
-                            value = self.calculate(variable, first_known_period)[
-                                group_index
-                            ]
-                            situation[entity.plural][entity.key][variable] = {
-                                str(known_periods[0]): value
-                            }
-
-        person = self.populations["person"].entity
-        situation[person.plural] = {}
-        for person_index in people_indices:
-            person_name = f"{person.key}_{person_index + 1}"
-            for entity_key in people_indices_by_entity:
-                entity = self.populations[entity_key].entity
-                if person_index in people_indices_by_entity[entity.key]:
-                    situation[entity.plural][entity.key]["members"].append(person_name)
-            situation[person.plural][person_name] = {}
-            for variable in self.input_variables:
-                if (
-                    self.tax_benefit_system.get_variable(variable).entity.key
-                    == person.key
+                member_indices = population.get_member_indices(group_index).tolist()
+                people_indices.update(member_indices)
+                people_indices_by_entity[entity.key] = set(member_indices)
+                for variable, period, values in input_values_by_entity.get(
+                    entity.key, []
+                ):
+                    situation[entity.plural][entity.key][variable] = {
+                        period: values[group_index]
+                    }
+
+            situation[person.plural] = {}
+            for person_index in sorted(people_indices):
+                person_name = f"{person.key}_{person_index + 1}"
+                for population in group_populations:
+                    entity = population.entity
+                    if person_index in people_indices_by_entity[entity.key]:
+                        situation[entity.plural][entity.key]["members"].append(
+                            person_name
+                        )
+                situation[person.plural][person_name] = {}
+                for variable, period, values in input_values_by_entity.get(
+                    person.key, []
                 ):
-                    known_periods = self.get_holder(variable).get_known_periods()
-                    if len(known_periods) > 0:
-                        first_known_period = known_periods[0]
-                        value = self.calculate(variable, first_known_period)[
-                            person_index
-                        ]
-                        situation[person.plural][person_name][variable] = {
-                            str(known_periods[0]): value
-                        }
-
-        return json.loads(json.dumps(situation, cls=NpEncoder))
+                    situation[person.plural][person_name][variable] = {
+                        period: values[person_index]
+                    }
+
+            situations.append(json.loads(json.dumps(situation, cls=NpEncoder)))
+
+        return situations
 
     def check_macro_cache(self, variable_name: str, period: str) -> bool:
         """
@@ -1656,6 +1787,8 @@ class Simulation:
         if not self._is_exportable_input_variable(variable_name):
             return []
 
+        # Inputs only count as user inputs once read.
+        self.get_holder(variable_name).load_lazy_inputs()
         user_input_periods = {
             period
             for input_variable_name, branch_name, period in getattr(
@@ -1676,7 +1809,7 @@ class Simulation:
     def to_input_dataframe(
         self,
         include_computed_variables: bool = False,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """Exports a DataFrame that can be loaded back into a new Simulation.
 
         By default, only structurally input variables populated through
@@ -1690,6 +1823,7 @@ class Simulation:
         Returns:
             pd.DataFrame: The DataFrame containing the input values.
         """
+        import pandas as pd
 
         df = pd.DataFrame()
 
@@ -1756,6 +1890,8 @@ class Simulation:
         Returns:
             Simulation: The quantized simulation.
         """
+        import pandas as pd
+
         default_calculation_period = self.default_calculation_period
         # Set default key if not provided
         if seed is None:
@@ -87,11 +87,7 @@ class SimulationBuilder:
                 tax_benefit_system, input_dict, simulation
             )
 
-        simulation.input_variables = [
-            variable.name
-            for variable in simulation.tax_benefit_system.variables.values()
-            if len(simulation.get_holder(variable.name).get_known_periods()) > 0
-        ]
+        simulation.input_variables = simulation.get_input_variable_names()
 
         return simulation
 
@@ -120,7 +116,7 @@ class SimulationBuilder:
             )
 
         # Register variables so get_variable_entity can find them
-        for variable_name, _variable in tax_benefit_system.variables.items():
+        for variable_name in tax_benefit_system.variables:
             self.register_variable(
                 variable_name,
                 simulation.get_variable_population(variable_name).entity,
@@ -1,6 +1,5 @@
 import shutil
 from pathlib import Path
-import h5py
 from numpy.typing import ArrayLike
 import importlib.metadata
 
@@ -44,6 +43,8 @@ class SimulationMacroCache:
         )
 
     def set_cache_value(self, cache_file_path: Path, value: ArrayLike):
+        import h5py
+
         with h5py.File(cache_file_path, "w") as f:
             f.create_dataset(
                 "metadata:core_version",
@@ -59,6 +60,8 @@ class SimulationMacroCache:
         return self.cache_file_path
 
     def get_cache_value(self, cache_file_path: Path):
+        import h5py
+
         with h5py.File(cache_file_path, "r") as f:
             # Validate both core version and country package metadata are up-to-date, otherwise flush the cache
             if "metadata:core_version" in f and "metadata:country_version" in f:
@@ -0,0 +1,163 @@
+"""Pool of forked processes running calculations against one pre-warmed tax-benefit system.
+
+A service whose processes each build their own tax-benefit system holds one
+copy of the parameter tree, the variables and their caches per process. A
+:class:`WorkerPool` builds and warms the system once, then forks its workers,
+which share the parent's memory pages copy-on-write as long as they only read
+them. ``gc.freeze`` moves the parent's objects out of the garbage collector's
+reach first, so that collections in the workers do not write to (and copy)
+those pages.
+
+Workers are forked, so pools are not available on platforms without the
+``fork`` start method, such as Windows.
+"""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Type
+
+import numpy as np
+
+from policyengine_core.parameters import ParameterNodeAtInstant
+from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+
+from .simulation import Simulation
+
+
+@dataclass
+class CalculationJob:
+    """
+    Calculation run by a :class:`WorkerPool`: the simulation built from `situation` or `dataset`, with `reform` if any, calculates each of `variables` for `period`.
+
+    Jobs are pickled to reach the workers, so reforms must be dicts, tuples of them or importable reform classes.
+    """
+
+    variables: List[str]
+    period: str = None
+    situation: dict = None
+    dataset: Any = None
+    reform: Any = None
+
+
+def warm_tax_benefit_system(
+    tax_benefit_system: TaxBenefitSystem, years: Iterable[int] = ()
+) -> None:
+    """
+    Load every variable of a system, and resolve its parameters at the start of each of `years`, so that processes forked afterwards share them.
+    """
+    for _ in tax_benefit_system.variables.values():
+        pass
+    for year in years:
+        _resolve_children(tax_benefit_system.get_parameters_at_instant(year))
+
+
+def _resolve_children(node_at_instant: ParameterNodeAtInstant) -> None:
+    for name in node_at_instant:
+        child = node_at_instant[name]
+        if isinstance(child, ParameterNodeAtInstant):
+            _resolve_children(child)
+
+
+_simulation_class: Type[Simulation] = None
+# Simulation class of the pool this process is a worker of.
+
+
+def _initialize_worker(simulation_class: Type[Simulation]) -> None:
+    global _simulation_class
+    _simulation_class = simulation_class
+
+
+def _run_job(job: CalculationJob) -> Dict[str, np.ndarray]:
+    simulation = _simulation_class(
+        situation=job.situation, dataset=job.dataset, reform=job.reform
+    )
+    return {
+        variable: np.asarray(simulation.calculate(variable, job.period))
+        for variable in job.variables
+    }
+
+
+class WorkerPool:
+    """
+    Processes forked from this one, after building and warming the default tax-benefit system of a simulation class, to run :class:`CalculationJob` objects.
+
+    >>> with WorkerPool(Simulation, workers=4, years=[2024, 2025]) as pool:
+    ...     future = pool.submit(CalculationJob(["income_tax"], "2024", situation=situation))
+    ...     future.result()["income_tax"]
+
+    Systems of reformed jobs are derived from the shared baseline in each worker (see :data:`.reformed_system_cache`).
+    """
+
+    def __init__(
+        self,
+        simulation_class: Type[Simulation],
+        workers: int = None,
+        years: Iterable[int] = (),
+    ) -> None:
+        """
+        :param simulation_class: Class of the simulations run by the workers. If it has no `default_tax_benefit_system_instance`, the workers share one built by :meth:`start`.
+        :param workers: Number of worker processes. Defaults to the number of CPUs.
+        :param years: Years at the start of which parameters are resolved before forking.
+        """
+        self.simulation_class = simulation_class
+        self.workers: int = workers or os.cpu_count()
+        self.years: List[int] = list(years)
+        self._executor: ProcessPoolExecutor = None
+
+    def start(self) -> "WorkerPool":
+        """
+        Build and warm the baseline system, and fork the workers. Called by the first submitted job if needed.
+
+        Objects of this process stay frozen (see ``gc.freeze``) afterwards, so that this process does not copy the pages it shares with the workers either.
+        """
+        if self._executor is not None:
+            return self
+        simulation_class = self.simulation_class
+        tax_benefit_system = simulation_class.default_tax_benefit_system_instance
+        if tax_benefit_system is None:
+            tax_benefit_system = simulation_class.default_tax_benefit_system()
+            simulation_class = type(
+                simulation_class.__name__,
+                (simulation_class,),
+                {"default_tax_benefit_system_instance": tax_benefit_system},
+            )
+        warm_tax_benefit_system(tax_benefit_system, self.years)
+        gc.collect()
+        gc.freeze()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_initialize_worker,
+            initargs=(simulation_class,),
+        )
+        # Fork every worker now, while this process is warm and frozen.
+        for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+        return self
+
+    def submit(self, job: CalculationJob) -> Future:
+        """Queue a job. The future's result maps each variable of the job to its values."""
+        self.start()
+        return self._executor.submit(_run_job, job)
+
+    def map(self, jobs: Iterable[CalculationJob]) -> Iterator[Dict[str, np.ndarray]]:
+        """Queue jobs, and iterate over their results in order."""
+        futures = [self.submit(job) for job in jobs]
+        return (future.result() for future in futures)
+
+    def close(self) -> None:
+        """Wait for the queued jobs to finish, and stop the workers."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,142 @@
+"""Persistent cache of fully processed parameter trees.
+
+Building a tax-benefit system's parameters means parsing every YAML file and
+then homogenising, propagating metadata, interpolating, uprating and adding
+abolition parameters. The result only depends on the parameter files, the
+variables and the code doing the processing, so it can be pickled once and
+loaded directly by later processes.
+
+The cache directory must be trusted: cached trees are loaded with ``pickle``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from policyengine_core.enums import Enum
+from policyengine_core.parameters import ParameterNode
+
+from .variable_manifest import VariableStub
+
+if TYPE_CHECKING:
+    from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+
+log = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".parameters.pkl"
+
+
+def _get_core_version() -> str:
+    try:
+        return importlib.metadata.version("policyengine-core")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_parameter_cache_key(tax_benefit_system: "TaxBenefitSystem") -> str:
+    """Hash everything the processed parameter tree of a system depends on.
+
+    That is: the contents of every file under ``parameters_dir``, the
+    attributes of each variable that parameter processing reads, the system
+    class and country package version, and the core and Python versions.
+    """
+    digest = hashlib.sha256()
+
+    def update(*parts) -> None:
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+
+    system_class = type(tax_benefit_system)
+    update(
+        _get_core_version(),
+        sys.version_info[:2],
+        system_class.__module__,
+        system_class.__qualname__,
+        tax_benefit_system.get_package_metadata()["version"],
+    )
+
+    parameters_dir = Path(tax_benefit_system.parameters_dir)
+    for directory, subdirectories, file_names in os.walk(parameters_dir):
+        subdirectories.sort()
+        for file_name in sorted(file_names):
+            file_path = Path(directory) / file_name
+            update(file_path.relative_to(parameters_dir).as_posix())
+            digest.update(file_path.read_bytes())
+
+    variables = tax_benefit_system.variables
+    for name in sorted(variables):
+        # Variables not loaded yet are described by their manifest stub.
+        variable = variables.get_metadata(name)
+        if isinstance(variable, VariableStub):
+            possible_values = variable.possible_value_names
+        elif variable.value_type == Enum:
+            possible_values = [item.name for item in variable.possible_values]
+        else:
+            possible_values = None
+        update(
+            name,
+            variable.entity.key,
+            variable.value_type.__name__,
+            variable.label,
+            variable.is_input_variable(),
+            possible_values,
+        )
+
+    return digest.hexdigest()
+
+
+def _get_cache_file(cache_dir: str, key: str) -> Path:
+    return Path(cache_dir) / f"{key}{CACHE_FILE_SUFFIX}"
+
+
+def load_cached_parameters(cache_dir: str, key: str) -> Optional[ParameterNode]:
+    """Load the parameter tree cached under ``key``, or return None if there is no usable entry."""
+    cache_file = _get_cache_file(cache_dir, key)
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            parameters = pickle.load(f)
+    except Exception:
+        log.warning(
+            f"Ignoring unreadable parameter cache file {cache_file}.",
+            exc_info=True,
+        )
+        return None
+    if not isinstance(parameters, ParameterNode):
+        return None
+    return parameters
+
+
+def save_cached_parameters(cache_dir: str, key: str, parameters: ParameterNode) -> None:
+    """Cache ``parameters`` under ``key``.
+
+    The file is written to a temporary name and then renamed, so concurrent
+    workers never read a partially written cache.
+    """
+    cache_file = _get_cache_file(cache_dir, key)
+    temporary_file = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as f:
+            temporary_file = f.name
+            pickle.dump(parameters, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, cache_file)
+    except Exception:
+        log.warning(
+            f"Could not write parameter cache file {cache_file}.",
+            exc_info=True,
+        )
+        if temporary_file is not None and os.path.exists(temporary_file):
+            os.remove(temporary_file)
@@ -0,0 +1,71 @@
+"""Timings of the construction of tax-benefit systems.
+
+Systems whose class sets ``profile_startup`` record how long each phase of
+their construction took in a :class:`StartupProfile`, available as their
+``startup_profile``. The ``policyengine-core profile-startup`` command prints
+it for a country package.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional
+
+
+class StartupProfile:
+    """
+    How long each phase of building a tax-benefit system took.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+        """Seconds spent in each phase, in the order the phases first ran. Phases running several times are summed."""
+        self.details: Dict[str, Dict[str, float]] = {}
+        """Seconds spent on each item of some phases, by phase: each variable directory, each parameter file and each uprated parameter."""
+        self.peak_memory: Optional[int] = None
+        """Peak resident memory of the process once the system was built, in bytes, or None if the platform does not report it."""
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block as the phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def get_details(self, phase: str) -> Dict[str, float]:
+        """Get the dict recording the time spent on each item of `phase`."""
+        return self.details.setdefault(phase, {})
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "phases": dict(self.phases),
+            "details": {phase: dict(items) for phase, items in self.details.items()},
+            "peak_memory": self.peak_memory,
+        }
+
+
+def profile_phase(profile: Optional[StartupProfile], name: str):
+    """Time a block as the phase `name` of `profile`, if it is not None."""
+    if profile is None:
+        return nullcontext()
+    return profile.phase(name)
+
+
+def get_peak_memory() -> Optional[int]:
+    """Peak resident memory of the process in bytes, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -9,8 +9,10 @@ import os
 import yaml
 from pathlib import Path
 import sys
+import time
 import traceback
 import typing
+from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -35,6 +37,7 @@ from policyengine_core.parameters import (
     ParameterNode,
     ParameterNodeAtInstant,
     Parameter,
+    load_parameter_directory,
 )
 from policyengine_core.parameters.operations.homogenize_parameters import (
     homogenize_parameter_structures,
@@ -45,13 +48,34 @@ from policyengine_core.parameters.operations.interpolate_parameters import (
 from policyengine_core.parameters.operations.propagate_parameter_metadata import (
     propagate_parameter_metadata,
 )
+from policyengine_core.parameters import helpers as parameter_helpers
+from policyengine_core.parameters.helpers import _unshare
 from policyengine_core.parameters.operations.uprate_parameters import (
+    get_path_from_root,
+    uprate_dependents,
     uprate_parameters,
 )
 from policyengine_core.periods import Instant, Period
+from policyengine_core.pickling import (
+    register_reference_system,
+    register_variable_module,
+)
 from policyengine_core.populations import GroupPopulation, Population
 from policyengine_core.variables import Variable
 
+from .parameter_cache import (
+    get_parameter_cache_key,
+    load_cached_parameters,
+    save_cached_parameters,
+)
+from .startup_profile import StartupProfile, get_peak_memory, profile_phase
+from .variable_manifest import (
+    VariableDict,
+    VariableStub,
+    add_variable_stubs,
+    load_variable_manifest,
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -92,6 +116,20 @@ class TaxBenefitSystem:
     """Short list of basic inputs to get medium accuracy."""
     modelled_policies: str = None
     """A YAML filepath containing metadata describing the modelled policies."""
+    parameter_cache_dir: str = None
+    """Directory in which to cache the fully processed parameter tree between processes, keyed by a hash of the parameter files, the variables and the package versions. Caching is disabled if None. The directory must be trusted, as cached trees are unpickled."""
+    parameter_loading_workers: int = None
+    """Number of workers parsing parameter files concurrently. Files are parsed one after the other if None."""
+    parameter_loading_in_processes: bool = False
+    """Whether parameter files are parsed in a process pool rather than a thread pool (see `parameter_loading_workers`)."""
+    derive_reformed_systems: bool = None
+    """Whether simulations given a reform that only updates parameter values derive the reformed system from `Simulation.default_tax_benefit_system_instance` (see :meth:`derive_reformed_system`) rather than building it from the parameter and variable files. If None, they do unless the class overrides `__init__`, which may do more with the reform than apply it."""
+    profile_startup: bool = False
+    """Whether the constructor times each of its phases, in `startup_profile` (see :class:`.StartupProfile`)."""
+    startup_profile: StartupProfile = None
+    """How long each phase of the construction of the system took, if `profile_startup` is set."""
+    variable_manifest_path: str = None
+    """Manifest of the variables under `variables_dir`, written by :func:`.save_variable_manifest`. If set, variables are registered from the manifest and the file defining a variable is only imported when the variable is first needed. A manifest not matching the variable files is ignored."""
 
     def __init__(self, entities: Sequence[Entity] = None, reform=None) -> None:
         if entities is None:
@@ -103,7 +141,7 @@ class TaxBenefitSystem:
         # TODO: Currently: Don't use a weakref, because they are cleared by Paste (at least) at each call.
         self.parameters: Optional[ParameterNode] = None
         self._parameters_at_instant_cache = {}  # weakref.WeakValueDictionary()
-        self.variables: Dict[Any, Any] = {}
+        self.variables: Dict[Any, Any] = VariableDict()
         # Tax benefit systems are mutable, so entities (which need to know about our variables) can't be shared among them
         if entities is None or len(entities) == 0:
             raise Exception("A tax and benefit sytem must have at least an entity.")
@@ -117,26 +155,93 @@ class TaxBenefitSystem:
             entity.set_tax_benefit_system(self)
 
         self.variable_module_metadata = {}
+        self._variable_module_names: Dict[str, str] = {}
+        self.startup_profile = profile = (
+            StartupProfile() if self.profile_startup else None
+        )
 
         if self.variables_dir is not None:
-            self.add_variables_from_directory(self.variables_dir)
+            with profile_phase(profile, "variables"):
+                manifest = None
+                if self.variable_manifest_path is not None:
+                    manifest = load_variable_manifest(
+                        self.variable_manifest_path,
+                        self.variables_dir,
+                        self.get_package_metadata()["version"],
+                    )
+                if manifest is not None:
+                    add_variable_stubs(self, manifest)
+                else:
+                    self.add_variables_from_directory(self.variables_dir)
         self.data_modified = False
 
         if self.parameters_dir is not None:
-            self.load_parameters(self.parameters_dir)
-            self.parameters.add_child("baseline", self.parameters.clone())
-            if reform:
-                self.apply_reform_set(reform)
-            self.parameters = homogenize_parameter_structures(
-                self.parameters, self.variables
+            # Reforms passed to the constructor can do anything to the tree,
+            # so only plain baseline systems use the parameter cache.
+            parameter_cache_key = None
+            if self.parameter_cache_dir is not None and not reform:
+                with profile_phase(profile, "load_cached_parameters"):
+                    parameter_cache_key = get_parameter_cache_key(self)
+                    self.parameters = load_cached_parameters(
+                        self.parameter_cache_dir, parameter_cache_key
+                    )
+            if self.parameters is None:
+                with profile_phase(profile, "load_parameters"):
+                    self._load_parameters_profiled(self.parameters_dir)
+                # The tree is processed in place below, bypassing the
+                # copy-on-write hooks, so the baseline copy must be complete.
+                with profile_phase(profile, "clone_baseline"):
+                    self.parameters.add_child(
+                        "baseline", self.parameters.clone(copy_on_write=False)
+                    )
+                if reform:
+                    with profile_phase(profile, "reform"):
+                        self.apply_reform_set(reform)
+                with profile_phase(profile, "homogenize"):
+                    self.parameters = homogenize_parameter_structures(
+                        self.parameters, self.variables
+                    )
+                with profile_phase(profile, "propagate_metadata"):
+                    self.parameters = propagate_parameter_metadata(self.parameters)
+                with profile_phase(profile, "interpolate"):
+                    self.parameters = interpolate_parameters(self.parameters)
+                with profile_phase(profile, "uprate"):
+                    self.parameters = uprate_parameters(
+                        self.parameters,
+                        durations=(
+                            None if profile is None else profile.get_details("uprate")
+                        ),
+                    )
+                with profile_phase(profile, "propagate_metadata"):
+                    self.parameters = propagate_parameter_metadata(self.parameters)
+                with profile_phase(profile, "abolitions"):
+                    self.add_abolition_parameters()
+                if parameter_cache_key is not None:
+                    with profile_phase(profile, "save_cached_parameters"):
+                        save_cached_parameters(
+                            self.parameter_cache_dir,
+                            parameter_cache_key,
+                            self.parameters,
+                        )
+
+        with profile_phase(profile, "modelled_policies"):
+            self.add_modelled_policy_metadata()
+        if profile is not None:
+            profile.peak_memory = get_peak_memory()
+        if self.variables_dir is not None and not reform:
+            register_reference_system(self)
+
+    def _load_parameters_profiled(self, path_to_yaml_dir: str) -> None:
+        # Like load_parameters, recording the time spent parsing each file
+        # if profiling.
+        if self.startup_profile is not None:
+            parameter_helpers._yaml_load_durations = self.startup_profile.get_details(
+                "load_parameters"
             )
-            self.parameters = propagate_parameter_metadata(self.parameters)
-            self.parameters = interpolate_parameters(self.parameters)
-            self.parameters = uprate_parameters(self.parameters)
-            self.parameters = propagate_parameter_metadata(self.parameters)
-            self.add_abolition_parameters()
-
-        self.add_modelled_policy_metadata()
+        try:
+            self.load_parameters(path_to_yaml_dir)
+        finally:
+            parameter_helpers._yaml_load_durations = None
 
     def apply_reform_set(self, reform):
         if isinstance(reform, tuple):
@@ -149,6 +254,62 @@ class TaxBenefitSystem:
                 reform = Reform.from_dict(reform)
             reform.apply(self)
 
+    def can_derive_reformed_system(self, reform) -> bool:
+        """
+        Whether :meth:`derive_reformed_system` gives the system this class builds with `reform`.
+
+        The reform must only update the values of parameters, none of them interpolated, and the class must allow it (see `derive_reformed_systems`).
+        """
+        from policyengine_core.reforms.reform import get_updated_parameter_paths
+
+        derive = self.derive_reformed_systems
+        if derive is None:
+            derive = type(self).__init__ is TaxBenefitSystem.__init__
+        if not derive or self.parameters is None:
+            return False
+        paths = get_updated_parameter_paths(reform)
+        if paths is None:
+            return False
+        for path in paths:
+            try:
+                parameter = self.parameters.get_child(path)
+            except ValueError:
+                return False
+            if not isinstance(parameter, Parameter):
+                return False
+            if "interpolation" in parameter.metadata:
+                return False
+        return True
+
+    def derive_reformed_system(self, reform) -> "TaxBenefitSystem":
+        """
+        Get a copy of this system with a reform applied, as if the reform had been given to the constructor.
+
+        The constructor applies the reform before processing the parameter tree. Here, the processed tree is cloned and the reform applied to it: updated parameters that are uprated lose their uprated values first, and they and the parameters uprated from them are uprated again afterwards. Only valid if :meth:`can_derive_reformed_system` is true.
+        """
+        from policyengine_core.reforms.reform import get_updated_parameter_paths
+
+        system = self.clone()
+        # The copy is not used by the last simulation of this system.
+        system.__dict__.pop("simulation", None)
+        root = system.parameters
+        uprated_parameter_paths = set(getattr(root, "uprated_parameter_paths", ()))
+        uprated_parameters = []
+        for path in get_updated_parameter_paths(reform):
+            parameter = root.get_child(path)
+            if get_path_from_root(parameter) not in uprated_parameter_paths:
+                continue
+            # Before processing, the reform only sees the explicit values.
+            _unshare(parameter)
+            parameter.values_list = [
+                value for value in parameter.values_list if not value.uprated
+            ]
+            parameter.parent.clear_parent_cache()
+            uprated_parameters.append(parameter)
+        system.apply_reform_set(reform)
+        uprate_dependents(*uprated_parameters, include_parameters=True)
+        return system
+
     def add_abolition_parameters(self):
         if self.parameters is None or "gov" not in self.parameters.children:
             return
@@ -157,7 +318,7 @@ class TaxBenefitSystem:
                 "label": "Abolitions",
             }
         }
-        for variable in self.variables.values():
+        for variable in self.variables.metadata_values():
             if variable.is_input_variable() or variable.value_type not in (
                 bool,
                 float,
@@ -268,65 +429,95 @@ class TaxBenefitSystem:
         Adds all OpenFisca variables contained in a given file to the tax and benefit system.
         """
         try:
-            file_name = os.path.splitext(os.path.basename(file_path))[0]
-
-            path = Path(file_path)
-
-            # Get the relative location, e.g. policyengine_uk/variables/gov/child_benefit.py -> gov.child_benefit
-            try:
-                relative_file_path = (
-                    str(path.relative_to(self.variables_dir))
-                    .replace("/", ".")
-                    .replace(".py", "")
-                )
-            except:
-                relative_file_path = ""
+            for variable_class in self._import_variable_classes(file_path):
+                self.add_variable(variable_class)
+        except Exception:
+            log.error(
+                'Unable to load OpenFisca variables from file "{}"'.format(file_path)
+            )
+            raise
 
-            #  As Python remembers loaded modules by name, in order to prevent collisions, we need to make sure that:
-            #  - Files with the same name, but located in different directories, have a different module names. Hence the file path hash in the module name.
-            #  - The same file, loaded by different tax and benefit systems, has distinct module names. Hence the `id(self)` in the module name.
-            module_name = f"{id(self)}_{hash(os.path.abspath(file_path))}_{file_name}"
+    def _import_variable_classes(self, file_path: str) -> List[Type[Variable]]:
+        """
+        Import a variable file, record its module metadata, and return the variable classes it defines.
+        """
+        file_name = os.path.splitext(os.path.basename(file_path))[0]
 
-            try:
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-            except NameError as e:
-                logging.error(
-                    str(e)
-                    + ": if this code used to work, this error might be due to a major change in OpenFisca-Core. Checkout the changelog to learn more: <https://github.com/openfisca/openfisca-core/blob/master/CHANGELOG.md>"
-                )
-                raise
-            potential_variables = [
-                getattr(module, item)
-                for item in module.__dict__
-                if not item.startswith("__")
-            ]
+        path = Path(file_path)
 
-            metadata = {}
-            metadata["label"] = module.__dict__.get("label", relative_file_path)
-            metadata["description"] = module.__dict__.get("description", None)
-            metadata["index"] = module.__dict__.get("index", 0)
-            self.variable_module_metadata[relative_file_path] = metadata
+        # Get the relative location, e.g. policyengine_uk/variables/gov/child_benefit.py -> gov.child_benefit
+        try:
+            relative_file_path = (
+                str(path.relative_to(self.variables_dir))
+                .replace("/", ".")
+                .replace(".py", "")
+            )
+        except:
+            relative_file_path = ""
+
+        #  As Python remembers loaded modules by name, in order to prevent collisions, we need to make sure that:
+        #  - Files with the same name, but located in different directories, have a different module names. Hence the file path hash in the module name.
+        #  - The same file, loaded by different tax and benefit systems, has distinct module names. Hence the `id(self)` in the module name.
+        module_name = f"{id(self)}_{hash(os.path.abspath(file_path))}_{file_name}"
+        # Other processes cannot import modules named so, so modules are
+        # pickled by reference to their file (see policyengine_core.pickling).
+        try:
+            file = path.resolve().relative_to(Path(self.variables_dir).resolve())
+        except (TypeError, ValueError):
+            file = None
 
-            i = 0
-            for pot_variable in potential_variables:
-                # We only want to get the module classes defined in this module (not imported)
-                if (
-                    inspect.isclass(pot_variable)
-                    and issubclass(pot_variable, Variable)
-                    and pot_variable.__module__ == module_name
-                ):
-                    pot_variable.module_name = relative_file_path
-                    pot_variable.index_in_module = i
-                    i += 1
-                    self.add_variable(pot_variable)
-        except Exception:
-            log.error(
-                'Unable to load OpenFisca variables from file "{}"'.format(file_path)
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            if file is not None:
+                self._variable_module_names[file.as_posix()] = module_name
+                register_variable_module(module_name, type(self), file.as_posix())
+            spec.loader.exec_module(module)
+        except NameError as e:
+            logging.error(
+                str(e)
+                + ": if this code used to work, this error might be due to a major change in OpenFisca-Core. Checkout the changelog to learn more: <https://github.com/openfisca/openfisca-core/blob/master/CHANGELOG.md>"
             )
             raise
+        potential_variables = [
+            getattr(module, item)
+            for item in module.__dict__
+            if not item.startswith("__")
+        ]
+
+        metadata = {}
+        metadata["label"] = module.__dict__.get("label", relative_file_path)
+        metadata["description"] = module.__dict__.get("description", None)
+        metadata["index"] = module.__dict__.get("index", 0)
+        self.variable_module_metadata[relative_file_path] = metadata
+
+        variable_classes = []
+        for pot_variable in potential_variables:
+            # We only want to get the module classes defined in this module (not imported)
+            if (
+                inspect.isclass(pot_variable)
+                and issubclass(pot_variable, Variable)
+                and pot_variable.__module__ == module_name
+            ):
+                pot_variable.module_name = relative_file_path
+                pot_variable.index_in_module = len(variable_classes)
+                variable_classes.append(pot_variable)
+        return variable_classes
+
+    def get_variable_module(self, file: str) -> ModuleType:
+        """
+        Get the module imported from a variable file, importing it if it is not yet.
+
+        :param file: Path of the file relative to `variables_dir`, with forward slashes.
+        """
+        if file not in self._variable_module_names:
+            # Variables registered from a manifest are imported on demand.
+            for stub in list(self.variables.metadata_values()):
+                if isinstance(stub, VariableStub) and stub.file == file:
+                    self.variables[stub.name]
+                    break
+        return sys.modules[self._variable_module_names[file]]
 
     def add_variable_metadata_from_folder(self, file_path: str) -> None:
         """
@@ -371,8 +562,14 @@ class TaxBenefitSystem:
             self.add_variable_metadata_from_folder(init_module)
         if "README.md" in os.listdir(directory):
             self.add_variable_metadata_from_folder(os.path.join(directory, "README.md"))
+        start = time.perf_counter()
         for py_file in py_files:
             self.add_variables_from_file(py_file)
+        if self.startup_profile is not None:
+            # Subdirectories are timed separately.
+            self.startup_profile.get_details("variables")[str(directory)] = (
+                time.perf_counter() - start
+            )
         subdirectories = glob.glob(os.path.join(directory, "*/"))
         for subdirectory in subdirectories:
             self.add_variables_from_directory(subdirectory)
@@ -480,6 +677,22 @@ class TaxBenefitSystem:
             raise VariableNotFoundError(variable_name, self)
         return found
 
+    def get_variable_metadata(
+        self, variable_name: str, check_existence: bool = False
+    ) -> Any:
+        """
+        Get a variable from the tax and benefit system without importing the file defining it.
+
+        Variables not loaded yet (see `variable_manifest_path`) are returned as a :class:`.VariableStub`, which has the `name`, `entity`, `definition_period`, `value_type`, `label`, `module_name` and `is_input_variable()` of the variable.
+
+        :param variable_name: Name of the requested variable.
+        :param check_existence: If True, raise an error if the requested variable does not exist.
+        """
+        found = self.variables.get_metadata(variable_name)
+        if not found and check_existence:
+            raise VariableNotFoundError(variable_name, self)
+        return found
+
     def neutralize_variable(self, variable_name: str) -> None:
         """
         Neutralizes an OpenFisca variable existing in the tax and benefit system.
@@ -514,10 +727,17 @@ class TaxBenefitSystem:
         >>> self.load_parameters('/path/to/yaml/parameters/dir')
         """
 
-        parameters = ParameterNode(
-            "",
-            directory_path=path_to_yaml_dir,
-        )
+        if self.parameter_loading_workers is not None:
+            parameters = load_parameter_directory(
+                path_to_yaml_dir,
+                max_workers=self.parameter_loading_workers,
+                use_processes=self.parameter_loading_in_processes,
+            )
+        else:
+            parameters = ParameterNode(
+                "",
+                directory_path=path_to_yaml_dir,
+            )
 
         if self.preprocess_parameters is not None:
             parameters = self.preprocess_parameters(parameters)
@@ -551,9 +771,17 @@ class TaxBenefitSystem:
                 )
             )
 
+        if self.parameters is None:
+            return None
+        instant_str = str(instant)
         parameters_at_instant = self._parameters_at_instant_cache.get(instant)
-        if parameters_at_instant is None and self.parameters is not None:
-            parameters_at_instant = self.parameters.get_at_instant(str(instant))
+        # Parameter updates evict the nodes cached by the root from then on.
+        if (
+            parameters_at_instant is None
+            or self.parameters._at_instant_cache.get(instant_str)
+            is not parameters_at_instant
+        ):
+            parameters_at_instant = self.parameters.get_at_instant(instant_str)
             self._parameters_at_instant_cache[instant] = parameters_at_instant
         return parameters_at_instant
 
@@ -636,6 +864,11 @@ class TaxBenefitSystem:
             }
 
     def clone(self) -> "TaxBenefitSystem":
+        """
+        Copy the system, so that variables can be added or replaced and parameters updated without affecting the original.
+
+        Variables are shared with the original system, and so are the parameters until they are updated (see :meth:`.ParameterNode.clone`): replace variables (e.g. with :meth:`update_variable` or :meth:`neutralize_variable`) rather than modifying them in place.
+        """
         new = commons.empty_clone(self)
         new_dict = new.__dict__
 
@@ -652,27 +885,26 @@ class TaxBenefitSystem:
 
         new_dict["parameters"] = self.parameters.clone()
         new_dict["_parameters_at_instant_cache"] = {}
-        new_dict["variables"] = {
-            variable_name: variable.clone()
-            for variable_name, variable in self.variables.items()
-        }
+        new_dict["variables"] = self.variables.copy()
 
-        # Apply shallow copies to all relevant entities
+        # Entities point back to their system, so each system needs copies.
         new_dict["entities"] = [copy.copy(entity) for entity in self.entities]
-        new_dict["person_entity"] = copy.copy(self.person_entity)
+        new_dict["person_entity"] = [
+            entity for entity in new.entities if entity.is_person
+        ][0]
         new_dict["group_entities"] = [
-            copy.copy(entity) for entity in self.group_entities
+            entity for entity in new.entities if not entity.is_person
         ]
-
-        # For all shallow-copied entities, set entity._tax_benefit_system to the new system
-        for entity in new_dict["entities"]:
+        for entity in new.entities:
             entity.set_tax_benefit_system(new)
-        for entity in new_dict["group_entities"]:
-            entity.set_tax_benefit_system(new)
-        new_dict["person_entity"].set_tax_benefit_system(new)
 
         return new
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_parameters_at_instant_cache"] = {}
+        return state
+
     def entities_plural(self) -> dict:
         return {entity.plural for entity in self.entities}
 
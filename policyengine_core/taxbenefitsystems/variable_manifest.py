@@ -0,0 +1,332 @@
+"""Manifest of the variables of a tax-benefit system, to load them lazily.
+
+Building a tax-benefit system normally imports every Python file under
+``variables_dir``. A manifest records, for each variable, the file defining it
+and the metadata needed before any formula runs (entity, definition period,
+value type, label...). A system given a manifest registers a
+:class:`VariableStub` per variable, and only imports the file of a variable
+when something needs more than that metadata.
+
+Manifests are generated from a fully loaded system with
+:func:`save_variable_manifest`, typically when building a country package. A
+manifest no longer matching the files under ``variables_dir`` is ignored. To
+avoid reading every variable file at startup, the files are only hashed if
+their paths, sizes or modification times, or the package version, changed
+since the manifest was written.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from policyengine_core.enums import Enum
+from policyengine_core.errors import VariableNameConflictError
+from policyengine_core.pickling import get_reference_system
+
+if TYPE_CHECKING:
+    from policyengine_core.entities import Entity
+    from policyengine_core.taxbenefitsystems import TaxBenefitSystem
+    from policyengine_core.variables import Variable
+
+log = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+VALUE_TYPES_BY_NAME = {
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "Enum": Enum,
+    "date": datetime.date,
+}
+VALUE_TYPE_NAMES = {
+    value_type: name for name, value_type in VALUE_TYPES_BY_NAME.items()
+}
+
+
+class VariableStub:
+    """
+    Placeholder for a variable whose file has not been imported yet.
+
+    It holds the metadata recorded in the manifest. Any other attribute loads the variable and is read from it.
+    """
+
+    def __init__(self, name: str, entity: Entity, metadata: dict, loader) -> None:
+        self.name = name
+        self.entity = entity
+        self.label: str = metadata["label"]
+        self.definition_period: str = metadata["definition_period"]
+        self.value_type: type = VALUE_TYPES_BY_NAME[metadata["value_type"]]
+        self.possible_value_names: Optional[List[str]] = metadata["possible_values"]
+        self.module_name: str = metadata["module_name"]
+        self.index_in_module: int = metadata["index_in_module"]
+        self.file: str = metadata["file"]
+        self._is_input = metadata["is_input"]
+        self._loader = loader
+
+    def is_input_variable(self) -> bool:
+        return self._is_input
+
+    def load(self) -> Variable:
+        """Import the file defining the variable, and return the variable."""
+        return self._loader.load(self.name)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __reduce__(self):
+        # Pickled by name, as the variables of the system they belong to.
+        return _restore_variable_stub, (
+            type(self._loader.tax_benefit_system),
+            self.name,
+        )
+
+    def __repr__(self) -> str:
+        return f"<VariableStub {self.name}>"
+
+
+def _restore_variable_stub(system_class: type, name: str) -> Any:
+    return get_reference_system(system_class).variables.get_metadata(name)
+
+
+class _VariableFileLoader:
+    # Imports the variable files of a tax-benefit system on demand, each file
+    # once, and keeps the variables they define.
+
+    def __init__(self, tax_benefit_system: TaxBenefitSystem) -> None:
+        self.tax_benefit_system = tax_benefit_system
+        self.variables: Dict[str, Variable] = {}
+        self.files: Dict[str, str] = {}
+
+    def load(self, name: str) -> Variable:
+        variable = self.variables.get(name)
+        if variable is not None:
+            return variable
+        file = self.files[name]
+        file_path = Path(self.tax_benefit_system.variables_dir) / file
+        for variable_class in self.tax_benefit_system._import_variable_classes(
+            str(file_path)
+        ):
+            self.variables[variable_class.__name__] = variable_class(
+                baseline_variable=None
+            )
+        if name not in self.variables:
+            raise ValueError(
+                f"Variable '{name}' was not found in {file_path}, although the variable manifest says it is defined there. The manifest is out of date."
+            )
+        return self.variables[name]
+
+
+class VariableDict(dict):
+    """
+    The variables of a tax-benefit system, by name.
+
+    Values can be :class:`VariableStub` objects: reading a value through the usual dict methods replaces it by the variable itself, importing its file if needed. :meth:`get_metadata` and :meth:`metadata_values` read variables without importing anything.
+    """
+
+    def _resolve(self, name: str, value: Any) -> Any:
+        if not isinstance(value, VariableStub):
+            return value
+        variable = value.load()
+        dict.__setitem__(self, name, variable)
+        return variable
+
+    def __getitem__(self, name: str) -> Variable:
+        return self._resolve(name, dict.__getitem__(self, name))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name not in self:
+            return default
+        return self[name]
+
+    def pop(self, name: str, *default) -> Any:
+        if name not in self and default:
+            return default[0]
+        value = self[name]
+        del self[name]
+        return value
+
+    def values(self) -> Iterator[Variable]:
+        for name in list(self):
+            yield self[name]
+
+    def items(self) -> Iterator[Tuple[str, Variable]]:
+        for name in list(self):
+            yield name, self[name]
+
+    def copy(self) -> "VariableDict":
+        new = VariableDict()
+        dict.update(new, dict.items(self))
+        return new
+
+    def get_metadata(self, name: str) -> Any:
+        """Get the variable called `name`, or its stub if it is not loaded yet, or None."""
+        return dict.get(self, name)
+
+    def metadata_values(self) -> Iterator[Any]:
+        """Iterate over the variables, yielding stubs for the ones not loaded yet."""
+        return iter(dict.values(self))
+
+    def is_loaded(self, name: str) -> bool:
+        return not isinstance(dict.get(self, name), VariableStub)
+
+
+def _list_variable_files(variables_dir: Path) -> Iterator[Tuple[str, Path]]:
+    """List the files under `variables_dir` whose content a manifest describes, with their relative paths."""
+    for directory, subdirectories, file_names in os.walk(variables_dir):
+        subdirectories.sort()
+        for file_name in sorted(file_names):
+            if not (file_name.endswith(".py") or file_name == "README.md"):
+                continue
+            file_path = Path(directory) / file_name
+            yield file_path.relative_to(variables_dir).as_posix(), file_path
+
+
+def get_variables_fingerprint(variables_dir: str) -> str:
+    """Hash the files under `variables_dir` whose content a manifest describes."""
+    digest = hashlib.sha256()
+    for relative_path, file_path in _list_variable_files(Path(variables_dir)):
+        digest.update(relative_path.encode())
+        digest.update(b"\0")
+        digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_variables_stat_key(variables_dir: str, package_version: str) -> str:
+    """
+    Hash the paths, sizes and modification times of the files :func:`get_variables_fingerprint` hashes, and `package_version`.
+
+    This only reads the file system metadata, so it is cheap enough to check at every startup, and the files are only hashed if it changed.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(package_version).encode())
+    for relative_path, file_path in _list_variable_files(Path(variables_dir)):
+        stat = file_path.stat()
+        digest.update(f"\0{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def build_variable_manifest(tax_benefit_system: TaxBenefitSystem) -> dict:
+    """
+    Describe the variables of a fully loaded tax-benefit system.
+
+    Only the variables defined by files under ``variables_dir`` are listed.
+    """
+    variables_dir = Path(tax_benefit_system.variables_dir).resolve()
+    package_version = tax_benefit_system.get_package_metadata()["version"]
+    variables = {}
+    for name, variable in tax_benefit_system.variables.items():
+        module = sys.modules.get(type(variable).__module__)
+        module_file = getattr(module, "__file__", None)
+        if module_file is None:
+            continue
+        try:
+            file = Path(module_file).resolve().relative_to(variables_dir).as_posix()
+        except ValueError:
+            continue
+        value_type = variable.value_type
+        variables[name] = {
+            "file": file,
+            "module_name": variable.module_name,
+            "index_in_module": variable.index_in_module,
+            "entity": variable.entity.key,
+            "definition_period": variable.definition_period,
+            "value_type": VALUE_TYPE_NAMES[value_type],
+            "label": variable.label,
+            "is_input": variable.is_input_variable(),
+            "possible_values": (
+                [item.name for item in variable.possible_values]
+                if value_type == Enum
+                else None
+            ),
+        }
+    return {
+        "version": MANIFEST_VERSION,
+        "fingerprint": get_variables_fingerprint(variables_dir),
+        "stat_key": get_variables_stat_key(variables_dir, package_version),
+        "module_metadata": tax_benefit_system.variable_module_metadata,
+        "variables": variables,
+    }
+
+
+def save_variable_manifest(tax_benefit_system: TaxBenefitSystem, path: str) -> None:
+    """Write the manifest of a fully loaded tax-benefit system to `path`."""
+    with open(path, "w") as f:
+        json.dump(build_variable_manifest(tax_benefit_system), f, indent=1)
+
+
+def load_variable_manifest(
+    path: str, variables_dir: str, package_version: str = None
+) -> Optional[dict]:
+    """
+    Load the manifest at `path`, or return None if it is missing or does not match the files under `variables_dir`.
+
+    If the files were only touched (e.g. checked out again), the manifest is updated so that later loads do not hash them again.
+
+    :param path: The manifest written by :func:`save_variable_manifest`.
+    :param variables_dir: The directory of the variable files.
+    :param package_version: The version of the package the variable files belong to.
+    """
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        log.warning(f"Ignoring unreadable variable manifest {path}.", exc_info=True)
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        log.warning(f"Ignoring variable manifest {path}, written by another version.")
+        return None
+    stat_key = get_variables_stat_key(variables_dir, package_version)
+    if manifest.get("stat_key") == stat_key:
+        return manifest
+    if manifest.get("fingerprint") != get_variables_fingerprint(variables_dir):
+        log.warning(
+            f"Ignoring variable manifest {path}, which does not match the variable files."
+        )
+        return None
+    manifest["stat_key"] = stat_key
+    _write_manifest(manifest, path)
+    return manifest
+
+
+def _write_manifest(manifest: dict, path: str) -> None:
+    # Replaced atomically, as other processes may be reading it. Manifests
+    # installed read-only are left as they are.
+    temporary_file = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=Path(path).parent, suffix=".tmp", delete=False
+        ) as f:
+            temporary_file = f.name
+            json.dump(manifest, f, indent=1)
+        os.replace(temporary_file, path)
+    except OSError:
+        log.debug(f"Could not update variable manifest {path}.", exc_info=True)
+        if temporary_file is not None and os.path.exists(temporary_file):
+            os.remove(temporary_file)
+
+
+def add_variable_stubs(tax_benefit_system: TaxBenefitSystem, manifest: dict) -> None:
+    """Register a stub for each variable of `manifest` in `tax_benefit_system`."""
+    loader = _VariableFileLoader(tax_benefit_system)
+    entities = tax_benefit_system.entities_by_singular()
+    tax_benefit_system.variable_module_metadata.update(manifest["module_metadata"])
+    for name, metadata in manifest["variables"].items():
+        if name in tax_benefit_system.variables:
+            raise VariableNameConflictError(
+                f"You've already defined {name}. The variable manifest defines it again in {metadata['file']}."
+            )
+        loader.files[name] = metadata["file"]
+        stub = VariableStub(name, entities[metadata["entity"]], metadata, loader)
+        dict.__setitem__(tax_benefit_system.variables, name, stub)
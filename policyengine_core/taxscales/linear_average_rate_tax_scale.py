@@ -25,13 +25,7 @@ class LinearAverageRateTaxScale(RateTaxScaleLike):
         if len(self.rates) == 1:
             return tax_base * self.rates[0]
 
-        tiled_base = numpy.tile(tax_base, (len(self.thresholds) - 1, 1)).T
-        tiled_thresholds = numpy.tile(self.thresholds, (len(tax_base), 1))
-
-        bracket_dummy = (tiled_base >= tiled_thresholds[:, :-1]) * (
-            +tiled_base < tiled_thresholds[:, 1:]
-        )
-
+        tax_base = numpy.asarray(tax_base)
         rates_array = numpy.array(self.rates)
         thresholds_array = numpy.array(self.thresholds)
 
@@ -39,10 +33,32 @@ class LinearAverageRateTaxScale(RateTaxScaleLike):
             +thresholds_array[1:] - thresholds_array[:-1]
         )
 
-        average_rate_slope = numpy.dot(bracket_dummy, rate_slope.T)
-
-        bracket_average_start_rate = numpy.dot(bracket_dummy, rates_array[:-1])
-        bracket_threshold = numpy.dot(bracket_dummy, thresholds_array[:-1])
+        if numpy.all(thresholds_array[1:] >= thresholds_array[:-1]):
+            # Each tax base is in at most one bracket, found by binary search.
+            bracket = numpy.searchsorted(thresholds_array, tax_base, side="right") - 1
+            in_bracket = (bracket >= 0) & (bracket < len(rate_slope))
+            bracket = numpy.clip(bracket, 0, len(rate_slope) - 1)
+            average_rate_slope = numpy.where(in_bracket, rate_slope[bracket], 0)
+            bracket_average_start_rate = numpy.where(
+                in_bracket, rates_array[bracket], 0
+            )
+            bracket_threshold = numpy.where(in_bracket, thresholds_array[bracket], 0)
+        else:
+            average_rate_slope = numpy.zeros(len(tax_base))
+            bracket_average_start_rate = numpy.zeros(len(tax_base))
+            bracket_threshold = numpy.zeros(len(tax_base))
+            for lower, upper, slope, rate in zip(
+                thresholds_array[:-1],
+                thresholds_array[1:],
+                rate_slope,
+                rates_array[:-1],
+            ):
+                bracket_dummy = (tax_base >= lower) * (tax_base < upper)
+                average_rate_slope = average_rate_slope + bracket_dummy * slope
+                bracket_average_start_rate = (
+                    bracket_average_start_rate + bracket_dummy * rate
+                )
+                bracket_threshold = bracket_threshold + bracket_dummy * lower
 
         log.info(f"bracket_average_start_rate :  {bracket_average_start_rate}")
         log.info(f"average_rate_slope:  {average_rate_slope}")
@@ -7,7 +7,12 @@ import typing
 import numpy
 
 from policyengine_core import taxscales
-from policyengine_core.taxscales.rate_tax_scale_like import RateTaxScaleLike
+from policyengine_core.taxscales.rate_tax_scale_like import (
+    EPSILON,
+    RateTaxScaleLike,
+    count_thresholds_reached,
+    scale_thresholds,
+)
 
 if typing.TYPE_CHECKING:
     NumericalArray = typing.Union[numpy.int_, numpy.float_]
@@ -40,12 +45,17 @@ class MarginalRateTaxScale(RateTaxScaleLike):
         Compute the tax amount for the given tax bases by applying a taxscale.
 
         :param ndarray tax_base: Array of the tax bases.
-        :param float factor: Factor to apply to the thresholds of the taxscale.
+        :param float factor: Factor to apply to the thresholds of the taxscale,
+                             either a number or one per tax base.
         :param int round_base_decimals: Decimals to keep when rounding
                                         thresholds.
 
         :returns: Float array with tax amount for the given tax bases.
 
+        Tax bases are placed in their bracket by binary search and the tax is
+        read from a table of the tax due at each threshold, in O(n log k)
+        time and O(n) memory for n tax bases and k brackets.
+
         For instance:
 
         >>> tax_scale = MarginalRateTaxScale()
@@ -55,35 +65,98 @@ class MarginalRateTaxScale(RateTaxScaleLike):
         >>> tax_scale.calc(tax_base)
         [0.0, 5.0]
         """
-        base1 = numpy.tile(tax_base, (len(self.thresholds), 1)).T
-        factor = numpy.ones(len(tax_base)) * factor
-
-        # To avoid the creation of:
-        #
-        #   numpy.nan = 0 * numpy.inf
-        #
-        # We use:
-        #
-        #   numpy.finfo(float_).eps
-        thresholds1 = numpy.outer(
-            factor + numpy.finfo(numpy.float64).eps,
-            numpy.array(self.thresholds + [numpy.inf]),
-        )
-
-        if round_base_decimals is not None:
-            thresholds1 = numpy.round(thresholds1, round_base_decimals)
+        tax_base = numpy.asarray(tax_base)
+        thresholds = numpy.array(self.thresholds, dtype=float)
+        rates = numpy.array(self.rates, dtype=float)
+        if not len(thresholds):
+            return numpy.zeros(len(tax_base))
+
+        scalar_factor = numpy.ndim(factor) == 0
+        if not scalar_factor:
+            factor = numpy.broadcast_to(factor, tax_base.shape)
+        if (
+            numpy.all(numpy.asarray(factor) + EPSILON > 0)
+            and numpy.all(thresholds[1:] >= thresholds[:-1])
+            and (scalar_factor or round_base_decimals is None)
+        ):
+            return self._calc_from_cumulative_tax(
+                tax_base, thresholds, rates, factor, round_base_decimals
+            )
 
-        a = numpy.maximum(
-            numpy.minimum(base1, thresholds1[:, 1:]) - thresholds1[:, :-1], 0
+        # Otherwise, accumulate the tax one bracket at a time.
+        tax = numpy.zeros(len(tax_base))
+        upper_thresholds = numpy.append(thresholds[1:], numpy.inf)
+        for threshold, upper_threshold, rate in zip(
+            thresholds, upper_thresholds, rates
+        ):
+            lower = scale_thresholds(threshold, factor, round_base_decimals)
+            upper = scale_thresholds(upper_threshold, factor, round_base_decimals)
+            taxed_base = numpy.maximum(numpy.minimum(tax_base, upper) - lower, 0)
+            if round_base_decimals is None:
+                tax = tax + rate * taxed_base
+            else:
+                tax = tax + numpy.round(
+                    rate * numpy.round(taxed_base, round_base_decimals),
+                    round_base_decimals,
+                )
+        return tax
+
+    @staticmethod
+    def _calc_from_cumulative_tax(
+        tax_base: numpy.ndarray,
+        thresholds: numpy.ndarray,
+        rates: numpy.ndarray,
+        factor: typing.Union[float, numpy.ndarray],
+        round_base_decimals: typing.Optional[int],
+    ) -> numpy.ndarray:
+        # The tax is the tax due up to the highest threshold reached, looked
+        # up in a table of the tax due at each threshold, plus the tax on the
+        # part of the base above it.
+        bracket = (
+            count_thresholds_reached(tax_base, thresholds, factor, round_base_decimals)
+            - 1
         )
-
-        if round_base_decimals is None:
-            return numpy.dot(self.rates, a.T)
-
+        reached = bracket >= 0
+        bracket = numpy.maximum(bracket, 0)
+        rate = rates[bracket]
+
+        # With one factor per tax base, the table is computed for unscaled
+        # thresholds and scaled, as the tax due up to a threshold is linear in
+        # the factor.
+        table_factor = factor if numpy.ndim(factor) == 0 else 1.0
+        scaled_thresholds = scale_thresholds(
+            thresholds, table_factor, round_base_decimals
+        )
+        bracket_widths = numpy.diff(scaled_thresholds)
+        with numpy.errstate(invalid="ignore"):
+            if round_base_decimals is None:
+                bracket_taxes = rates[:-1] * bracket_widths
+            else:
+                bracket_taxes = numpy.round(
+                    rates[:-1] * numpy.round(bracket_widths, round_base_decimals),
+                    round_base_decimals,
+                )
+            cumulative_tax = numpy.concatenate(([0.0], numpy.cumsum(bracket_taxes)))
+
+        if numpy.ndim(factor) == 0:
+            base_above = tax_base - scaled_thresholds[bracket]
+            if round_base_decimals is None:
+                tax = cumulative_tax[bracket] + rate * base_above
+            else:
+                tax = cumulative_tax[bracket] + numpy.round(
+                    rate * numpy.round(base_above, round_base_decimals),
+                    round_base_decimals,
+                )
         else:
-            r = numpy.tile(self.rates, (len(tax_base), 1))
-            b = numpy.round(a, round_base_decimals)
-            return numpy.round(r * b, round_base_decimals).sum(axis=1)
+            scale = factor + EPSILON
+            tax = scale * cumulative_tax[bracket] + rate * (
+                tax_base - scale * thresholds[bracket]
+            )
+
+        tax = numpy.where(reached, tax, 0.0)
+        if tax_base.dtype.kind == "f":
+            tax = numpy.where(numpy.isnan(tax_base), numpy.nan, tax)
+        return tax
 
     def combine_bracket(
         self,
@@ -14,6 +14,99 @@ from policyengine_core.taxscales.tax_scale_like import TaxScaleLike
 if typing.TYPE_CHECKING:
     NumericalArray = typing.Union[numpy.int_, numpy.float_]
 
+# Thresholds are scaled by ``factor + EPSILON`` rather than ``factor``, to avoid
+# the creation of ``numpy.nan = 0 * numpy.inf``.
+EPSILON = numpy.finfo(numpy.float64).eps
+
+
+def scale_thresholds(
+    thresholds: numpy.ndarray,
+    factor: typing.Union[float, numpy.ndarray],
+    round_decimals: typing.Optional[int] = None,
+) -> numpy.ndarray:
+    """
+    Scale thresholds by a factor, as rate tax scales apply it.
+
+    :param ndarray thresholds: Thresholds of the tax scale.
+    :param factor: Factor to apply to the thresholds, either a number or an
+                   array broadcasting against ``thresholds``.
+    :param int round_decimals: Decimals to keep when rounding thresholds.
+
+    :returns: The scaled thresholds.
+    """
+    scaled_thresholds = (factor + EPSILON) * thresholds
+    if round_decimals is not None:
+        scaled_thresholds = numpy.round(scaled_thresholds, round_decimals)
+    return scaled_thresholds
+
+
+def count_thresholds_reached(
+    tax_base: NumericalArray,
+    thresholds: typing.Sequence,
+    factor: typing.Union[float, numpy.ndarray] = 1.0,
+    round_decimals: typing.Optional[int] = None,
+) -> numpy.ndarray:
+    """
+    Count the thresholds, scaled by ``factor``, reached by each tax base.
+
+    Sorted thresholds scaled by a positive factor (a number, or one per tax
+    base) are searched in O(n log k) time and O(n) memory, for n tax bases
+    and k thresholds. Other cases are counted one threshold at a time, in
+    O(n k) time but still O(n) memory.
+
+    :param ndarray tax_base: Array of the tax bases.
+    :param thresholds: Thresholds of the tax scale.
+    :param factor: Factor to apply to the thresholds, either a number or one
+                   per tax base.
+    :param int round_decimals: Decimals to keep when rounding thresholds.
+
+    :returns: Integer array with the number of thresholds at or below each
+              tax base.
+    """
+    tax_base = numpy.asarray(tax_base)
+    thresholds = numpy.asarray(thresholds, dtype=float)
+    positive_factor = numpy.all(numpy.asarray(factor) + EPSILON > 0)
+    sorted_thresholds = numpy.all(thresholds[1:] >= thresholds[:-1])
+
+    if not (positive_factor and sorted_thresholds):
+        counts = numpy.zeros(tax_base.shape, dtype=numpy.intp)
+        for threshold in thresholds:
+            counts += tax_base >= scale_thresholds(threshold, factor, round_decimals)
+        return counts
+
+    if numpy.ndim(factor) == 0:
+        counts = numpy.searchsorted(
+            scale_thresholds(thresholds, factor, round_decimals),
+            tax_base,
+            side="right",
+        )
+    else:
+        # Search the unscaled thresholds, then move each count by one
+        # threshold until it agrees with the exactly scaled thresholds (only
+        # the rounding of the division can put it off).
+        factor = numpy.broadcast_to(factor, tax_base.shape)
+        counts = numpy.searchsorted(
+            thresholds, tax_base / (factor + EPSILON), side="right"
+        )
+        last = len(thresholds) - 1
+
+        def scaled_threshold(index):
+            return scale_thresholds(
+                thresholds[numpy.clip(index, 0, last)], factor, round_decimals
+            )
+
+        while True:
+            too_low = (counts <= last) & (tax_base >= scaled_threshold(counts))
+            too_high = (counts > 0) & (tax_base < scaled_threshold(counts - 1))
+            if not (too_low.any() or too_high.any()):
+                break
+            counts = counts + too_low - too_high
+
+    if tax_base.dtype.kind == "f":
+        # NaN tax bases reach no threshold.
+        counts = numpy.where(numpy.isnan(tax_base), 0, counts)
+    return counts
+
 
 class RateTaxScaleLike(TaxScaleLike, abc.ABC):
     """
@@ -164,26 +257,16 @@ class RateTaxScaleLike(TaxScaleLike, abc.ABC):
                 tax_base,
             )
 
-        base1 = numpy.tile(tax_base, (len(self.thresholds), 1)).T
-        factor = numpy.ones(len(tax_base)) * factor
-
-        # To avoid the creation of:
-        #
-        #   numpy.nan = 0 * numpy.inf
-        #
-        # We use:
-        #
-        #   numpy.finfo(float_).eps
-        thresholds1 = numpy.outer(
-            +factor + numpy.finfo(numpy.float64).eps,
-            numpy.array(self.thresholds),
+        return (
+            count_thresholds_reached(
+                tax_base,
+                self.thresholds,
+                factor,
+                round_decimals,
+            )
+            - 1
         )
 
-        if round_decimals is not None:
-            thresholds1 = numpy.round(thresholds1, round_decimals)
-
-        return (base1 - thresholds1 >= 0).sum(axis=1) - 1
-
     def threshold_from_tax_base(
         self,
         tax_base: NumericalArray,
@@ -6,15 +6,13 @@ import typing
 from typing import Optional, Union
 
 import numpy
-from pyvis.node import Node
 
 from policyengine_core.enums import EnumArray
 
 from .. import tracers
 
-from pyvis.network import Network
-
 if typing.TYPE_CHECKING:
+    from pyvis.network import Network
     from numpy.typing import ArrayLike
 
     Array = Union[EnumArray, ArrayLike]
@@ -96,6 +94,8 @@ class VariableGraph:
             os.chdir("..")
 
     def _network(self) -> Network:
+        from pyvis.network import Network
+
         net = Network(
             height="100vh",
             directed=True,
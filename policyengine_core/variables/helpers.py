@@ -36,6 +36,8 @@ def get_annualized_variable(
             for key, formula in variable.formulas.items()
         }
     )
+    # Annualized variables are pickled as their original and this period.
+    new_variable._annualization = (annualization_period,)
 
     return new_variable
 
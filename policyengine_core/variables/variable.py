@@ -16,6 +16,10 @@ from policyengine_core.holders import (
     set_input_divide_by_period,
 )
 from policyengine_core.periods import DAY, ETERNITY
+from policyengine_core.pickling import (
+    get_reference_system,
+    get_variable_module_reference,
+)
 
 from . import config, helpers
 from .formula_randomness import check_formula_determinism
@@ -665,6 +669,19 @@ class Variable:
         clone = self.__class__()
         return clone
 
+    def __reduce_ex__(self, protocol):
+        # Variables defined by variable files are pickled by name, as other
+        # processes cannot import their classes (see policyengine_core.pickling).
+        reference = get_variable_module_reference(type(self))
+        if reference is None:
+            return super().__reduce_ex__(protocol)
+        return _restore_variable, (
+            reference[0],
+            self.name,
+            self.is_neutralized,
+            self.__dict__.get("_annualization"),
+        )
+
     def check_set_value(self, value):
         if self.value_type == Enum and isinstance(value, str):
             try:
@@ -715,3 +732,14 @@ class Variable:
             return EnumArray(array, self.possible_values)
         array.fill(self.default_value)
         return array
+
+
+def _restore_variable(
+    system_class: type, name: str, is_neutralized: bool, annualization: tuple
+) -> Variable:
+    variable = get_reference_system(system_class).get_variable(name)
+    if annualization is not None:
+        variable = helpers.get_annualized_variable(variable, *annualization)
+    if is_neutralized and not variable.is_neutralized:
+        variable = helpers.get_neutralized_variable(variable)
+    return variable
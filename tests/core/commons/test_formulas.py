@@ -87,3 +87,60 @@ def test_concat_tuple_inputs():
 
     with pytest.raises(TypeError, match="Second argument must not be a tuple."):
         commons.concat(numpy.array(["a", "b"]), ("c", "d"))
+
+
+def test_apply_thresholds_matches_select():
+    input_ = numpy.array([numpy.nan, -1, 5, 5.5, 7, 9, 12])
+    thresholds = [5, 7, 9]
+
+    for choices in ([10, 15, 20, 25], [10.5, 15, 20]):
+        condlist = [input_ <= threshold for threshold in thresholds]
+        condlist += [True] * (len(choices) - len(thresholds))
+        expected = numpy.select(condlist, choices)
+
+        result = commons.apply_thresholds(input_, thresholds, choices)
+
+        assert result.dtype == expected.dtype
+        assert_array_equal(result, expected)
+
+
+def test_apply_thresholds_with_array_choices():
+    input_ = numpy.array([4, 6, 8])
+    choices = [numpy.array([1, 2, 3]), numpy.array([10, 20, 30]), 100]
+
+    result = commons.apply_thresholds(input_, [5, 7], choices)
+
+    assert_array_equal(result, [1, 20, 100])
+
+
+def test_switch_matches_select():
+    conditions = numpy.array([3, 1, 2, 7, -4, 1])
+    value_by_condition = {1: 80, 2: 90.5, 7: 100}
+
+    result = commons.switch(conditions, value_by_condition)
+
+    assert result.dtype == numpy.float64
+    assert_array_equal(result, [0, 80, 90.5, 100, 0, 80])
+
+
+def test_switch_with_enum_conditions():
+    from policyengine_core.enums import Enum
+
+    class Colour(Enum):
+        RED = "red"
+        GREEN = "green"
+        BLUE = "blue"
+
+    conditions = Colour.encode(numpy.array(["BLUE", "RED", "GREEN"]))
+
+    result = commons.switch(conditions, {Colour.RED: 1, Colour.BLUE: 3})
+
+    assert_array_equal(result, [3, 1, 0])
+
+
+def test_switch_with_sparse_keys():
+    conditions = numpy.array([1, 1_000_000, 5])
+
+    result = commons.switch(conditions, {1_000_000: 2, 1: 1})
+
+    assert_array_equal(result, [1, 2, 0])
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from policyengine_core.country_template import Simulation
+from policyengine_core.data import Dataset
+
+DATA = {
+    "person_id": {"2017": [0, 1]},
+    "household_id": {"2017": [0]},
+    "person_household_id": {"2017": [0, 0]},
+    "person_household_role": {"2017": ["parent", "child"]},
+    "salary": {"2017-01": np.array([1000.0, 0.0], dtype=np.float32)},
+    "age": {"2017-01": np.array([40, 10], dtype=np.int32)},
+}
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    class ArrayDirectoryDataset(Dataset):
+        name = "array_directory_dataset"
+        label = "Array directory dataset"
+        file_path = tmp_path / "array_directory_dataset"
+        data_format = Dataset.ARRAY_DIRECTORY
+
+    dataset = ArrayDirectoryDataset()
+    dataset.save_dataset(DATA)
+    return dataset
+
+
+def test_arrays_are_memory_mapped(dataset):
+    salary = dataset.load("salary/2017-01")
+
+    assert isinstance(salary, np.memmap)
+    assert salary.tolist() == [1000, 0]
+    assert dataset.load()["age"]["2017-01"].tolist() == [40, 10]
+    assert sorted(dataset.variables) == sorted(DATA)
+
+
+def test_saved_arrays_are_added_to_the_index(dataset):
+    dataset.save("salary/2018-01", np.array([2000.0, 0.0]))
+
+    assert list(dataset.load("salary")) == ["2017-01", "2018-01"]
+    assert dataset.load_dataset()["salary"]["2018-01"].tolist() == [2000, 0]
+
+
+def test_simulations_use_mapped_arrays(dataset):
+    simulation = Simulation(dataset=dataset)
+
+    salary = simulation.calculate("salary", "2017-01")
+
+    assert salary.tolist() == [1000, 0]
+    assert isinstance(salary, np.memmap)
+    assert simulation.calculate("income_tax", "2017-01").tolist() == [150, 0]
+
+
+def test_directories_are_recognised(dataset):
+    copy = Dataset.from_file(dataset.file_path)
+
+    assert copy.data_format == Dataset.ARRAY_DIRECTORY
+    assert Simulation(dataset=copy).calculate("age", "2017-01").tolist() == [40, 10]
+
+
+def test_remove_deletes_the_directory(dataset):
+    dataset.remove()
+
+    assert not dataset.exists
+
+
+def test_simulations_only_map_entity_arrays_when_built(dataset, monkeypatch):
+    keys = []
+    load = Dataset.load
+
+    def counting_load(self, key=None, mode="r"):
+        keys.append(key)
+        return load(self, key, mode)
+
+    monkeypatch.setattr(Dataset, "load", counting_load)
+    simulation = Simulation(dataset=dataset)
+
+    assert sorted(keys) == [
+        "household_id/2017",
+        "person_household_id/2017",
+        "person_household_role/2017",
+        "person_id/2017",
+    ]
+    simulation.calculate("salary", "2017-01")
+    assert keys[-1] == "salary/2017-01"
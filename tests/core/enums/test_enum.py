@@ -168,3 +168,40 @@ def test_enum_encode_pandas_series_with_string_index():
     assert len(encoded_array) == 3
     assert isinstance(encoded_array, EnumArray)
     assert list(encoded_array) == [0, 1, 0]
+
+
+def test_enum_decode_uses_lookup_tables():
+    class Sample(Enum):
+        MAXWELL = "maxwell"
+        DWORKIN = "dworkin"
+        RAWLS = "rawls"
+
+    enum_array = EnumArray(np.array([2, 0, 1, 5, -1], dtype=np.int16), Sample)
+
+    decoded = enum_array.decode()
+    assert list(decoded[:3]) == [Sample.RAWLS, Sample.MAXWELL, Sample.DWORKIN]
+    # Unknown indices decode as numpy.select's defaults did.
+    assert list(decoded[3:]) == [0, 0]
+    assert list(enum_array.decode_to_str()) == [
+        "RAWLS",
+        "MAXWELL",
+        "DWORKIN",
+        "unknown",
+        "unknown",
+    ]
+    aggregated = EnumArray(np.array([1.0, 0.5]), Sample)
+    assert list(aggregated.decode_to_str()) == ["DWORKIN", "unknown"]
+
+
+def test_enum_encode_items_of_other_enums_keep_their_index():
+    class Sample(Enum):
+        MAXWELL = "maxwell"
+        DWORKIN = "dworkin"
+
+    class Other(Enum):
+        FIRST = "first"
+        SECOND = "second"
+
+    items = np.array([Sample.DWORKIN, Other.FIRST, Sample.MAXWELL, Other.SECOND])
+
+    assert list(Sample.encode(items)) == [1, 0, 0, 1]
@@ -964,3 +964,72 @@ def test_parameter_uprating_cadence_minimal_data():
     uprated = uprate_parameters(root)
 
     assert round(uprated.to_be_uprated("2023-04-01"), 3) == 1.101
+
+
+def test_updating_uprating_index_reuprates_dependents():
+    from policyengine_core.parameters import ParameterNode, uprate_parameters
+
+    root = ParameterNode(
+        data={
+            "target": {
+                "values": {"2025-01-01": 100},
+                "metadata": {"uprating": "middle"},
+            },
+            "middle": {
+                "values": {"2025-01-01": 100},
+                "metadata": {"uprating": "base"},
+            },
+            "other": {
+                "values": {"2025-01-01": 50},
+                "metadata": {"uprating": "unrelated"},
+            },
+            "base": {
+                "values": {"2025-01-01": 100, "2026-01-01": 110},
+            },
+            "unrelated": {
+                "values": {"2025-01-01": 1, "2026-01-01": 2},
+            },
+        }
+    )
+    root.add_child("baseline", root.clone())
+    uprated = uprate_parameters(root)
+    assert uprated("2026-01-01").target == pytest.approx(110)
+    other_values = uprated.other.values_list
+
+    uprated.base.update(start="2026-01-01", value=120)
+
+    assert uprated("2026-01-01").middle == pytest.approx(120)
+    assert uprated("2026-01-01").target == pytest.approx(120)
+    assert uprated.baseline.target("2026-01-01") == pytest.approx(110)
+    # Parameters that do not depend on the index are left untouched.
+    assert uprated.other.values_list is other_values
+
+
+def test_reuprating_applies_to_clones_and_keeps_explicit_values():
+    from policyengine_core.parameters import ParameterNode, uprate_parameters
+
+    root = uprate_parameters(
+        ParameterNode(
+            data={
+                "target": {
+                    "values": {"2025-01-01": 100},
+                    "metadata": {"uprating": "base"},
+                },
+                "base": {
+                    "values": {
+                        "2025-01-01": 100,
+                        "2026-01-01": 110,
+                        "2027-01-01": 121,
+                    },
+                },
+            }
+        )
+    )
+    reformed = root.clone()
+    reformed.target.update(start="2026-01-01", value=200)
+
+    reformed.base.update(start="2027-01-01", value=132)
+
+    assert reformed.target("2026-01-01") == pytest.approx(200)
+    assert reformed.target("2027-01-01") == pytest.approx(240)
+    assert root.target("2027-01-01") == pytest.approx(121)
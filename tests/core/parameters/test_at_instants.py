@@ -0,0 +1,73 @@
+import datetime
+
+import numpy
+import pytest
+
+from policyengine_core.parameters import ParameterNode
+
+DATES = numpy.array(["2014-06-01", "2015-01-01", "2016-07-01", "2021-01-01"])
+
+
+@pytest.fixture
+def root():
+    return ParameterNode(
+        "",
+        data={
+            "amount": {
+                "values": {"2015-01-01": 100, "2016-01-01": 150, "2020-01-01": None}
+            },
+            "members": {"values": {"2014-01-01": [1], "2016-01-01": [1, 2]}},
+            "scale": {
+                "brackets": [
+                    {
+                        "threshold": {"values": {"2015-01-01": 0}},
+                        "rate": {"values": {"2015-01-01": 0.1}},
+                    },
+                    {
+                        "threshold": {"values": {"2015-01-01": 10, "2016-01-01": 20}},
+                        "rate": {"values": {"2015-01-01": 0.2}},
+                        "base": {"values": {"2015-01-01": 2}},
+                    },
+                ]
+            },
+        },
+    )
+
+
+def test_parameter_at_instants_matches_scalar_lookups(root):
+    result = root.amount.at_instants(DATES)
+    numpy.testing.assert_array_equal(result, [numpy.nan, 100, 150, numpy.nan])
+    assert list(root.members.at_instants(DATES)) == [[1], [1], [1, 2], [1, 2]]
+
+
+def test_instant_formats(root):
+    expected = root.amount.at_instants(DATES)
+    numpy.testing.assert_array_equal(
+        root.amount.at_instants(DATES.astype("datetime64[D]")), expected
+    )
+    numpy.testing.assert_array_equal(
+        root.amount.at_instants([datetime.date(2016, 7, 1)]), [150]
+    )
+    numpy.testing.assert_array_equal(
+        root.amount.at_instants(numpy.array([2015, 2016])), [100, 150]
+    )
+
+
+def test_scale_at_instants(root):
+    result = root.scale.at_instants(DATES)
+    numpy.testing.assert_array_equal(
+        result.thresholds,
+        [[numpy.nan, numpy.nan], [0, 10], [0, 20], [0, 20]],
+    )
+    numpy.testing.assert_array_equal(
+        result.rates,
+        [[numpy.nan, numpy.nan], [0.1, 0.4], [0.1, 0.4], [0.1, 0.4]],
+    )
+
+
+def test_node_at_instants(root):
+    result = root.at_instants(DATES)
+    numpy.testing.assert_array_equal(result.amount, root.amount.at_instants(DATES))
+    numpy.testing.assert_array_equal(
+        result.scale.thresholds, root.scale.at_instants(DATES).thresholds
+    )
@@ -0,0 +1,87 @@
+import pytest
+
+from policyengine_core.parameters import ParameterNode, uprate_parameters
+
+UPDATES = [
+    ("taxes.rate", {"period": "year:2016:2", "value": 0.3}),
+    ("benefits.amount", {"start": "2017-01-01", "value": 150}),
+    ("taxes.rate", {"period": "year:2017:1", "value": 0.35}),
+]
+
+
+def make_node():
+    return ParameterNode(
+        "",
+        data={
+            "taxes": {
+                "rate": {"values": {"2015-01-01": 0.1}},
+            },
+            "benefits": {
+                "amount": {"values": {"2015-01-01": 100}},
+            },
+        },
+    )
+
+
+def test_apply_updates_matches_sequential_updates():
+    sequential = make_node()
+    for path, update_kwargs in UPDATES:
+        sequential.get_child(path).update(**update_kwargs)
+
+    batched = make_node()
+    batched.apply_updates(UPDATES)
+
+    for path in ("taxes.rate", "benefits.amount"):
+        assert (
+            batched.get_child(path).values_list
+            == sequential.get_child(path).values_list
+        )
+
+
+def test_cache_invalidation_is_deferred_to_commit():
+    node = make_node()
+    assert node("2016-01-01").taxes.rate == 0.1
+    assert node("2015-01-01").taxes.rate == 0.1
+
+    with node.batch_update():
+        node.taxes.rate.update(period="year:2016:1", value=0.3)
+        assert "2016-01-01" in node._at_instant_cache
+        assert not node.modified
+
+    assert node("2016-01-01").taxes.rate == 0.3
+    assert "2015-01-01" in node._at_instant_cache
+    assert node.modified and node.taxes.modified and node.taxes.rate.modified
+
+
+def test_batch_commits_when_block_raises():
+    node = make_node()
+    node("2016-01-01")
+
+    with pytest.raises(RuntimeError):
+        with node.batch_update():
+            node.taxes.rate.update(period="year:2016:1", value=0.3)
+            raise RuntimeError
+
+    assert node("2016-01-01").taxes.rate == 0.3
+    assert "_update_batch" not in node.__dict__
+
+
+def test_batch_reuprates_dependents_at_commit():
+    root = uprate_parameters(
+        ParameterNode(
+            data={
+                "target": {
+                    "values": {"2025-01-01": 100},
+                    "metadata": {"uprating": "index"},
+                },
+                "index": {"values": {"2025-01-01": 100, "2026-01-01": 110}},
+            }
+        )
+    )
+
+    with root.batch_update():
+        root.index.update(start="2026-01-01", value=120)
+        root.index.update(start="2027-01-01", value=150)
+
+    assert root.target("2026-01-01") == pytest.approx(120)
+    assert root.target("2027-01-01") == pytest.approx(150)
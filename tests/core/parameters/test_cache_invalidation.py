@@ -0,0 +1,64 @@
+from policyengine_core.parameters import ParameterNode
+
+
+def make_node():
+    return ParameterNode(
+        "",
+        data={
+            "taxes": {
+                "rate": {"values": {"2015-01-01": 0.1, "2020-01-01": 0.2}},
+                "threshold": {"values": {"2015-01-01": 1000}},
+            },
+            "benefits": {
+                "amount": {"values": {"2015-01-01": 100}},
+            },
+        },
+    )
+
+
+def warm(node, instants):
+    for instant in instants:
+        at_instant = node(instant)
+        at_instant.taxes.rate
+        at_instant.benefits.amount
+
+
+def test_update_evicts_only_affected_instants_along_path():
+    node = make_node()
+    instants = ["2016-01-01", "2021-01-01", "2022-01-01"]
+    warm(node, instants)
+    benefits_cache = dict(node.benefits._at_instant_cache)
+    before_2016 = node("2016-01-01")
+    before_2022 = node("2022-01-01")
+
+    node.taxes.rate.update(period="year:2021:1", value=0.3)
+
+    assert set(node._at_instant_cache) == {"2016-01-01", "2022-01-01"}
+    assert set(node.taxes._at_instant_cache) == {"2016-01-01", "2022-01-01"}
+    assert node.benefits._at_instant_cache == benefits_cache
+    assert node("2016-01-01") is before_2016
+    assert node("2022-01-01") is before_2022
+    assert node("2021-01-01").taxes.rate == 0.3
+    assert node("2021-01-01").benefits is benefits_cache["2021-01-01"]
+
+
+def test_update_without_stop_evicts_later_instants():
+    node = make_node()
+    warm(node, ["2016-01-01", "2021-01-01", "2030-01-01"])
+
+    node.taxes.rate.update(start="2021-01-01", value=0.4)
+
+    assert set(node._at_instant_cache) == {"2016-01-01"}
+    assert node("2030-01-01").taxes.rate == 0.4
+    assert node("2016-01-01").taxes.rate == 0.1
+
+
+def test_clear_parent_cache_without_bounds_clears_everything():
+    node = make_node()
+    warm(node, ["2016-01-01", "2021-01-01"])
+
+    node.taxes.clear_parent_cache()
+
+    assert node._at_instant_cache == {}
+    assert node.taxes._at_instant_cache == {}
+    assert node.benefits._at_instant_cache != {}
@@ -0,0 +1,124 @@
+import pickle
+
+from policyengine_core.parameters import ParameterNode
+
+
+def make_node():
+    return ParameterNode(
+        "",
+        data={
+            "taxes": {
+                "rate": {"values": {"2015-01-01": 0.1}},
+                "scale": {
+                    "brackets": [
+                        {
+                            "threshold": {"values": {"2015-01-01": 0}},
+                            "rate": {"values": {"2015-01-01": 0.2}},
+                        },
+                    ],
+                },
+            },
+            "benefits": {
+                "amount": {"values": {"2015-01-01": 100}},
+            },
+        },
+    )
+
+
+def test_clone_copies_only_accessed_path():
+    node = make_node()
+    clone = node.clone()
+
+    clone.taxes.rate.update(period="year:2016:1", value=0.3)
+
+    assert clone._shared_children["benefits"] is node.benefits
+    assert clone.taxes.rate is not node.taxes.rate
+    assert clone.taxes.rate.parent is clone.taxes
+    assert clone("2016-01-01").taxes.rate == 0.3
+    assert node("2016-01-01").taxes.rate == 0.1
+    assert list(clone.children) == ["taxes", "benefits"]
+    assert clone.benefits is not node.benefits
+
+
+def test_updating_original_does_not_leak_into_clones():
+    node = make_node()
+    clone = node.clone()
+    clone_of_clone = clone.clone()
+
+    node.taxes.rate.update(period="year:2016:1", value=0.5)
+    node.taxes.scale.brackets[0].rate.update(period="year:2016:1", value=0.9)
+
+    assert node("2016-01-01").taxes.rate == 0.5
+    for copy in (clone, clone_of_clone):
+        assert copy("2016-01-01").taxes.rate == 0.1
+        assert copy.taxes.scale.brackets[0].rate("2016-01-01") == 0.2
+
+
+def test_adding_child_to_original_does_not_leak_into_clone():
+    node = make_node()
+    clone = node.clone()
+
+    node.taxes.add_child("new", make_node().benefits.amount)
+
+    assert "new" in node.taxes.children
+    assert "new" not in clone.taxes.children
+
+
+def test_pickled_clone_is_self_contained():
+    node = make_node()
+    clone = node.clone()
+    clone.taxes.rate.update(period="year:2016:1", value=0.3)
+
+    restored = pickle.loads(pickle.dumps(clone))
+
+    assert restored("2016-01-01").taxes.rate == 0.3
+    assert restored("2016-01-01").benefits.amount == 100
+    assert restored.benefits.parent is restored
+
+
+def test_reading_values_from_clone_copies_nothing():
+    node = make_node()
+    clone = node.clone()
+
+    assert clone("2016-01-01").taxes.rate == 0.1
+    assert list(clone("2016-01-01")) == ["taxes", "benefits"]
+    assert clone.at_instants(["2016-01-01"]).benefits.amount[0] == 100
+
+    assert clone._shared_children["taxes"] is node.taxes
+    assert clone._shared_children["benefits"] is node.benefits
+    assert node.taxes.parent is node
+
+
+def test_clone_reading_shared_children_keeps_values_from_before_updates():
+    node = make_node()
+    clone = node.clone()
+    at_instant = clone("2016-01-01")
+
+    node.taxes.rate.update(period="year:2016:1", value=0.5)
+
+    assert at_instant.taxes.rate == 0.1
+    assert clone("2016-01-01").taxes.rate == 0.1
+    assert node("2016-01-01").taxes.rate == 0.5
+
+
+def test_pickling_clone_does_not_copy_shared_children():
+    node = make_node()
+    clone = node.clone()
+
+    restored = pickle.loads(pickle.dumps(clone))
+
+    assert clone._shared_children["taxes"] is node.taxes
+    assert restored.taxes.parent is restored
+    assert restored.taxes.rate.parent is restored.taxes
+
+
+def test_trees_pickled_together_keep_sharing_children():
+    node = make_node()
+    clone = node.clone()
+
+    restored_node, restored_clone = pickle.loads(pickle.dumps((node, clone)))
+    restored_node.benefits.amount.update(period="year:2016:1", value=200)
+
+    assert restored_node("2016-01-01").benefits.amount == 200
+    assert restored_clone("2016-01-01").benefits.amount == 100
+    assert restored_clone.benefits.parent is restored_clone
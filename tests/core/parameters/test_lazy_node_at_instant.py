@@ -0,0 +1,84 @@
+import pickle
+
+import pytest
+
+from policyengine_core.parameters import ParameterNode, ParameterNotFoundError
+
+
+def make_node():
+    return ParameterNode(
+        "",
+        data={
+            "taxes": {
+                "rate": {"values": {"2015-01-01": 0.1, "2020-01-01": 0.2}},
+                "later": {"values": {"2030-01-01": 5}},
+            },
+            "benefits": {
+                "amount": {"values": {"2015-01-01": 100}},
+            },
+        },
+    )
+
+
+def test_children_resolved_on_access():
+    node = make_node()
+    at_instant = node("2021-01-01")
+
+    assert at_instant.taxes.rate == 0.2
+    # The sibling subtree was never touched, so it was never materialised.
+    assert node.benefits._at_instant_cache == {}
+    assert at_instant["benefits"]["amount"] == 100
+    assert "2021-01-01" in node.benefits._at_instant_cache
+
+
+def test_iteration_skips_children_undefined_at_instant():
+    at_instant = make_node()("2021-01-01")
+
+    assert list(at_instant) == ["taxes", "benefits"]
+    assert list(at_instant.taxes) == ["rate"]
+    with pytest.raises(ParameterNotFoundError):
+        at_instant.taxes.later
+    with pytest.raises(KeyError):
+        at_instant.taxes["later"]
+
+
+def test_resolution_follows_updates():
+    node = make_node()
+    assert node("2021-01-01").taxes.rate == 0.2
+
+    node.taxes.rate.update(period="year:2021:1", value=0.3)
+
+    assert node("2021-01-01").taxes.rate == 0.3
+
+
+def test_nodes_at_instant_keep_values_from_before_updates():
+    node = make_node()
+    at_instant = node("2021-01-01")
+
+    node.taxes.rate.update(period="year:2021:1", value=0.3)
+
+    assert at_instant.taxes.rate == 0.2
+    assert node("2021-01-01").taxes.rate == 0.3
+
+
+def test_system_parameters_at_instant_follow_updates(tax_benefit_system):
+    tax_benefit_system = tax_benefit_system.clone()
+    rate = tax_benefit_system.parameters.taxes.income_tax_rate
+    before = tax_benefit_system.get_parameters_at_instant("2017-01-01")
+
+    rate.update(period="year:2017:1", value=0.5)
+
+    assert before.taxes.income_tax_rate == 0.15
+    after = tax_benefit_system.get_parameters_at_instant("2017-01-01")
+    assert after.taxes.income_tax_rate == 0.5
+
+
+def test_pickled_nodes_at_instant_leave_the_tree_out():
+    at_instant = make_node()("2021-01-01")
+
+    restored = pickle.loads(pickle.dumps(at_instant))
+
+    assert restored._node is None
+    assert restored.taxes._node is None
+    assert restored.taxes.rate == 0.2
+    assert list(restored) == ["taxes", "benefits"]
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from policyengine_core.country_template.constants import COUNTRY_DIR
+from policyengine_core.parameters import (
+    ParameterNode,
+    ParameterParsingError,
+    load_parameter_directory,
+)
+
+PARAMETERS_DIR = os.path.join(COUNTRY_DIR, "parameters")
+
+
+def parameter_values(node):
+    return {
+        parameter.name: [
+            (value.instant_str, value.value) for value in parameter.values_list
+        ]
+        for parameter in node.get_descendants()
+        if not isinstance(parameter, ParameterNode)
+        and hasattr(parameter, "values_list")
+    }
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_loading_builds_same_tree(use_processes):
+    sequential = ParameterNode("", directory_path=PARAMETERS_DIR)
+    parallel = load_parameter_directory(
+        PARAMETERS_DIR, max_workers=2, use_processes=use_processes
+    )
+
+    assert repr(parallel) == repr(sequential)
+    assert parameter_values(parallel) == parameter_values(sequential)
+    assert [child.name for child in parallel.get_descendants()] == [
+        child.name for child in sequential.get_descendants()
+    ]
+
+
+def test_parallel_loading_reports_first_invalid_file(tmp_path):
+    (tmp_path / "a.yaml").write_text("values:\n  2015-01-01: 1\n")
+    (tmp_path / "b.yaml").write_text("values: [1\n")
+    (tmp_path / "c.yaml").write_text("values: {\n")
+
+    with pytest.raises(ParameterParsingError) as sequential_error:
+        ParameterNode("", directory_path=str(tmp_path))
+    with pytest.raises(ParameterParsingError) as parallel_error:
+        load_parameter_directory(str(tmp_path), max_workers=3)
+
+    assert "b.yaml" in str(parallel_error.value)
+    assert str(parallel_error.value) == str(sequential_error.value)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_loading_reports_errors_in_file_order(tmp_path, use_processes):
+    (tmp_path / "a.yaml").write_text("values:\n  not-a-date: 1\n")
+    (tmp_path / "b.yaml").write_text("values: [1\n")
+
+    with pytest.raises(ParameterParsingError) as sequential_error:
+        ParameterNode("", directory_path=str(tmp_path))
+    with pytest.raises(ParameterParsingError) as parallel_error:
+        load_parameter_directory(
+            str(tmp_path), max_workers=2, use_processes=use_processes
+        )
+
+    assert "a.yaml" in str(parallel_error.value)
+    assert str(parallel_error.value) == str(sequential_error.value)
+
+
+def test_system_parses_parameters_concurrently():
+    from policyengine_core.country_template import CountryTaxBenefitSystem
+
+    class ParallelSystem(CountryTaxBenefitSystem):
+        parameter_loading_workers = 2
+
+    parameters = ParallelSystem().parameters
+    baseline = CountryTaxBenefitSystem().parameters
+    assert parameter_values(parameters) == parameter_values(baseline)
@@ -0,0 +1,57 @@
+from policyengine_core.parameters import ParameterAtInstant, ParameterNode
+
+
+def make_rate():
+    root = ParameterNode(
+        "",
+        data={
+            "rate": {
+                "values": {
+                    f"{year}-{month:02d}-01": year + month / 100
+                    for year in range(1990, 2030)
+                    for month in range(1, 13)
+                }
+            }
+        },
+    )
+    return root.rate
+
+
+def linear_lookup(parameter, instant_str):
+    for value_at_instant in parameter.values_list:
+        if value_at_instant.instant_str <= instant_str:
+            return value_at_instant.value
+    return None
+
+
+def test_lookup_matches_linear_scan():
+    rate = make_rate()
+    for instant_str in [
+        "1989-12-31",
+        "1990-01-01",
+        "2001-06-15",
+        "2015-12-31",
+        "2029-12-01",
+        "2100-01-01",
+    ]:
+        assert rate(instant_str) == linear_lookup(rate, instant_str)
+
+
+def test_lookup_sees_in_place_value_edits():
+    rate = make_rate()
+    assert rate("2020-03-15") == 2020.03
+    rate.values_list[-1].value = -1
+    rate.values_list[0].value = -2
+    assert rate("1990-01-01") == -1
+    assert rate("2040-01-01") == -2
+
+
+def test_lookup_follows_updates_and_appends():
+    rate = make_rate()
+    rate.update(period="year:2020:1", value=0)
+    assert rate("2020-06-01") == 0
+    assert rate("2021-01-01") == 2021.01
+
+    rate.values_list.append(ParameterAtInstant("rate", "2035-01-01", data=7))
+    rate.values_list.sort(key=lambda x: x.instant_str, reverse=True)
+    assert rate("2036-01-01") == 7
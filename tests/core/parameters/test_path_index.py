@@ -0,0 +1,59 @@
+import pytest
+
+from policyengine_core.parameters import ParameterNode, get_parameter
+
+
+def make_node():
+    return ParameterNode(
+        "",
+        data={
+            "taxes": {
+                "rate": {"values": {"2015-01-01": 0.1}},
+                "scale": {
+                    "brackets": [
+                        {
+                            "threshold": {"values": {"2015-01-01": 0}},
+                            "rate": {"values": {"2015-01-01": 0.2}},
+                        },
+                    ],
+                },
+            },
+        },
+    )
+
+
+def test_lookups_are_indexed():
+    node = make_node()
+
+    rate = node.get_child("taxes.scale[0].rate")
+
+    assert rate is node.taxes.scale.brackets[0].rate
+    assert node._path_index["taxes.scale[0].rate"] is rate
+    assert get_parameter(node, "taxes.scale[0].rate") is rate
+    with pytest.raises(ValueError, match="failed at missing"):
+        node.get_child("taxes.missing")
+    assert "taxes.missing" not in node._path_index
+
+
+def test_index_follows_structure_changes():
+    node = make_node()
+    rate = node.get_child("taxes.rate")
+
+    node.taxes.add_child("other", make_node().taxes.rate)
+    assert node.get_child("taxes.other") is node.taxes.other
+    assert node.get_child("taxes.rate") is rate
+
+    replacement = make_node().taxes.rate
+    node.taxes.children["rate"] = replacement
+    node.taxes.clear_path_index()
+    assert node.get_child("taxes.rate") is replacement
+
+
+def test_clones_have_their_own_index():
+    node = make_node()
+    node.get_child("taxes.rate")
+
+    clone = node.clone()
+
+    assert clone.get_child("taxes.rate") is clone.taxes.rate
+    assert clone.get_child("taxes.rate") is not node.get_child("taxes.rate")
@@ -0,0 +1,102 @@
+from policyengine_core.parameters import ParameterNode
+from policyengine_core.taxscales import (
+    LinearAverageRateTaxScale,
+    MarginalAmountTaxScale,
+    MarginalRateTaxScale,
+)
+
+
+def make_node():
+    return ParameterNode(
+        "",
+        data={
+            "taxes": {
+                "scale": {
+                    "brackets": [
+                        {
+                            "threshold": {"values": {"2015-01-01": 0}},
+                            "rate": {"values": {"2015-01-01": 0.1}},
+                        },
+                        {
+                            "threshold": {"values": {"2015-01-01": 100}},
+                            "rate": {"values": {"2015-01-01": 0.2}},
+                            "base": {"values": {"2015-01-01": 2}},
+                        },
+                    ],
+                },
+                "amounts": {
+                    "brackets": [
+                        {
+                            "threshold": {"values": {"2015-01-01": 0}},
+                            "amount": {"values": {"2015-01-01": 10}},
+                        },
+                    ],
+                },
+                "average": {
+                    "brackets": [
+                        {
+                            "threshold": {"values": {"2015-01-01": 0}},
+                            "average_rate": {"values": {"2015-01-01": 0.1}},
+                        },
+                    ],
+                },
+            },
+        },
+    )
+
+
+def test_scale_type_resolved_at_load():
+    taxes = make_node().taxes
+    assert taxes.scale.scale_type == "marginal_rate"
+    assert taxes.amounts.scale_type == "marginal_amount"
+    assert taxes.average.scale_type == "linear_average_rate"
+    assert isinstance(taxes.scale("2016-01-01"), MarginalRateTaxScale)
+    assert isinstance(taxes.amounts("2016-01-01"), MarginalAmountTaxScale)
+    assert isinstance(taxes.average("2016-01-01"), LinearAverageRateTaxScale)
+
+
+def test_tax_scale_cached_per_instant():
+    node = make_node()
+    scale = node.taxes.scale("2016-01-01")
+
+    assert scale.thresholds == [0, 100]
+    assert scale.rates == [0.1, 0.4]
+    assert node.taxes.scale("2016-01-01") is scale
+    assert node("2016-01-01").taxes.scale is scale
+    assert node.taxes.scale("2017-01-01") is not scale
+
+
+def test_bracket_update_evicts_affected_instants():
+    node = make_node()
+    scale = node.taxes.scale
+    before = scale("2016-01-01")
+    after = scale("2018-01-01")
+
+    scale.brackets[1].rate.update(start="2017-01-01", value=0.3)
+
+    assert scale("2016-01-01") is before
+    assert scale("2018-01-01") is not after
+    assert scale("2018-01-01").rates == [0.1, 0.6]
+    assert node("2018-01-01").taxes.scale.rates == [0.1, 0.6]
+
+
+def test_batched_bracket_update_evicts_tax_scales():
+    node = make_node()
+    assert node.taxes.scale("2018-01-01").thresholds == [0, 100]
+
+    with node.batch_update():
+        node.get_child("taxes.scale[1].threshold").update(start="2017-01-01", value=150)
+
+    assert node.taxes.scale("2018-01-01").thresholds == [0, 150]
+
+
+def test_clone_does_not_share_tax_scales():
+    node = make_node()
+    scale = node.taxes.scale("2016-01-01")
+    clone = node.clone()
+
+    clone.taxes.scale.brackets[0].rate.update(start="2015-01-01", value=0.5)
+
+    assert node.taxes.scale("2016-01-01") is scale
+    assert scale.rates == [0.1, 0.4]
+    assert clone.taxes.scale("2016-01-01").rates == [0.5, 0.4]
@@ -0,0 +1,52 @@
+import gc
+import sys
+
+import numpy as np
+import pytest
+
+from policyengine_core.country_template import Simulation
+from policyengine_core.periods import instant
+from policyengine_core.simulations import CalculationJob, WorkerPool
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Worker pools fork their workers."
+)
+
+SITUATION = {"persons": {"person": {"salary": {"2022-01": 1000}}}}
+
+
+@pytest.fixture(autouse=True)
+def unfreeze_objects():
+    yield
+    # Starting a pool freezes the objects of this process.
+    gc.unfreeze()
+
+
+def test_worker_pool_runs_jobs():
+    jobs = [
+        CalculationJob(["income_tax"], "2022-01", situation=SITUATION),
+        CalculationJob(
+            ["income_tax", "salary"],
+            "2022-01",
+            situation=SITUATION,
+            reform={"taxes.income_tax_rate": {"2022": 0.5}},
+        ),
+    ]
+
+    with WorkerPool(Simulation, workers=2, years=[2022]) as pool:
+        results = list(pool.map(jobs))
+
+    assert results[0]["income_tax"] == pytest.approx([150])
+    assert results[1]["income_tax"] == pytest.approx([500])
+    assert isinstance(results[1]["salary"], np.ndarray)
+    system = Simulation.default_tax_benefit_system_instance
+    assert instant(2022) in system._parameters_at_instant_cache
+
+
+def test_worker_pool_reports_job_errors():
+    with WorkerPool(Simulation, workers=1) as pool:
+        future = pool.submit(
+            CalculationJob(["not_a_variable"], "2022-01", situation=SITUATION)
+        )
+        with pytest.raises(Exception, match="not_a_variable"):
+            future.result()
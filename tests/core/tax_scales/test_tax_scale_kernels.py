@@ -0,0 +1,114 @@
+import numpy
+import pytest
+
+from policyengine_core import taxscales, tools
+
+EPSILON = numpy.finfo(numpy.float64).eps
+
+
+def dense_thresholds(thresholds, factor, size, round_decimals):
+    factor = numpy.ones(size) * factor
+    scaled = numpy.outer(factor + EPSILON, numpy.array(thresholds))
+    if round_decimals is not None:
+        scaled = numpy.round(scaled, round_decimals)
+    return scaled
+
+
+def dense_bracket_indices(tax_base, thresholds, factor, round_decimals):
+    scaled = dense_thresholds(thresholds, factor, len(tax_base), round_decimals)
+    base = numpy.tile(tax_base, (len(thresholds), 1)).T
+    return (base - scaled >= 0).sum(axis=1) - 1
+
+
+def dense_marginal_calc(tax_base, thresholds, rates, factor, round_decimals):
+    scaled = dense_thresholds(
+        list(thresholds) + [numpy.inf], factor, len(tax_base), round_decimals
+    )
+    base = numpy.tile(tax_base, (len(thresholds), 1)).T
+    taxed = numpy.maximum(numpy.minimum(base, scaled[:, 1:]) - scaled[:, :-1], 0)
+    if round_decimals is None:
+        return numpy.dot(rates, taxed.T)
+    return numpy.round(
+        numpy.array(rates) * numpy.round(taxed, round_decimals), round_decimals
+    ).sum(axis=1)
+
+
+def make_scale(thresholds, rates):
+    tax_scale = taxscales.MarginalRateTaxScale()
+    for threshold, rate in zip(thresholds, rates):
+        tax_scale.add_bracket(threshold, rate)
+    return tax_scale
+
+
+@pytest.mark.parametrize("round_decimals", [None, 0, 2])
+@pytest.mark.parametrize("per_row_factor", [False, True])
+def test_kernels_match_dense_evaluation(round_decimals, per_row_factor):
+    random = numpy.random.default_rng(0)
+    thresholds = [0, 1_000.5, 2_500, 10_000, 40_000.25]
+    rates = [0.0, 0.1, 0.2, 0.4, 0.45]
+    tax_scale = make_scale(thresholds, rates)
+    tax_base = numpy.concatenate(
+        [
+            random.uniform(-1_000, 60_000, 2_000),
+            numpy.array(thresholds) * 1.5,
+            numpy.array(thresholds),
+        ]
+    )
+    factor = random.uniform(0.5, 2, len(tax_base)) if per_row_factor else 1.5
+
+    tools.assert_near(
+        tax_scale.bracket_indices(tax_base, factor, round_decimals),
+        dense_bracket_indices(tax_base, thresholds, factor, round_decimals),
+    )
+    tools.assert_near(
+        tax_scale.calc(tax_base, factor, round_decimals),
+        dense_marginal_calc(tax_base, thresholds, rates, factor, round_decimals),
+        absolute_error_margin=1e-6,
+    )
+
+
+def test_kernels_with_non_positive_factor():
+    thresholds = [0, 10, 20]
+    rates = [0.1, 0.2, 0.3]
+    tax_scale = make_scale(thresholds, rates)
+    tax_base = numpy.array([-20.0, -5.0, 0.0, 5.0, 15.0, 25.0])
+    factor = numpy.array([-1.0, 0.0, 1.0, -1.0, 1.0, 0.0])
+
+    tools.assert_near(
+        tax_scale.bracket_indices(tax_base, factor),
+        dense_bracket_indices(tax_base, thresholds, factor, None),
+    )
+    tools.assert_near(
+        tax_scale.calc(tax_base, factor),
+        dense_marginal_calc(tax_base, thresholds, rates, factor, None),
+    )
+
+
+def test_marginal_calc_with_nan_tax_base():
+    tax_scale = make_scale([0, 10], [0.1, 0.2])
+    tax_base = numpy.array([numpy.nan, 15.0])
+
+    result = tax_scale.calc(tax_base)
+
+    assert numpy.isnan(result[0])
+    tools.assert_near(result[1], 2)
+    tools.assert_near(tax_scale.bracket_indices(tax_base), [-1, 1])
+
+
+def test_linear_average_calc_matches_dense_evaluation():
+    tax_scale = taxscales.LinearAverageRateTaxScale()
+    thresholds = [0, 10, 20, 50]
+    rates = [0.0, 0.1, 0.3, 0.3]
+    for threshold, rate in zip(thresholds, rates):
+        tax_scale.add_bracket(threshold, rate)
+    tax_base = numpy.linspace(-10, 60, 141)
+
+    slopes = numpy.diff(rates) / numpy.diff(thresholds)
+    expected = numpy.zeros(len(tax_base))
+    for lower, upper, slope, rate in zip(
+        thresholds[:-1], thresholds[1:], slopes, rates[:-1]
+    ):
+        in_bracket = (tax_base >= lower) & (tax_base < upper)
+        expected += in_bracket * tax_base * (rate + (tax_base - lower) * slope)
+
+    tools.assert_near(tax_scale.calc(tax_base), expected)
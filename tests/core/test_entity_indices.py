@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from policyengine_core.simulations import Simulation
+
+TEST_CASE = {
+    "persons": {
+        "ind0": {"salary": {"2016-01": 40}},
+        "ind1": {"salary": {"2016-01": 37}},
+        "ind2": {"salary": {"2016-01": 7}},
+        "ind3": {"salary": {"2016-01": 54}},
+        "ind4": {"salary": {"2016-01": 9}},
+    },
+    "households": {
+        "h1": {"parents": ["ind0", "ind1"], "children": ["ind2", "ind4"]},
+        "h2": {"parents": ["ind3"]},
+    },
+}
+
+
+def new_simulation(tax_benefit_system):
+    return Simulation(tax_benefit_system=tax_benefit_system, situation=TEST_CASE)
+
+
+def test_get_index_uses_cached_id_lookup(tax_benefit_system):
+    simulation = new_simulation(tax_benefit_system)
+    assert simulation.person.get_index("ind3") == 3
+    assert simulation.household.get_index("h2") == 1
+    with pytest.raises(ValueError):
+        simulation.person.get_index("nobody")
+
+
+def test_get_index_follows_reassigned_ids(tax_benefit_system):
+    simulation = new_simulation(tax_benefit_system)
+    assert simulation.household.get_index("h1") == 0
+    simulation.household.ids = np.array(["h2", "h1"])
+    assert simulation.household.get_index("h1") == 1
+
+
+def test_get_member_indices(tax_benefit_system):
+    simulation = new_simulation(tax_benefit_system)
+    household = simulation.household
+    assert household.get_member_indices(0).tolist() == [0, 1, 2, 4]
+    assert household.get_member_indices(1).tolist() == [3]
+
+    household.members_entity_id = np.array([1, 1, 0, 0, 1])
+    assert household.get_member_indices(0).tolist() == [2, 3]
+
+
+def test_extract_people_matches_extract_person(tax_benefit_system):
+    simulation = new_simulation(tax_benefit_system)
+    situations = simulation.extract_people([4, 3])
+    assert situations == [
+        simulation.extract_person(4),
+        simulation.extract_person(3),
+    ]
+
+    situation = situations[0]
+    assert situation["households"]["household"]["members"] == [
+        "person_1",
+        "person_2",
+        "person_3",
+        "person_5",
+    ]
+    assert situation["persons"]["person_5"]["salary"] == {"2016-01": 9}
+    assert list(situations[1]["persons"]) == ["person_4"]
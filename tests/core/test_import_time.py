@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+# Dependencies only some features need, which are slow to import.
+DEFERRED_MODULES = [
+    "h5py",
+    "huggingface_hub",
+    "IPython",
+    "microdf",
+    "networkx",
+    "pandas",
+    "plotly",
+    "psutil",
+    "pyvis",
+    "requests",
+]
+
+
+def get_imported_modules(statement: str) -> list:
+    # A new interpreter, as this one has imported everything already.
+    script = f"import sys, json\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_importing_policyengine_core_defers_heavy_dependencies():
+    imported = get_imported_modules("import policyengine_core")
+
+    assert [module for module in DEFERRED_MODULES if module in imported] == []
+
+
+def test_importing_charts_defers_plotly():
+    imported = get_imported_modules("import policyengine_core.charts")
+
+    assert "plotly" not in imported
+    assert "IPython" not in imported
+
+
+def test_array_directory_datasets_defer_heavy_dependencies(tmp_path):
+    statement = f"""
+from policyengine_core.country_template import Simulation
+from policyengine_core.data import Dataset
+
+class ArrayDirectoryDataset(Dataset):
+    name = "array_directory_dataset"
+    label = "Array directory dataset"
+    file_path = {str(tmp_path / "dataset")!r}
+    data_format = Dataset.ARRAY_DIRECTORY
+
+dataset = ArrayDirectoryDataset()
+dataset.save_dataset({{
+    "person_id": {{"2017": [0]}},
+    "household_id": {{"2017": [0]}},
+    "person_household_id": {{"2017": [0]}},
+    "person_household_role": {{"2017": ["parent"]}},
+    "salary": {{"2017-01": [1000.0]}},
+}})
+Simulation(dataset=ArrayDirectoryDataset()).calculate("income_tax", "2017-01")
+"""
+    imported = get_imported_modules(statement)
+
+    assert "h5py" not in imported
+    assert "pandas" not in imported
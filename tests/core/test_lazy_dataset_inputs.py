@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from policyengine_core.country_template import Simulation
+from policyengine_core.data import Dataset, DatasetArray
+from policyengine_core.periods import period
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    class LazyDataset(Dataset):
+        name = "lazy_dataset"
+        label = "Lazy dataset"
+        file_path = tmp_path / "lazy_dataset.h5"
+        data_format = Dataset.TIME_PERIOD_ARRAYS
+
+    dataset = LazyDataset()
+    dataset.save_dataset(
+        {
+            "person_id": {"2017": [0, 1]},
+            "household_id": {"2017": [0]},
+            "person_household_id": {"2017": [0, 0]},
+            "person_household_role": {"2017": [b"parent", b"child"]},
+            "salary": {"2017-01": [1000.0, 0.0]},
+            "age": {"2017-01": [40, 10]},
+        }
+    )
+    return dataset
+
+
+@pytest.fixture
+def loaded_keys(monkeypatch):
+    keys = []
+    load = Dataset.load
+
+    def counting_load(self, key=None, mode="r"):
+        if key is not None:
+            keys.append(key)
+        return load(self, key, mode)
+
+    monkeypatch.setattr(Dataset, "load", counting_load)
+    return keys
+
+
+def test_dataset_arrays_are_read_when_needed(dataset, loaded_keys):
+    simulation = Simulation(dataset=dataset)
+    assert loaded_keys == []
+
+    assert simulation.calculate("salary", "2017-01").tolist() == [1000, 0]
+    assert loaded_keys == ["salary/2017-01"]
+
+    simulation.calculate("salary", "2017-01")
+    assert loaded_keys == ["salary/2017-01"]
+
+
+def test_lazy_inputs_are_user_inputs_once_read(dataset):
+    simulation = Simulation(dataset=dataset)
+    assert ("age", "default", period("2017-01")) not in simulation._user_input_keys
+
+    simulation.calculate("age", "2017-01")
+
+    assert ("age", "default", period("2017-01")) in simulation._user_input_keys
+    assert simulation.to_input_dict()["salary"]["2017-01"] == [1000, 0]
+
+
+def test_dataset_arrays_are_read_once():
+    calls = []
+
+    class CountingDataset:
+        def load(self, key):
+            calls.append(key)
+            return np.array([1.0])
+
+    column = DatasetArray(CountingDataset(), "salary/2017-01")
+
+    assert column()[0] == 1
+    assert column()[0] == 1
+    assert calls == ["salary/2017-01"]
@@ -0,0 +1,73 @@
+import shutil
+
+import pytest
+
+from policyengine_core.country_template import CountryTaxBenefitSystem
+from policyengine_core.country_template.constants import COUNTRY_DIR
+from policyengine_core.taxbenefitsystems import parameter_cache
+
+
+@pytest.fixture
+def cached_system_class(tmp_path):
+    parameters_dir = tmp_path / "parameters"
+    shutil.copytree(COUNTRY_DIR / "parameters", parameters_dir)
+
+    class CachedTaxBenefitSystem(CountryTaxBenefitSystem):
+        parameter_cache_dir = tmp_path / "cache"
+
+    CachedTaxBenefitSystem.parameters_dir = parameters_dir
+    return CachedTaxBenefitSystem
+
+
+def test_second_construction_loads_cached_tree(cached_system_class, monkeypatch):
+    first = cached_system_class()
+    assert len(list(cached_system_class.parameter_cache_dir.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The parameter tree should come from the cache.")
+
+    monkeypatch.setattr(cached_system_class, "load_parameters", fail)
+    second = cached_system_class()
+
+    assert second.parameters is not first.parameters
+    assert (
+        second.parameters("2016-01-01").taxes.income_tax_rate
+        == first.parameters("2016-01-01").taxes.income_tax_rate
+    )
+    assert second.parameters.baseline.taxes.income_tax_rate.parent is (
+        second.parameters.baseline.taxes
+    )
+
+
+def test_cache_key_follows_parameter_files(cached_system_class):
+    system = cached_system_class()
+    key = parameter_cache.get_parameter_cache_key(system)
+    assert parameter_cache.get_parameter_cache_key(system) == key
+
+    rate_file = cached_system_class.parameters_dir / "taxes" / "income_tax_rate.yaml"
+    rate_file.write_text(rate_file.read_text().replace("0.15", "0.25"))
+
+    assert parameter_cache.get_parameter_cache_key(system) != key
+    assert cached_system_class().parameters("2016-01-01").taxes.income_tax_rate == 0.25
+
+
+def test_reform_systems_skip_the_cache(cached_system_class):
+    cached_system_class(reform={"taxes.income_tax_rate": {"2016": 0.3}})
+    assert not cached_system_class.parameter_cache_dir.exists()
+
+
+def test_unreadable_cache_is_ignored(cached_system_class):
+    system = cached_system_class()
+    key = parameter_cache.get_parameter_cache_key(system)
+    cache_file = parameter_cache._get_cache_file(
+        cached_system_class.parameter_cache_dir, key
+    )
+    cache_file.write_bytes(b"not a pickle")
+
+    assert (
+        parameter_cache.load_cached_parameters(
+            cached_system_class.parameter_cache_dir, key
+        )
+        is None
+    )
+    assert cached_system_class().parameters("2016-01-01").taxes.income_tax_rate == 0.15
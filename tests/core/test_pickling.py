@@ -0,0 +1,87 @@
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from policyengine_core import pickling
+from policyengine_core.country_template import Simulation
+from policyengine_core.data_storage import OnDiskStorage
+from policyengine_core.enums import EnumArray
+from policyengine_core.reforms import Reform
+
+SITUATION = {
+    "persons": {"person": {"salary": {"2017-01": 1000}}},
+    "households": {
+        "household": {
+            "parents": ["person"],
+            "housing_occupancy_status": {"2017-01": "tenant"},
+        }
+    },
+}
+
+
+def test_simulation_arrays_are_out_of_band():
+    simulation = Simulation(situation=SITUATION)
+    simulation.calculate("income_tax", "2017-01")
+
+    data, buffers = pickling.dumps(simulation)
+    assert len(buffers) > 0
+
+    copy = pickling.loads(data, buffers)
+    assert copy.calculate("income_tax", "2017-01")[0] == 150
+    status = copy.calculate("housing_occupancy_status", "2017-01")
+    assert isinstance(status, EnumArray)
+    assert status.decode_to_str().tolist() == ["tenant"]
+
+
+def test_variables_are_pickled_by_name(tax_benefit_system):
+    variable = tax_benefit_system.get_variable("income_tax")
+    assert type(variable).__module__ not in pickle.dumps(variable).decode("latin-1")
+
+    tax_benefit_system = tax_benefit_system.clone()
+    tax_benefit_system.neutralize_variable("income_tax")
+    copy = pickle.loads(pickle.dumps(tax_benefit_system.get_variable("income_tax")))
+    assert copy.name == "income_tax"
+    assert copy.is_neutralized
+
+
+def test_reforms_from_dicts_are_pickled_as_their_parameters():
+    reform = Reform.from_dict({"taxes.income_tax_rate": {"2017-01-01": 0.3}})
+    simulation = Simulation(situation=SITUATION, reform=reform)
+
+    copy = pickling.loads(*pickling.dumps(simulation))
+
+    assert copy.reform.parameter_values == reform.parameter_values
+    assert copy.calculate("income_tax", "2017-01")[0] == 300
+
+
+def test_unpickled_disk_storage_keeps_files(tmp_path):
+    storage = OnDiskStorage(str(tmp_path / "storage"))
+    os.makedirs(storage.storage_dir)
+    storage.put(np.array([1.0]), "2017")
+
+    copy = pickle.loads(pickle.dumps(storage))
+    del copy
+
+    assert storage.get("2017")[0] == 1
+
+
+def _calculate_income_tax(data, buffers):
+    simulation = pickling.loads(data, buffers)
+    return simulation.calculate("income_tax", "2017-01").tolist()
+
+
+def test_simulations_are_unpickled_in_spawned_processes():
+    simulation = Simulation(situation=SITUATION)
+    data, buffers = pickling.dumps(simulation)
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        result = executor.submit(
+            _calculate_income_tax, data, [bytes(buffer) for buffer in buffers]
+        ).result()
+
+    assert result == [150]
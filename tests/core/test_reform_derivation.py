@@ -0,0 +1,113 @@
+import shutil
+
+import pytest
+
+from policyengine_core.country_template import CountryTaxBenefitSystem, Simulation
+from policyengine_core.country_template.constants import COUNTRY_DIR
+from policyengine_core.parameters import Parameter
+from policyengine_core.parameters.operations.uprate_parameters import (
+    get_path_from_root,
+)
+from policyengine_core.reforms import Reform
+
+UPRATED_PARAMETERS = {
+    "price_index.yaml": """
+description: Price index
+values:
+  2015-01-01: 100
+  2016-01-01: 110
+  2017-01-01: 121
+  2018-01-01: 133.1
+""",
+    "uprated_amount.yaml": """
+description: Amount uprated with the price index
+metadata:
+  uprating: uprating.price_index
+values:
+  2015-01-01: 10
+""",
+    "uprated_twice.yaml": """
+description: Amount uprated with the uprated amount
+metadata:
+  uprating: uprating.uprated_amount
+values:
+  2015-01-01: 1
+""",
+}
+
+REFORMS = [
+    {"uprating.uprated_amount": {"2017-01-01": 20}},
+    {"uprating.uprated_amount": {"2016-01-01.2016-12-31": 20}},
+    {"uprating.price_index": {"2017-01-01": 150}},
+    (
+        {"uprating.price_index": {"2016-01-01": 120}},
+        {"uprating.uprated_twice": {"2018-01-01": 5}},
+    ),
+    {"taxes.income_tax_rate": {"2016": 0.3}},
+]
+
+
+@pytest.fixture(scope="module")
+def system_class(tmp_path_factory):
+    parameters_dir = tmp_path_factory.mktemp("derivation") / "parameters"
+    shutil.copytree(COUNTRY_DIR / "parameters", parameters_dir)
+    (parameters_dir / "uprating").mkdir()
+    for file_name, content in UPRATED_PARAMETERS.items():
+        (parameters_dir / "uprating" / file_name).write_text(content)
+
+    class UpratingTaxBenefitSystem(CountryTaxBenefitSystem):
+        pass
+
+    UpratingTaxBenefitSystem.parameters_dir = parameters_dir
+    return UpratingTaxBenefitSystem
+
+
+def get_values(system):
+    return {
+        get_path_from_root(parameter): [
+            (value.instant_str, value.value) for value in parameter.values_list
+        ]
+        for parameter in system.parameters.get_descendants()
+        if isinstance(parameter, Parameter)
+    }
+
+
+@pytest.mark.parametrize("reform", REFORMS)
+def test_derived_system_matches_rebuilt_system(system_class, reform):
+    baseline = system_class()
+    baseline_values = get_values(baseline)
+    assert baseline.can_derive_reformed_system(reform)
+
+    derived = baseline.derive_reformed_system(reform)
+
+    assert get_values(derived) == get_values(system_class(reform=reform))
+    assert get_values(baseline) == baseline_values
+
+
+def test_non_parametric_reforms_are_rebuilt(system_class):
+    class neutralize_salary(Reform):
+        def apply(self):
+            self.neutralize_variable("salary")
+
+    baseline = system_class()
+    assert not baseline.can_derive_reformed_system(neutralize_salary)
+    assert not baseline.can_derive_reformed_system(
+        ({"uprating.price_index": {"2017-01-01": 150}}, neutralize_salary)
+    )
+    assert not baseline.can_derive_reformed_system({"missing": {"2017": 1}})
+
+
+def test_simulation_derives_reformed_system(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("The reformed system should be derived.")
+
+    monkeypatch.setattr(CountryTaxBenefitSystem, "load_parameters", fail)
+    simulation = Simulation(
+        situation={"persons": {"person": {"salary": {"2022-01": 1000}}}},
+        reform={"taxes.income_tax_rate": {"2022": 0.5}},
+    )
+
+    assert simulation.tax_benefit_system is not (
+        Simulation.default_tax_benefit_system_instance
+    )
+    assert simulation.calculate("income_tax", "2022-01")[0] == pytest.approx(500)
@@ -0,0 +1,106 @@
+import pytest
+
+from policyengine_core.country_template import CountryTaxBenefitSystem, Simulation
+from policyengine_core.reforms import Reform, ReformedSystemCache
+from policyengine_core.reforms.reformed_system_cache import reformed_system_cache
+from policyengine_core.reforms.reform import get_reform_hash
+
+
+def test_reform_hash_ignores_key_order_and_period_formats():
+    reform_hash = get_reform_hash(
+        {
+            "taxes.income_tax_rate": {"2016": 0.3},
+            "benefits.basic_income": 700,
+            "benefits.housing_allowance": {"year:2017:1": 0.3},
+        }
+    )
+
+    assert reform_hash == get_reform_hash(
+        {
+            "benefits.housing_allowance": {"2017-01-01.2017-12-31": 0.3},
+            "benefits.basic_income": {"year:2000:100": 700},
+            "taxes.income_tax_rate": {"2016-01-01": 0.3},
+        }
+    )
+    assert reform_hash != get_reform_hash(
+        {
+            "taxes.income_tax_rate": {"2017": 0.3},
+            "benefits.basic_income": 700,
+            "benefits.housing_allowance": {"year:2017:1": 0.3},
+        }
+    )
+
+
+def test_reform_hash_of_reform_classes():
+    parameter_values = {"taxes.income_tax_rate": {"2016": 0.3}}
+
+    reform = Reform.from_dict(parameter_values, country_id="country_template")
+
+    assert reform.content_hash == get_reform_hash(parameter_values)
+    assert get_reform_hash((reform,)) == get_reform_hash((parameter_values,))
+
+    class neutralize_salary(Reform):
+        def apply(self):
+            self.neutralize_variable("salary")
+
+    assert neutralize_salary.content_hash is None
+    assert get_reform_hash((reform, neutralize_salary)) is None
+
+
+def test_cache_shares_systems_of_equivalent_reforms(tax_benefit_system):
+    cache = ReformedSystemCache(max_size=1)
+
+    system = cache.get(tax_benefit_system, {"taxes.income_tax_rate": {"2016": 0.3}})
+    same_system = cache.get(
+        tax_benefit_system, {"taxes.income_tax_rate": {"2016-01-01": 0.3}}
+    )
+    other_system = cache.get(
+        tax_benefit_system, {"taxes.income_tax_rate": {"2016": 0.4}}
+    )
+
+    assert system is not same_system
+    assert same_system.parameters("2016-01-01").taxes.income_tax_rate == 0.3
+    assert system.parameters("2016-01-01").taxes.income_tax_rate == 0.3
+    assert other_system.parameters("2016-01-01").taxes.income_tax_rate == 0.4
+    assert len(cache) == 1
+
+
+def test_cache_hands_out_clones(tax_benefit_system):
+    cache = ReformedSystemCache()
+    reform = {"taxes.income_tax_rate": {"2016": 0.3}}
+
+    system = cache.get(tax_benefit_system, reform)
+    system.parameters.taxes.income_tax_rate.update(period="year:2016:1", value=0.5)
+    system.neutralize_variable("income_tax")
+    same_system = cache.get(tax_benefit_system, reform)
+
+    assert same_system.parameters("2016-01-01").taxes.income_tax_rate == 0.3
+    assert not same_system.get_variable("income_tax").is_neutralized
+
+
+def test_cache_is_keyed_by_baseline(tax_benefit_system):
+    cache = ReformedSystemCache()
+    reform = {"taxes.income_tax_rate": {"2016": 0.3}}
+    other_baseline = CountryTaxBenefitSystem()
+
+    assert cache.get(tax_benefit_system, reform) is not cache.get(
+        other_baseline, reform
+    )
+    assert len(cache) == 2
+
+
+def test_simulations_share_reformed_systems():
+    situation = {"persons": {"person": {"salary": {"2022-01": 1000}}}}
+    reform = {"taxes.income_tax_rate": {"2022": 0.5}}
+
+    first = Simulation(situation=situation, reform=reform)
+    first.tax_benefit_system.neutralize_variable("income_tax")
+    second = Simulation(situation=situation, reform=dict(reform))
+
+    assert first.tax_benefit_system is not second.tax_benefit_system
+    assert second.tax_benefit_system.simulation is second
+    assert first.tax_benefit_system.simulation is first
+    for _, system in reformed_system_cache._systems.values():
+        assert "simulation" not in system.__dict__
+    assert second.calculate("income_tax", "2022-01")[0] == pytest.approx(500)
+    assert second.baseline.calculate("income_tax", "2022-01")[0] == pytest.approx(150)
@@ -0,0 +1,53 @@
+import json
+
+from policyengine_core.country_template import CountryTaxBenefitSystem
+from policyengine_core.country_template.constants import COUNTRY_DIR
+from policyengine_core.scripts import profile_startup
+from policyengine_core.scripts.policyengine_command import get_parser
+
+
+class ProfiledTaxBenefitSystem(CountryTaxBenefitSystem):
+    profile_startup = True
+
+
+def test_systems_are_not_profiled_by_default(tax_benefit_system):
+    assert tax_benefit_system.startup_profile is None
+
+
+def test_startup_profile_times_each_phase():
+    profile = ProfiledTaxBenefitSystem().startup_profile
+
+    assert list(profile.phases) == [
+        "variables",
+        "load_parameters",
+        "clone_baseline",
+        "homogenize",
+        "propagate_metadata",
+        "interpolate",
+        "uprate",
+        "abolitions",
+        "modelled_policies",
+    ]
+    assert all(duration >= 0 for duration in profile.phases.values())
+    assert profile.total == sum(profile.phases.values())
+    assert str(COUNTRY_DIR / "variables") in profile.details["variables"]
+    assert (
+        str(COUNTRY_DIR / "parameters" / "taxes" / "income_tax_rate.yaml")
+        in profile.details["load_parameters"]
+    )
+    assert profile.peak_memory > 0
+
+
+def test_profile_startup_command(capsys, monkeypatch):
+    monkeypatch.setattr(CountryTaxBenefitSystem, "profile_startup", False)
+    parser = get_parser()
+    monkeypatch.setattr(
+        "sys.argv",
+        ["policyengine-core", "profile-startup", "policyengine_core.country_template"],
+    )
+
+    assert profile_startup.main(parser) == 0
+
+    profile = json.loads(capsys.readouterr().out)
+    assert set(profile) == {"total", "phases", "details", "peak_memory"}
+    assert "uprate" in profile["phases"]
@@ -0,0 +1,34 @@
+from policyengine_core.simulations import SimulationBuilder
+
+
+def test_clone_shares_variables(tax_benefit_system):
+    clone = tax_benefit_system.clone()
+
+    assert clone.variables is not tax_benefit_system.variables
+    assert clone.get_variable("income_tax") is tax_benefit_system.get_variable(
+        "income_tax"
+    )
+
+
+def test_replacing_variables_of_clones(tax_benefit_system):
+    clone = tax_benefit_system.clone()
+    clone.neutralize_variable("income_tax")
+
+    assert clone.get_variable("income_tax").is_neutralized
+    assert not tax_benefit_system.get_variable("income_tax").is_neutralized
+    # Clones of clones keep replaced variables as they are.
+    assert clone.clone().get_variable("income_tax").is_neutralized
+
+
+def test_clone_entities_point_to_clone(tax_benefit_system):
+    clone = tax_benefit_system.clone()
+
+    assert clone.person_entity in clone.entities
+    assert all(entity in clone.entities for entity in clone.group_entities)
+    for entity, original in zip(clone.entities, tax_benefit_system.entities):
+        assert entity is not original
+        assert entity._tax_benefit_system is clone
+
+    situation = {"persons": {"person": {"salary": {"2017-01": 1000}}}}
+    simulation = SimulationBuilder().build_from_entities(clone, situation)
+    assert simulation.calculate("income_tax", "2017-01")[0] == 150
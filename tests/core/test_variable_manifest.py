@@ -0,0 +1,115 @@
+import json
+
+from policyengine_core.country_template import CountryTaxBenefitSystem
+from policyengine_core.country_template.reforms.add_new_tax import add_new_tax
+from policyengine_core.simulations import SimulationBuilder
+from policyengine_core.taxbenefitsystems import variable_manifest
+from policyengine_core.taxbenefitsystems.variable_manifest import (
+    VariableStub,
+    save_variable_manifest,
+)
+
+SITUATION = {
+    "persons": {"Alicia": {"salary": {"2017-01": 3_000}}},
+    "households": {"_": {"parents": ["Alicia"]}},
+}
+
+
+def make_lazy_system(tmp_path, manifest=None):
+    manifest_path = tmp_path / "variables.json"
+    if manifest is None:
+        save_variable_manifest(CountryTaxBenefitSystem(), manifest_path)
+    else:
+        manifest_path.write_text(json.dumps(manifest))
+
+    class LazyTaxBenefitSystem(CountryTaxBenefitSystem):
+        variable_manifest_path = manifest_path
+
+    return LazyTaxBenefitSystem()
+
+
+def test_variables_registered_from_manifest_without_imports(tmp_path):
+    eager = CountryTaxBenefitSystem()
+    lazy = make_lazy_system(tmp_path)
+
+    assert list(lazy.variables) == list(eager.variables)
+    assert not any(lazy.variables.is_loaded(name) for name in lazy.variables)
+    for name, variable in eager.variables.items():
+        stub = lazy.get_variable_metadata(name)
+        assert isinstance(stub, VariableStub)
+        assert stub.entity.key == variable.entity.key
+        assert stub.definition_period == variable.definition_period
+        assert stub.value_type == variable.value_type
+        assert stub.label == variable.label
+        assert stub.is_input_variable() == variable.is_input_variable()
+    assert not any(lazy.variables.is_loaded(name) for name in lazy.variables)
+
+
+def test_calculation_imports_only_needed_files(tmp_path):
+    lazy = make_lazy_system(tmp_path)
+    simulation = SimulationBuilder().build_from_dict(lazy, SITUATION)
+
+    income_tax = simulation.calculate("income_tax", "2017-01")
+
+    eager_simulation = SimulationBuilder().build_from_dict(
+        CountryTaxBenefitSystem(), SITUATION
+    )
+    assert (
+        income_tax.tolist()
+        == eager_simulation.calculate("income_tax", "2017-01").tolist()
+    )
+    assert simulation.input_variables == ["salary"]
+    loaded = [name for name in lazy.variables if lazy.variables.is_loaded(name)]
+    assert "income_tax" in loaded
+    assert "basic_income" not in loaded
+
+
+def test_stale_manifest_is_ignored(tmp_path):
+    eager = CountryTaxBenefitSystem()
+    manifest_path = tmp_path / "manifest.json"
+    save_variable_manifest(eager, manifest_path)
+    manifest = json.loads(manifest_path.read_text())
+    manifest["fingerprint"] = "outdated"
+    manifest["stat_key"] = "outdated"
+
+    lazy = make_lazy_system(tmp_path, manifest)
+
+    assert all(lazy.variables.is_loaded(name) for name in lazy.variables)
+
+
+def test_files_only_hashed_if_their_stats_changed(tmp_path, monkeypatch):
+    manifest_path = tmp_path / "variables.json"
+    save_variable_manifest(CountryTaxBenefitSystem(), manifest_path)
+    manifest = json.loads(manifest_path.read_text())
+    manifest["stat_key"] = "touched"
+    make_lazy_system(tmp_path, manifest)
+
+    # The files were hashed and matched, so the manifest was updated.
+    assert json.loads(manifest_path.read_text())["stat_key"] != "touched"
+
+    def get_variables_fingerprint(variables_dir):
+        raise AssertionError("The variable files were hashed.")
+
+    monkeypatch.setattr(
+        variable_manifest, "get_variables_fingerprint", get_variables_fingerprint
+    )
+
+    class LazyTaxBenefitSystem(CountryTaxBenefitSystem):
+        variable_manifest_path = manifest_path
+
+    lazy = LazyTaxBenefitSystem()
+
+    assert not any(lazy.variables.is_loaded(name) for name in lazy.variables)
+
+
+def test_reforms_and_clones_of_lazy_systems(tmp_path):
+    lazy = make_lazy_system(tmp_path)
+
+    reformed = add_new_tax(lazy)
+    clone = lazy.clone()
+
+    assert reformed.get_variable("new_tax") is not None
+    assert not lazy.variables.is_loaded("income_tax")
+    assert reformed.get_variable("income_tax") is lazy.get_variable("income_tax")
+    assert clone.get_variable("income_tax") is lazy.get_variable("income_tax")
+    assert clone.get_variable("income_tax").name == "income_tax"
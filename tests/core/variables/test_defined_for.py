@@ -96,4 +96,52 @@ def test_defined_for_with_deps():
     assert all(simulation.calculate("income", 2022) == np.array([0.5, 0]))
 
 
+def test_defined_for_enum():
+    """Enum variables take their default value outside of the defined-for condition."""
+    Person = Entity("person", "people", "Person", "A person")
+    system = TaxBenefitSystem([Person])
+
+    class Region(Enum):
+        NONE = "None"
+        NORTH = "North"
+        SOUTH = "South"
+
+    class in_england(Variable):
+        value_type = bool
+        entity = Person
+        definition_period = ETERNITY
+        label = "In England"
+
+    class region(Variable):
+        value_type = Enum
+        possible_values = Region
+        default_value = Region.NONE
+        entity = Person
+        definition_period = ETERNITY
+        label = "Region"
+        defined_for = "in_england"
+
+        def formula(person, period, parameters):
+            return np.array([Region.SOUTH, Region.NORTH, Region.SOUTH])
+
+    system.add_variables(in_england, region)
+
+    simulation = SimulationBuilder().build_from_dict(
+        system,
+        {
+            "people": {
+                "first_person": {"in_england": {2022: True}},
+                "second_person": {"in_england": {2022: False}},
+                "third_person": {"in_england": {2022: True}},
+            },
+        },
+    )
+
+    assert list(simulation.calculate("region", 2022).decode_to_str()) == [
+        "SOUTH",
+        "NONE",
+        "SOUTH",
+    ]
+
+
 test_defined_for_with_deps()